@@ -0,0 +1,17 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: __init__.py
+# Project: benchmarks
+# Author: Brian Cherinka
+# Created: Friday, 16th October 2026 5:02:11 pm
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Friday, 16th October 2026 5:02:11 pm
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+
+# Benchmarks of the fuzzy types.  Run the suite from the top-level repo directory with
+# python -m benchmarks --help
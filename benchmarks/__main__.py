@@ -0,0 +1,70 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: __main__.py
+# Project: benchmarks
+# Author: Brian Cherinka
+# Created: Friday, 16th October 2026 5:02:11 pm
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Friday, 16th October 2026 5:02:11 pm
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+import argparse
+import json
+import sys
+
+from benchmarks.suite import SIZES, TYPES, compare, run
+from benchmarks.vocab import VOCABULARIES
+
+
+# Runs the benchmark suite and writes the results as JSON, e.g.
+#   python -m benchmarks --sizes 10 1000 100000 --output release-0.1.4.json
+#   python -m benchmarks --sizes 10 1000 100000 --compare release-0.1.3.json
+
+
+def parse_args(args: list = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks',
+                                     description='Benchmarks the fuzzy types.')
+    parser.add_argument('--types', nargs='+', choices=list(TYPES), default=list(TYPES),
+                        help='the fuzzy types to benchmark')
+    parser.add_argument('--vocabularies', nargs='+', choices=list(VOCABULARIES),
+                        default=list(VOCABULARIES), help='the vocabularies to use')
+    parser.add_argument('--sizes', nargs='+', type=int, default=list(SIZES),
+                        help='the vocabulary sizes')
+    parser.add_argument('--queries', type=int, default=50,
+                        help='the number of queries per lookup case')
+    parser.add_argument('--seed', type=int, default=42, help='the random seed')
+    parser.add_argument('--output', help='the JSON file to write; default is stdout')
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help='a JSON file of previous results to compare with')
+    return parser.parse_args(args)
+
+
+def main(args: list = None) -> None:
+    args = parse_args(args)
+    results = run(types=args.types, vocabularies=args.vocabularies, sizes=args.sizes,
+                  queries=args.queries, seed=args.seed,
+                  log=lambda message: print(message, file=sys.stderr))
+
+    if args.output:
+        with open(args.output, 'w') as fp:
+            json.dump(results, fp, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare) as fp:
+            baseline = json.load(fp)
+        print(f'{"type":>16} {"vocabulary":>10} {"size":>8} {"measure":>16} {"old":>12} '
+              f'{"new":>12} {"ratio":>6}', file=sys.stderr)
+        for row in compare(baseline, results):
+            print('{:>16} {:>10} {:>8} {:>16} {:>12.4g} {:>12.4g} {:>6.2f}'.format(*row),
+                  file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: bench_aio.py
+# Project: benchmarks
+# Author: Brian Cherinka
+# Created: Friday, 16th October 2026 10:31:08 pm
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Friday, 16th October 2026 10:31:08 pm
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+import asyncio
+import random
+import statistics
+import time
+
+from fuzzy_types.fuzzy import FuzzyDict
+
+from benchmarks.vocab import make_typo, synthetic_words
+
+
+# Measures the event loop latency while concurrent lookups run, with blocking lookups in the
+# loop and with aget, which scores them in a thread pool.  Run with
+#   python -m benchmarks.bench_aio
+
+
+async def heartbeat(lags: list, done: asyncio.Event, period: float = 0.001) -> None:
+    """ Records how late the event loop wakes up from sleeps of a period """
+    while not done.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(period)
+        lags.append((time.perf_counter() - start - period) * 1e3)
+
+
+async def load(fuzzy: FuzzyDict, values: list, use_async: bool) -> dict:
+    """ Runs one lookup task per value, and returns the loop lag and total time """
+
+    async def lookup(value):
+        if use_async:
+            return await fuzzy.aget_many([value], errors='none')
+        return fuzzy.get_many([value], errors='none')
+
+    lags = []
+    done = asyncio.Event()
+    beat = asyncio.ensure_future(heartbeat(lags, done))
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    await asyncio.gather(*[lookup(value) for value in values])
+    elapsed = time.perf_counter() - start
+    done.set()
+    await beat
+    lags.sort()
+    return {'total_ms': elapsed * 1e3, 'median_lag_ms': statistics.median(lags),
+            'p99_lag_ms': lags[min(int(len(lags) * 0.99), len(lags) - 1)],
+            'max_lag_ms': lags[-1]}
+
+
+def main(queries: int = 100, seed: int = 42):
+    print(f'{"size":>7} {"mode":>6} {"total":>10} {"median lag":>11} {"p99 lag":>10} '
+          f'{"max lag":>10}')
+    for size in (1000, 10000, 100000):
+        words = synthetic_words(size, seed=seed)
+        fuzzy = FuzzyDict(dict.fromkeys(words, 1))
+        rng = random.Random(seed)
+        values = [make_typo(word, rng) for word in rng.choices(words, k=queries)]
+        for use_async in (False, True):
+            result = asyncio.run(load(fuzzy, values, use_async))
+            print(f'{size:>7} {"aget" if use_async else "sync":>6} {result["total_ms"]:>8.1f}ms '
+                  f'{result["median_lag_ms"]:>9.2f}ms {result["p99_lag_ms"]:>8.2f}ms '
+                  f'{result["max_lag_ms"]:>8.2f}ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: bench_best_fuzzy.py
+# Project: benchmarks
+# Author: Brian Cherinka
+# Created: Friday, 16th October 2026 11:02:37 am
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Friday, 16th October 2026 11:02:37 am
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+import timeit
+
+from rapidfuzz import fuzz, process
+from fuzzy_types.utils import get_best_two
+
+from benchmarks.vocab import synthetic_words
+
+
+# Compares the bounded best-two search used by get_best_fuzzy against the previous
+# unbounded rapidfuzz.process.extract call.  Run with python -m benchmarks.bench_best_fuzzy
+
+
+def time_it(func, number: int = 5, repeat: int = 5) -> float:
+    """ Returns the best time per call in milliseconds """
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e3
+
+
+def main():
+    print(f'{"size":>7} {"scorer":>8} {"query":>6} {"extract":>10} {"best_two":>10} '
+          f'{"speedup":>8}')
+    for size in (1000, 10000, 100000):
+        choices = synthetic_words(size)
+        queries = {'exact': choices[size // 3], 'typo': choices[size // 2][:-1] + 'x'}
+        for scorer in (fuzz.WRatio, fuzz.ratio):
+            for kind, query in queries.items():
+                old = time_it(lambda: process.extract(query, choices, scorer=scorer,
+                                                      score_cutoff=75, limit=None))
+                new = time_it(lambda: get_best_two(query, choices, scorer=scorer,
+                                                   score_cutoff=75))
+                print(f'{size:>7} {scorer.__name__:>8} {kind:>6} {old:>8.3f}ms '
+                      f'{new:>8.3f}ms {old / new:>7.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: bench_cascade.py
+# Project: benchmarks
+# Author: Brian Cherinka
+# Created: Friday, 16th October 2026 9:18:03 pm
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Friday, 16th October 2026 9:18:03 pm
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+import random
+import time
+
+from fuzzy_types.matcher import Matcher
+
+from benchmarks.vocab import VOCABULARIES, make_typo
+
+
+# Compares the single-stage WRatio search with the ratio shortlist and WRatio rerank cascade,
+# timing single lookups and counting how often both return the same match.  Run with
+#   python -m benchmarks.bench_cascade
+
+
+def outcomes(matcher: Matcher, values: list, words: list) -> tuple:
+    """ Returns the match or error type of each value, and the mean time per lookup in ms """
+    results = []
+    start = time.perf_counter()
+    for value in values:
+        try:
+            results.append(matcher(value, words, return_score=True))
+        except ValueError as error:
+            results.append(type(error))
+    return results, (time.perf_counter() - start) / len(values) * 1e3
+
+
+def main(queries: int = 100, seed: int = 42):
+    print(f'{"vocab":>10} {"size":>7} {"shortlist":>9} {"single":>10} {"cascade":>10} '
+          f'{"speedup":>8} {"agree":>6}')
+    for vocabulary, make_words in VOCABULARIES.items():
+        for size in (1000, 10000, 100000):
+            words = make_words(size, seed=seed)
+            rng = random.Random(seed)
+            values = [make_typo(word, rng) for word in rng.choices(words, k=queries)]
+            single, single_ms = outcomes(Matcher(), values, words)
+            for shortlist in (20, 100, 500):
+                cascade, cascade_ms = outcomes(Matcher(shortlist=shortlist), values, words)
+                agree = sum(old == new for old, new in zip(single, cascade)) / queries
+                print(f'{vocabulary:>10} {size:>7} {shortlist:>9} {single_ms:>8.3f}ms '
+                      f'{cascade_ms:>8.3f}ms {single_ms / cascade_ms:>7.2f}x {agree:>6.1%}')
+
+            # the batch path, scoring the shortlist with cdist
+            start = time.perf_counter()
+            Matcher().many(values, words, errors='none')
+            many_ms = (time.perf_counter() - start) / queries * 1e3
+            start = time.perf_counter()
+            Matcher(shortlist=100).many(values, words, errors='none')
+            cascade_ms = (time.perf_counter() - start) / queries * 1e3
+            print(f'{vocabulary:>10} {size:>7} {"many/100":>9} {many_ms:>8.3f}ms '
+                  f'{cascade_ms:>8.3f}ms {many_ms / cascade_ms:>7.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: bench_cluster.py
+# Project: benchmarks
+# Author: Brian Cherinka
+# Created: Saturday, 17th October 2026 2:08:31 am
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Saturday, 17th October 2026 2:08:31 am
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+import argparse
+import random
+import time
+
+from rapidfuzz import fuzz
+
+from fuzzy_types.cluster import find_near_duplicates
+
+from benchmarks.vocab import make_typo, synthetic_words
+
+
+# Measures the time to find the near-duplicate pairs of a vocabulary with 1% of typo variants,
+# with n-gram blocking, and, up to --exhaustive-max words, by scoring all pairs, along with the
+# recall of the blocking.  Run with
+#   python -m benchmarks.bench_cluster --sizes 10000 100000 1000000
+
+
+def main(args: list = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.bench_cluster',
+                                     description='Benchmarks finding near-duplicate keys.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000],
+                        help='the numbers of words')
+    parser.add_argument('--scorers', nargs='+', default=['ratio', 'WRatio'],
+                        help='the rapidfuzz.fuzz scorers')
+    parser.add_argument('--threshold', type=float, default=90, help='the minimum score')
+    parser.add_argument('--exhaustive-max', type=int, default=10000,
+                        help='the largest size to also score all pairs of')
+    parser.add_argument('--workers', type=int, default=-1, help='the number of threads')
+    parser.add_argument('--seed', type=int, default=42, help='the random seed')
+    args = parser.parse_args(args)
+
+    print(f'{"size":>8} {"scorer":>8} {"pairs":>8} {"blocked":>10} {"exhaustive":>11} '
+          f'{"recall":>7}')
+    for size in args.sizes:
+        words = synthetic_words(size, seed=args.seed)
+        rng = random.Random(args.seed)
+        words += [make_typo(word, rng) for word in rng.sample(words, size // 100)]
+        for name in args.scorers:
+            options = {'threshold': args.threshold, 'scorer': getattr(fuzz, name),
+                       'workers': args.workers}
+            start = time.perf_counter()
+            blocked = set(find_near_duplicates(words, exhaustive=False, **options))
+            blocked_s = time.perf_counter() - start
+
+            exhaustive, recall = '-', '-'
+            if size <= args.exhaustive_max:
+                start = time.perf_counter()
+                found = set(find_near_duplicates(words, exhaustive=True, **options))
+                exhaustive = f'{time.perf_counter() - start:.2f}s'
+                recall = f'{len(blocked & found) / len(found) if found else 1.0:.3f}'
+            print(f'{size:>8} {name:>8} {len(blocked):>8} {blocked_s:>9.2f}s '
+                  f'{exhaustive:>11} {recall:>7}')
+
+
+if __name__ == '__main__':
+    main()
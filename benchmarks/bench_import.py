@@ -0,0 +1,116 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: bench_import.py
+# Project: benchmarks
+# Author: Brian Cherinka
+# Created: Friday, 16th October 2026 7:20:05 pm
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Friday, 16th October 2026 7:20:05 pm
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+
+# Measures the time to import fuzzy_types with python -X importtime, in fresh interpreters,
+# and checks which heavy dependencies are loaded by the import alone.  Run with
+#   python -m benchmarks.bench_import --repeat 10 --output import.json
+
+# dependencies only needed once fuzzy matching or reading the config
+HEAVY = ('rapidfuzz', 'numpy', 'yaml', 'six', 'inspect')
+
+
+def import_times(module: str = 'fuzzy_types') -> dict:
+    """ Returns the import times of a module and its imports, in a fresh interpreter
+
+    Parameters
+    ----------
+    module : str
+        The module to import
+
+    Returns
+    -------
+    dict
+        The cumulative import time in microseconds of each imported module
+    """
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                          stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        __, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def loaded_modules(module: str = 'fuzzy_types') -> list:
+    """ Returns the modules loaded by importing a module, in a fresh interpreter """
+    code = f'import sys, json; import {module}; print(json.dumps(sorted(sys.modules)))'
+    proc = subprocess.run([sys.executable, '-c', code], stdout=subprocess.PIPE,
+                          universal_newlines=True, check=True)
+    return json.loads(proc.stdout)
+
+
+def run(repeat: int = 10, module: str = 'fuzzy_types') -> dict:
+    """ Benchmarks the import of a module
+
+    Parameters
+    ----------
+    repeat : int
+        The number of fresh interpreters to time the import in
+    module : str
+        The module to import
+
+    Returns
+    -------
+    dict
+        The median and minimum cumulative import time in microseconds, the
+        median time of the slowest imported modules, and the heavy dependencies
+        loaded by the import
+    """
+    runs = [import_times(module) for __ in range(repeat)]
+    totals = [times[module] for times in runs]
+    names = set.intersection(*(set(times) for times in runs))
+    medians = {name: statistics.median(times[name] for times in runs) for name in names}
+    slowest = sorted(medians.items(), key=lambda item: item[1], reverse=True)[1:11]
+    modules = loaded_modules(module)
+    heavy = [name for name in HEAVY if name in modules]
+    return {'module': module, 'python': sys.version.split()[0], 'repeat': repeat,
+            'median_us': statistics.median(totals), 'min_us': min(totals),
+            'slowest_us': dict(slowest), 'heavy_modules': heavy}
+
+
+def main(args: list = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.bench_import',
+                                     description='Benchmarks the import of fuzzy_types.')
+    parser.add_argument('--repeat', type=int, default=10,
+                        help='the number of fresh interpreters to time the import in')
+    parser.add_argument('--output', help='the JSON file to write; default is stdout')
+    parser.add_argument('--max-us', type=int,
+                        help='exit with an error if the median import time is slower')
+    args = parser.parse_args(args)
+
+    results = run(repeat=args.repeat)
+    if args.output:
+        with open(args.output, 'w') as fp:
+            json.dump(results, fp, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+    if results['heavy_modules']:
+        sys.exit(f'import fuzzy_types loads {", ".join(results["heavy_modules"])}')
+    if args.max_us and results['median_us'] > args.max_us:
+        sys.exit(f'import fuzzy_types took {results["median_us"]}us, '
+                 f'more than {args.max_us}us')
+
+
+if __name__ == '__main__':
+    main()
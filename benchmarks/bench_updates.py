@@ -0,0 +1,92 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: bench_updates.py
+# Project: benchmarks
+# Author: Brian Cherinka
+# Created: Friday, 16th October 2026 11:42:17 pm
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Friday, 16th October 2026 11:42:17 pm
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+import argparse
+import random
+import statistics
+import time
+
+from fuzzy_types.fuzzy import FuzzyDict
+
+from benchmarks.vocab import make_typo, synthetic_words
+
+
+# Measures the sustained throughput of a mixed workload of 99% lookups and 1% inserts or
+# deletes, with the choices index updated in place, and rebuilt after every write.  Half the
+# lookups are exact, half are typos matched against an n-gram shortlist.  Run with
+#   python -m benchmarks.bench_updates --sizes 10000 100000 1000000
+
+
+def workload(fuzzy: FuzzyDict, words: list, spare: list, ops: int, writes: float,
+             seed: int) -> dict:
+    """ Runs a mixed workload, and returns the throughput and read and write latencies """
+    rng = random.Random(seed)
+    keys = list(fuzzy)
+    reads, updates = [], []
+    start = time.perf_counter()
+    for __ in range(ops):
+        if rng.random() < writes:
+            tick = time.perf_counter()
+            if spare and rng.random() < 0.5:
+                key = spare.pop()
+                fuzzy[key] = 0
+                keys.append(key)
+            else:
+                key = keys.pop(rng.randrange(len(keys)))
+                del fuzzy[key]
+            updates.append(time.perf_counter() - tick)
+            continue
+
+        word = rng.choice(keys)
+        value = word if rng.random() < 0.5 else make_typo(word, rng)
+        tick = time.perf_counter()
+        try:
+            fuzzy[value]
+        except ValueError:
+            pass
+        reads.append(time.perf_counter() - tick)
+
+    elapsed = time.perf_counter() - start
+    return {'ops_per_s': ops / elapsed, 'read_ms': statistics.median(reads) * 1e3,
+            'read_max_ms': max(reads) * 1e3,
+            'write_ms': statistics.median(updates) * 1e3 if updates else 0.0}
+
+
+def main(args: list = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.bench_updates',
+                                     description='Benchmarks lookups mixed with inserts '
+                                                 'and deletes.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000],
+                        help='the numbers of keys')
+    parser.add_argument('--ops', type=int, default=5000, help='the number of operations')
+    parser.add_argument('--writes', type=float, default=0.01,
+                        help='the fraction of operations inserting or deleting a key')
+    parser.add_argument('--seed', type=int, default=42, help='the random seed')
+    args = parser.parse_args(args)
+
+    print(f'{"size":>8} {"mode":>12} {"ops/s":>9} {"read":>9} {"read max":>10} {"write":>9}')
+    for size in args.sizes:
+        words = synthetic_words(size + args.ops, seed=args.seed)
+        for mode in ('incremental', 'rebuild'):
+            fuzzy = FuzzyDict(dict.fromkeys(words[:size], 0), ngram_candidates=50)
+            fuzzy._incremental = mode == 'incremental'
+            fuzzy.get_many([words[0], 'warm up'], errors='none')
+            result = workload(fuzzy, words, words[size:], args.ops, args.writes, args.seed)
+            print(f'{size:>8} {mode:>12} {result["ops_per_s"]:>9.0f} '
+                  f'{result["read_ms"]:>7.3f}ms {result["read_max_ms"]:>8.1f}ms '
+                  f'{result["write_ms"]:>7.3f}ms')
+
+
+if __name__ == '__main__':
+    main()
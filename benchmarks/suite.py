@@ -0,0 +1,269 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: suite.py
+# Project: benchmarks
+# Author: Brian Cherinka
+# Created: Friday, 16th October 2026 5:02:11 pm
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Friday, 16th October 2026 5:02:11 pm
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+import datetime
+import gc
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable, Iterable
+
+import fuzzy_types
+from fuzzy_types.fuzzy import FuzzyDict, FuzzyList, FuzzyOrderedDict, FuzzyStr
+
+from benchmarks.vocab import VOCABULARIES, make_misses, make_typo
+
+
+SIZES = (10, 100, 1000, 10000, 100000, 1000000)
+TYPES = {'FuzzyDict': FuzzyDict, 'FuzzyOrderedDict': FuzzyOrderedDict,
+         'FuzzyList': FuzzyList, 'FuzzyStr': FuzzyStr}
+SCHEMA = 1
+
+
+def latency(func: Callable, values: Iterable) -> dict:
+    """ Times a function called once per value
+
+    Calls raising a ValueError, i.e. failed fuzzy matches, are timed as well and
+    counted as errors.
+
+    Parameters
+    ----------
+    func : Callable
+        The function to time
+    values : Iterable
+        The values to call the function with
+
+    Returns
+    -------
+    dict
+        The number of calls and errors, and the mean, median, p95 and maximum
+        time per call in microseconds
+    """
+    times = []
+    errors = 0
+    for value in values:
+        start = time.perf_counter()
+        try:
+            func(value)
+        except ValueError:
+            errors += 1
+        times.append((time.perf_counter() - start) * 1e6)
+
+    times.sort()
+    return {'calls': len(times), 'errors': errors, 'mean_us': statistics.mean(times),
+            'median_us': statistics.median(times),
+            'p95_us': times[min(int(len(times) * 0.95), len(times) - 1)], 'max_us': times[-1]}
+
+
+def elapsed(func: Callable) -> float:
+    """ Returns the time in seconds of one call """
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def peak_memory(func: Callable) -> int:
+    """ Returns the peak memory in bytes allocated by Python during one call """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        __, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak
+
+
+def make_data(name: str, words: list):
+    """ Returns the input data of a fuzzy type for a vocabulary """
+    if name == 'FuzzyList':
+        return list(words)
+    return {word: i for i, word in enumerate(words)}
+
+
+def bench_container(name: str, words: list, queries: int, seed: int) -> dict:
+    """ Benchmarks a fuzzy list or dictionary of a vocabulary
+
+    Construction is timed separately from building the choices index, which
+    happens lazily on the first lookup.
+
+    Parameters
+    ----------
+    name : str
+        The name of the fuzzy type
+    words : list
+        The vocabulary, used as list items or dictionary keys
+    queries : int
+        The number of queries per lookup case
+    seed : int
+        The random seed
+
+    Returns
+    -------
+    dict
+        The benchmark results
+    """
+    kls = TYPES[name]
+    data = make_data(name, words)
+    rng = random.Random(seed)
+    hits = rng.choices(words, k=queries)
+    typos = [make_typo(word, rng) for word in rng.choices(words, k=queries)]
+    misses = make_misses(queries, seed=seed)
+
+    def build():
+        fuzzy = kls(data)
+        fuzzy._choice_index
+        return fuzzy
+
+    construction = elapsed(lambda: kls(data))
+    fuzzy = kls(data)
+    index = elapsed(lambda: fuzzy._choice_index)
+    memory = peak_memory(build)
+
+    return {'construction_s': construction, 'index_s': index, 'peak_memory_bytes': memory,
+            'exact': latency(fuzzy.__getitem__, hits),
+            'fuzzy': latency(fuzzy.__getitem__, typos),
+            'miss': latency(fuzzy.__getitem__, misses),
+            'contains': latency(fuzzy.__contains__, hits[:queries // 2] + typos[queries // 2:]),
+            'dir_s': elapsed(lambda: dir(fuzzy)),
+            'copy_s': elapsed(fuzzy.copy)}
+
+
+def bench_str(words: list, queries: int, seed: int) -> dict:
+    """ Benchmarks fuzzy strings of a vocabulary
+
+    Each fuzzy string is compared with a single other string, so the lookup
+    latencies do not depend on the vocabulary size.  The construction time and
+    memory are those of making every word of the vocabulary fuzzy.
+
+    Parameters
+    ----------
+    words : list
+        The vocabulary
+    queries : int
+        The number of comparisons per case
+    seed : int
+        The random seed
+
+    Returns
+    -------
+    dict
+        The benchmark results
+    """
+    rng = random.Random(seed)
+    strings = [FuzzyStr(word) for word in rng.choices(words, k=queries)]
+    typos = [make_typo(str(string), rng) for string in strings]
+    misses = make_misses(queries, seed=seed)
+
+    def timed(values):
+        return latency(lambda pair: pair[0] == pair[1], list(zip(strings, values)))
+
+    return {'construction_s': elapsed(lambda: [FuzzyStr(word) for word in words]),
+            'index_s': None,
+            'peak_memory_bytes': peak_memory(lambda: [FuzzyStr(word) for word in words]),
+            'exact': timed([str(string) for string in strings]),
+            'fuzzy': timed(typos),
+            'miss': timed(misses),
+            'contains': None, 'dir_s': None, 'copy_s': None}
+
+
+def run(types: Iterable = tuple(TYPES), vocabularies: Iterable = tuple(VOCABULARIES),
+        sizes: Iterable = SIZES, queries: int = 50, seed: int = 42,
+        log: Callable = None) -> dict:
+    """ Runs the benchmark suite
+
+    Parameters
+    ----------
+    types : Iterable
+        The names of the fuzzy types to benchmark
+    vocabularies : Iterable
+        The names of the vocabularies to use, from `benchmarks.vocab.VOCABULARIES`
+    sizes : Iterable
+        The vocabulary sizes
+    queries : int
+        The number of queries per lookup case
+    seed : int
+        The random seed of the vocabularies and queries
+    log : Callable
+        An optional function called with a progress message before each case
+
+    Returns
+    -------
+    dict
+        The JSON-serializable results, with the environment under ``meta`` and
+        one entry per type, vocabulary and size under ``results``
+    """
+    import numpy
+    import rapidfuzz
+
+    meta = {'schema': SCHEMA, 'fuzzy_types': fuzzy_types.__version__,
+            'rapidfuzz': rapidfuzz.__version__, 'numpy': numpy.__version__,
+            'python': platform.python_version(), 'implementation': sys.implementation.name,
+            'platform': platform.platform(), 'machine': platform.machine(),
+            'date': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+            'seed': seed, 'queries': queries}
+
+    results = []
+    for vocabulary in vocabularies:
+        for size in sizes:
+            words = VOCABULARIES[vocabulary](size, seed=seed)
+            for name in types:
+                if log:
+                    log(f'{name} {vocabulary} {size}')
+                if name == 'FuzzyStr':
+                    result = bench_str(words, queries, seed)
+                else:
+                    result = bench_container(name, words, queries, seed)
+                results.append({'type': name, 'vocabulary': vocabulary, 'size': size, **result})
+                gc.collect()
+
+    return {'meta': meta, 'results': results}
+
+
+def compare(old: dict, new: dict, metric: str = 'median_us') -> list:
+    """ Compares two benchmark results, e.g. of two releases
+
+    Parameters
+    ----------
+    old : dict
+        The baseline results returned by `run`
+    new : dict
+        The new results returned by `run`
+    metric : str
+        The latency statistic to compare.  Default is the median.
+
+    Returns
+    -------
+    list
+        A tuple of (type, vocabulary, size, measurement, old, new, ratio) for each
+        measurement in both results, where the ratio is new over old
+    """
+    baseline = {(item['type'], item['vocabulary'], item['size']): item for item in old['results']}
+    rows = []
+    for item in new['results']:
+        key = (item['type'], item['vocabulary'], item['size'])
+        if key not in baseline:
+            continue
+        for measure, value in item.items():
+            before = baseline[key].get(measure)
+            if isinstance(value, dict):
+                value, before = value[metric], (before or {}).get(metric)
+            if not isinstance(value, (int, float)) or measure == 'size' or not before:
+                continue
+            rows.append(key + (measure, before, value, value / before))
+    return rows
@@ -0,0 +1,153 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: vocab.py
+# Project: benchmarks
+# Author: Brian Cherinka
+# Created: Friday, 16th October 2026 5:02:11 pm
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Friday, 16th October 2026 5:02:11 pm
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+import random
+import string
+
+
+# Offline vocabularies for the benchmarks.  All generators are deterministic for a given seed.
+
+ADJECTIVES = ['active', 'amber', 'ancient', 'azure', 'bold', 'brave', 'bright', 'calm',
+              'clever', 'cold', 'crimson', 'dark', 'deep', 'eager', 'early', 'faint', 'fast',
+              'fierce', 'gentle', 'golden', 'grand', 'green', 'hidden', 'hollow', 'humble',
+              'icy', 'inner', 'jolly', 'late', 'lively', 'lone', 'lucky', 'mellow', 'misty',
+              'noble', 'north', 'odd', 'outer', 'pale', 'plain', 'proud', 'quiet', 'rapid',
+              'red', 'royal', 'rustic', 'silent', 'silver', 'slow', 'solar', 'south', 'steady',
+              'stellar', 'swift', 'tidy', 'upper', 'vast', 'velvet', 'warm', 'wild']
+
+NOUNS = ['anchor', 'apple', 'arrow', 'badge', 'banner', 'basket', 'beacon', 'bridge', 'cabin',
+         'candle', 'canyon', 'castle', 'cedar', 'comet', 'compass', 'crystal', 'delta', 'desert',
+         'engine', 'falcon', 'feather', 'forest', 'fountain', 'galaxy', 'garden', 'glacier',
+         'harbor', 'hammer', 'island', 'jacket', 'kettle', 'lantern', 'ledger', 'magnet',
+         'meadow', 'mirror', 'nebula', 'orbit', 'orchard', 'paddle', 'pebble', 'pepper',
+         'planet', 'prism', 'quartz', 'quill', 'radar', 'ribbon', 'river', 'rocket', 'saddle',
+         'signal', 'spiral', 'summit', 'tablet', 'thunder', 'timber', 'tower', 'tunnel',
+         'valley', 'vessel', 'violin', 'voyage', 'wagon', 'willow', 'window', 'wizard', 'yarrow',
+         'zenith', 'zephyr']
+
+SEPARATORS = ['_', ' ', '-']
+
+
+def synthetic_words(size: int, seed: int = 42) -> list:
+    """ Returns unique random lowercase words of 4 to 12 letters
+
+    Parameters
+    ----------
+    size : int
+        The number of words
+    seed : int
+        The random seed
+
+    Returns
+    -------
+    list
+        The sorted list of words
+    """
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < size:
+        words.add(''.join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 12))))
+    return sorted(words)
+
+
+def realistic_words(size: int, seed: int = 42) -> list:
+    """ Returns unique identifiers resembling column, product or setting names
+
+    The names are built from a small dictionary of english words, so unlike
+    `synthetic_words` many of them share long substrings, e.g. ``silver_comet``
+    and ``silver-comet-17``, which makes fuzzy matching harder.
+
+    Parameters
+    ----------
+    size : int
+        The number of names
+    seed : int
+        The random seed
+
+    Returns
+    -------
+    list
+        The list of names, in random order
+    """
+    rng = random.Random(seed)
+    names = set()
+    pairs = len(ADJECTIVES) * len(NOUNS)
+    while len(names) < size:
+        parts = [rng.choice(ADJECTIVES), rng.choice(NOUNS)]
+        # only number the names once most word pairs are taken
+        if len(names) > pairs // 2:
+            parts.append(str(rng.randint(1, max(size // pairs, 1) * 10)))
+        names.add(rng.choice(SEPARATORS).join(parts))
+    names = sorted(names)
+    rng.shuffle(names)
+    return names
+
+
+def make_typo(word: str, rng: random.Random) -> str:
+    """ Returns a copy of a word with one random edit
+
+    The edit is a deleted, inserted, substituted or swapped character.  Words
+    of fewer than 5 characters are not shortened, so the typo remains a valid
+    fuzzy search value.
+
+    Parameters
+    ----------
+    word : str
+        The word to misspell
+    rng : random.Random
+        The random number generator
+
+    Returns
+    -------
+    str
+        The misspelled word
+    """
+    while True:
+        i = rng.randrange(len(word))
+        letter = rng.choice(string.ascii_lowercase)
+        edit = rng.choice(['insert', 'substitute', 'swap'] + (['delete'] if len(word) > 4 else []))
+        if edit == 'delete':
+            typo = word[:i] + word[i + 1:]
+        elif edit == 'insert':
+            typo = word[:i] + letter + word[i:]
+        elif edit == 'substitute':
+            typo = word[:i] + letter + word[i + 1:]
+        else:
+            i = min(i, len(word) - 2)
+            typo = word[:i] + word[i + 1] + word[i] + word[i + 2:]
+        if typo != word:
+            return typo
+
+
+def make_misses(count: int, seed: int = 42) -> list:
+    """ Returns random strings of punctuation that match no vocabulary word
+
+    Parameters
+    ----------
+    count : int
+        The number of strings
+    seed : int
+        The random seed
+
+    Returns
+    -------
+    list
+        The list of strings
+    """
+    rng = random.Random(seed)
+    return [''.join(rng.choices('!#$%&()*+,./:;<=>?@[]^{|}~', k=rng.randint(6, 10)))
+            for __ in range(count)]
+
+
+VOCABULARIES = {'synthetic': synthetic_words, 'realistic': realistic_words}
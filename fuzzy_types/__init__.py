@@ -13,11 +13,15 @@
 
 from __future__ import print_function, division, absolute_import
 
-from fuzzy_types.configuration import get_config
+import os
+
+from fuzzy_types.configuration import LazyConfig, get_config
 
 NAME = 'fuzzy_types'
 
-config = get_config(NAME)
+# the configuration is read on first access, to keep the import fast
+config = LazyConfig(lambda: get_config(NAME, config_file=os.path.join(
+    os.path.dirname(__file__), 'etc', f'{NAME}.yml')))
 
 __version__ = '0.1.4-alpha'
 
@@ -0,0 +1,218 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: aio.py
+# Project: fuzzy_types
+# Author: Brian Cherinka
+# Created: Friday, 16th October 2026 10:31:08 pm
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Friday, 16th October 2026 10:31:08 pm
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+import asyncio
+import concurrent.futures
+import threading
+from typing import TYPE_CHECKING, Union
+
+from fuzzy_types import config
+from fuzzy_types.utils import Match
+
+if TYPE_CHECKING:
+    from fuzzy_types.index import ChoiceIndex
+
+__all__ = ['Batcher', 'get_executor', 'set_executor']
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> concurrent.futures.Executor:
+    """ Returns the executor running the fuzzy scoring of async lookups
+
+    By default, a thread pool with the ``fuzzy_async_workers`` config number of
+    threads, created on first use.  ``rapidfuzz`` releases the GIL while scoring,
+    so threads do not block the event loop.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=config.get('fuzzy_async_workers') or None,
+                thread_name_prefix='fuzzy_types')
+        return _executor
+
+
+def set_executor(executor: Union[concurrent.futures.Executor, None]) -> None:
+    """ Sets the executor running the fuzzy scoring of async lookups
+
+    Parameters
+    ----------
+    executor : Union[concurrent.futures.Executor, None]
+        A thread pool executor, or None to go back to the default one.  The
+        previous default executor is shut down.
+    """
+    global _executor
+    with _executor_lock:
+        previous, _executor = _executor, executor
+    if previous is not None and previous is not executor:
+        previous.shutdown(wait=False)
+
+
+class Batcher(object):
+    """ Coalesces and micro-batches the async lookups of a fuzzy object
+
+    Concurrent lookups of the same string share a single future.  Strings
+    arriving within ``window`` seconds of the first pending one are scored in a
+    single `~fuzzy_types.fuzzy.FuzzyBase.match_many` call in the executor, or as
+    soon as ``max_batch`` strings are pending.  Exact matches are looked up
+    directly, without waiting.  Each fuzzy object has one batcher per event loop.
+
+    Parameters
+    ----------
+    fuzzy : FuzzyBase
+        The fuzzy object to look up
+    loop : asyncio.AbstractEventLoop
+        The running event loop
+    window : float
+        The batching window in seconds.  By default, the ``fuzzy_async_window``
+        config value.
+    max_batch : int
+        The maximum number of strings per batch.  By default, the
+        ``fuzzy_async_max_batch`` config value.
+    """
+
+    def __init__(self, fuzzy, loop: asyncio.AbstractEventLoop, window: float = None,
+                 max_batch: int = None):
+        self.fuzzy = fuzzy
+        self.loop = loop
+        self.window = config.get('fuzzy_async_window', 0.002) if window is None else window
+        self.max_batch = config.get('fuzzy_async_max_batch', 256) \
+            if max_batch is None else max_batch
+        self._pending = {}
+        self._inflight = {}
+        self._timer = None
+        self._tasks = set()
+
+    def __repr__(self) -> str:
+        return (f'<Batcher(window={self.window}, pending={len(self._pending)}, '
+                f'inflight={len(self._inflight)})>')
+
+    def _exact(self, value: str, index: 'ChoiceIndex') -> Union[Match, ValueError, None]:
+        fuzzy = self.fuzzy
+        if fuzzy._exact_first is not True:
+            return None
+        query = value if fuzzy._normalizer is None else fuzzy._normalizer(value)
+        try:
+            position = index.exact(query, key=value, ties=fuzzy._ties)
+        except ValueError as error:
+            # an ambiguous exact match, returned as the failed match of a batch would be
+            return error
+        return None if position is None else Match(index.choices[position], 100, position)
+
+    def submit(self, value: str) -> asyncio.Future:
+        """ Returns a future of the `~fuzzy_types.utils.Match` of a string
+
+        Concurrent lookups of the same string share one match, but each caller gets
+        its own future, so cancelling one lookup doesn't cancel the others.
+
+        Parameters
+        ----------
+        value : str
+            The string to match on
+
+        Returns
+        -------
+        asyncio.Future
+            The future tuple of the choices index snapshot matched against, and the
+            match record or the error instance of a failed match
+        """
+        assert isinstance(value, str), 'Invalid value. Must be a string.'
+        shared = self._pending.get(value) or self._inflight.get(value)
+        if shared is not None and shared.done():
+            # a settled or cancelled match is never shared with later lookups
+            for table in (self._pending, self._inflight):
+                if table.get(value) is shared:
+                    del table[value]
+            shared = None
+        if shared is not None:
+            return self._waiter(shared)
+
+        future = self.loop.create_future()
+        index = self.fuzzy._choice_index
+        match = self._exact(value, index)
+        if match is not None:
+            future.set_result((index, match))
+            return future
+
+        self._pending[value] = future
+        if len(self._pending) >= self.max_batch:
+            self.flush()
+        elif self._timer is None:
+            self._timer = self.loop.call_later(self.window, self.flush)
+        return self._waiter(future)
+
+    def _waiter(self, shared: asyncio.Future) -> asyncio.Future:
+        """ Returns a future of one caller, settled with the shared future """
+        waiter = self.loop.create_future()
+
+        def relay(shared):
+            if waiter.done():
+                return
+            if shared.cancelled():
+                waiter.cancel()
+            elif shared.exception() is not None:
+                waiter.set_exception(shared.exception())
+            else:
+                waiter.set_result(shared.result())
+
+        shared.add_done_callback(relay)
+        return waiter
+
+    def flush(self) -> None:
+        """ Sends the pending strings to the executor as one batch """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, {}
+        self._inflight.update(batch)
+        task = self.loop.create_task(self._score(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _score(self, batch: dict) -> None:
+        values = list(batch)
+        index = self.fuzzy._choice_index
+        try:
+            matches = await self.loop.run_in_executor(get_executor(), self.fuzzy._matches,
+                                                      values, 'marker', -1, index)
+        except Exception as error:
+            for value, future in batch.items():
+                if self._inflight.get(value) is future:
+                    del self._inflight[value]
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        # failed matches are results, so each awaiting lookup can raise its own copy
+        for value, match in zip(values, matches):
+            future = batch[value]
+            if self._inflight.get(value) is future:
+                del self._inflight[value]
+            if not future.done():
+                future.set_result((index, match))
+
+
+def get_batcher(fuzzy) -> Batcher:
+    """ Returns the batcher of a fuzzy object for the running event loop """
+    loop = asyncio.get_running_loop()
+    batcher = fuzzy._batcher
+    if batcher is None or batcher.loop is not loop:
+        batcher = Batcher(fuzzy, loop)
+        fuzzy._batcher = batcher
+    return batcher
@@ -0,0 +1,116 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: cache.py
+# Project: fuzzy_types
+# Author: Brian Cherinka
+# Created: Friday, 16th October 2026 1:05:12 pm
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Friday, 16th October 2026 1:05:12 pm
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+import threading
+from collections import OrderedDict, namedtuple
+from typing import Hashable
+
+__all__ = ['LRUCache', 'CacheInfo']
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+_missing = object()
+
+
+class LRUCache(object):
+    """ A bounded least-recently-used cache with hit and miss counters
+
+    Used by the fuzzy objects to memoize the result of fuzzy-matching a
+    string, including failed matches.  When full, the least recently used
+    entry is evicted.  The cache is thread-safe.
+
+    Parameters
+    ----------
+    maxsize : int
+        The maximum number of entries to hold
+    """
+
+    def __init__(self, maxsize: int):
+        assert maxsize > 0, 'cache maxsize must be positive.'
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f'<LRUCache(maxsize={self.maxsize}, currsize={len(self)})>'
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default=None):
+        """ Returns a cached value, marking it as recently used
+
+        Parameters
+        ----------
+        key : Hashable
+            The cache key
+        default : object
+            The value returned on a cache miss
+
+        Returns
+        -------
+        object
+            The cached value, or the default
+        """
+        with self._lock:
+            value = self._data.get(key, _missing)
+            if value is _missing:
+                self.misses += 1
+                return default
+
+            self.hits += 1
+            self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value) -> None:
+        """ Adds a value to the cache, evicting the least recently used entry if full
+
+        Parameters
+        ----------
+        key : Hashable
+            The cache key
+        value : object
+            The value to cache
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """ Removes all entries, keeping the hit and miss counters """
+        with self._lock:
+            self._data.clear()
+
+    def info(self) -> CacheInfo:
+        """ Returns the cache statistics
+
+        Returns
+        -------
+        CacheInfo
+            A tuple of (hits, misses, maxsize, currsize)
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
@@ -0,0 +1,264 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: cli.py
+# Project: fuzzy_types
+# Author: Brian Cherinka
+# Created: Saturday, 17th October 2026 12:48:02 am
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Saturday, 17th October 2026 12:48:02 am
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from typing import Iterable, TextIO, Union
+
+from fuzzy_types.configuration import read_yaml_file
+from fuzzy_types.fuzzy import FuzzyDict, FuzzyList
+from fuzzy_types.matcher import Matcher
+from fuzzy_types.normalize import STEPS
+from fuzzy_types.storage import IndexFileError
+
+__all__ = ['read_vocabulary', 'load_fuzzy', 'main']
+
+# the rapidfuzz.fuzz scorers selectable with --scorer
+SCORERS = ('WRatio', 'QRatio', 'ratio', 'partial_ratio', 'token_sort_ratio',
+           'token_set_ratio', 'partial_token_sort_ratio', 'partial_token_set_ratio')
+
+
+def read_vocabulary(path: Union[str, os.PathLike]) -> Union[list, dict]:
+    """ Reads a vocabulary file
+
+    JSON (``.json``) and YAML (``.yaml`` or ``.yml``) files may hold a list or a
+    mapping.  Any other file is read as plain text, with one item per non-empty line.
+
+    Parameters
+    ----------
+    path : Union[str, os.PathLike]
+        The path of the vocabulary file
+
+    Returns
+    -------
+    Union[list, dict]
+        The vocabulary items, or mapping of keys to values
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.json':
+        with open(path, 'r', encoding='utf-8') as fp:
+            vocab = json.load(fp)
+    elif extension in ('.yaml', '.yml'):
+        vocab = read_yaml_file(path)
+    else:
+        with open(path, 'r', encoding='utf-8') as fp:
+            vocab = [line.rstrip('\r\n') for line in fp]
+        vocab = [line for line in vocab if line.strip()]
+
+    assert isinstance(vocab, (list, dict)), 'The vocabulary must be a list or a mapping.'
+    return vocab
+
+
+def _fingerprint(path: Union[str, os.PathLike]) -> str:
+    """ Returns the SHA-256 hash of a file """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as fp:
+        for chunk in iter(lambda: fp.read(2 ** 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_fuzzy(path: Union[str, os.PathLike], index_path: Union[str, os.PathLike] = None,
+               **kwargs) -> Union[FuzzyList, FuzzyDict]:
+    """ Loads a vocabulary file into a fuzzy object
+
+    A mapping is loaded into a `~fuzzy_types.fuzzy.FuzzyDict`, and a list into a
+    `~fuzzy_types.fuzzy.FuzzyList`.  With ``index_path``, the choices index is read
+    from that index file, unless it is missing, invalid, or was saved from another
+    version of the vocabulary file, in which case the index is built and saved there
+    for the next time.
+
+    Parameters
+    ----------
+    path : Union[str, os.PathLike]
+        The path of the vocabulary file, see `read_vocabulary`
+    index_path : Union[str, os.PathLike]
+        The path of a prebuilt index file.  By default, None.
+    kwargs
+        Any other keyword arguments used to initialize the fuzzy object
+
+    Returns
+    -------
+    Union[FuzzyList, FuzzyDict]
+        The fuzzy object
+    """
+    vocab = read_vocabulary(path)
+    kls = FuzzyDict if isinstance(vocab, dict) else FuzzyList
+    kwargs.setdefault('dottable', False)
+    if index_path is None:
+        return kls(vocab, **kwargs)
+
+    fingerprint = _fingerprint(path)
+    if os.path.exists(index_path):
+        try:
+            return kls.from_index(index_path, store=vocab if kls is FuzzyDict else None,
+                                  fingerprint=fingerprint, **kwargs)
+        except IndexFileError:
+            pass
+
+    fuzzy = kls(vocab, **kwargs)
+    fuzzy.save_index(index_path, fingerprint=fingerprint)
+    return fuzzy
+
+
+def _queries(path: str) -> Union[Iterable[str], str]:
+    """ Returns the query source, the standard input or a file path """
+    if path == '-':
+        return (line.rstrip('\r\n') for line in sys.stdin)
+    return path
+
+
+def _write_records(records: Iterable, output: TextIO, output_format: str) -> Iterable:
+    """ Writes each record as a TSV or JSON line, and yields it on """
+    for record in records:
+        if output_format == 'jsonl':
+            output.write(json.dumps(record._asdict(), default=str) + '\n')
+        else:
+            fields = ('' if field is None else str(field) for field in record)
+            output.write('\t'.join(fields) + '\n')
+        yield record
+
+
+def _percentile(values: list, q: float) -> float:
+    """ Returns the nearest-rank percentile ``q`` of a list of numbers """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * q // 100))
+    return ordered[int(rank) - 1]
+
+
+def _print_stats(count: int, matched: int, elapsed: float, batches: list,
+                 batch_size: int, load: float) -> None:
+    """ Prints the throughput and the percentiles of the time between written batches """
+    err = sys.stderr
+    print(f'loaded vocabulary in {load:.3f}s', file=err)
+    print(f'matched {matched} of {count} strings in {elapsed:.3f}s '
+          f'({count / elapsed if elapsed else 0.0:.0f} strings/s)', file=err)
+    latencies = ', '.join(f'p{q} {_percentile(batches, q) * 1e3:.2f}ms' for q in (50, 90, 99))
+    print(f'time between batches of {batch_size} written: {latencies}, '
+          f'max {max(batches or [0.0]) * 1e3:.2f}ms', file=err)
+
+
+def match(args: argparse.Namespace) -> int:
+    """ Runs the match command """
+    from rapidfuzz import fuzz
+
+    start = time.perf_counter()
+    matcher = Matcher(scorer=getattr(fuzz, args.scorer), min_score=args.cutoff,
+                      min_length=args.min_length)
+    fuzzy = load_fuzzy(args.vocabulary, index_path=args.index, use_fuzzy=matcher,
+                       normalize=args.normalize, ngram_candidates=args.ngram_candidates)
+    load = time.perf_counter() - start
+
+    output = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    count, matched, batches = 0, 0, []
+    try:
+        start = tick = time.perf_counter()
+        records = fuzzy.match_stream(_queries(args.queries), batch_size=args.batch_size,
+                                     processes=args.processes, workers=args.workers)
+        for record in _write_records(records, output, args.format):
+            count += 1
+            matched += record.match is not None
+            if count % args.batch_size == 0:
+                now = time.perf_counter()
+                batches.append(now - tick)
+                tick = now
+        elapsed = time.perf_counter() - start
+        if count % args.batch_size:
+            batches.append(time.perf_counter() - tick)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+        else:
+            output.flush()
+
+    if args.stats:
+        _print_stats(count, matched, elapsed, batches, args.batch_size, load)
+    return 0
+
+
+def parser() -> argparse.ArgumentParser:
+    """ Returns the command-line argument parser """
+    main_parser = argparse.ArgumentParser(prog='fuzzy-types',
+                                          description='Fuzzy-matching utilities.')
+    commands = main_parser.add_subparsers(dest='command', metavar='command')
+    commands.required = True
+
+    sub = commands.add_parser('match', help='fuzzy-match strings against a vocabulary',
+                              description='Fuzzy-matches each line of the queries against '
+                                          'a vocabulary, and writes the input, match, score '
+                                          'and value of each.')
+    sub.add_argument('vocabulary', help='a text file with one item per line, or a JSON or '
+                                        'YAML list or mapping')
+    sub.add_argument('queries', nargs='?', default='-',
+                     help='a text file with one query per line. By default, the standard input.')
+    sub.add_argument('-o', '--output', default='-',
+                     help='the output file. By default, the standard output.')
+    sub.add_argument('-f', '--format', choices=('tsv', 'jsonl'), default='tsv',
+                     help='the output format. Default is tsv.')
+    sub.add_argument('--scorer', choices=SCORERS, default='WRatio',
+                     help='the rapidfuzz scorer. Default is WRatio.')
+    sub.add_argument('--cutoff', type=float, default=None,
+                     help='the minimum match score. By default, the config value.')
+    sub.add_argument('--min-length', type=int, default=None,
+                     help='the minimum query length. By default, the config value.')
+    sub.add_argument('--normalize', nargs='+', default=None, metavar='STEP',
+                     help=f'the normalization steps, among {", ".join(STEPS)}.')
+    sub.add_argument('--ngram-candidates', type=int, default=0, metavar='N',
+                     help='score only the N choices sharing the most n-grams with a query.')
+    sub.add_argument('--batch-size', type=int, default=1024,
+                     help='the number of queries matched per batch. Default is 1024.')
+    sub.add_argument('--workers', type=int, default=-1,
+                     help='the number of scoring threads. By default, all cores.')
+    sub.add_argument('--processes', type=int, default=0,
+                     help='the number of worker processes. By default, none.')
+    sub.add_argument('--index', default=None, metavar='PATH',
+                     help='a prebuilt index file, built and saved there if missing or stale')
+    sub.add_argument('--stats', action='store_true',
+                     help='print the throughput and the percentiles of the time between '
+                          'written batches to the standard error')
+    sub.set_defaults(func=match)
+    return main_parser
+
+
+def main(args: list = None) -> int:
+    """ Runs the fuzzy-types command line
+
+    Parameters
+    ----------
+    args : list
+        The command-line arguments.  By default, those of the process.
+
+    Returns
+    -------
+    int
+        The exit status
+    """
+    main_parser = parser()
+    args = main_parser.parse_args(args)
+    if args.batch_size < 1:
+        main_parser.error('--batch-size must be at least 1.')
+    try:
+        return args.func(args)
+    except (OSError, ValueError, AssertionError) as error:
+        main_parser.exit(1, f'fuzzy-types: error: {error}\n')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,308 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: cluster.py
+# Project: fuzzy_types
+# Author: Brian Cherinka
+# Created: Saturday, 17th October 2026 1:24:18 am
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Saturday, 17th October 2026 1:24:18 am
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+import itertools
+import math
+from collections import namedtuple
+from typing import TYPE_CHECKING, Callable, Iterable, Sequence, Union
+
+from fuzzy_types.index import TOMBSTONE, NgramIndex
+from fuzzy_types.matcher import Matcher
+from fuzzy_types.utils import CDIST_CELLS, CUTOFF_MARGIN, default_scorer
+
+if TYPE_CHECKING:
+    # numpy is only imported when pairs are scored, to keep the import fast
+    import numpy
+
+__all__ = ['NearDuplicate', 'find_near_duplicates', 'cluster']
+
+# a pair of near-duplicate items or keys, with their score
+NearDuplicate = namedtuple('NearDuplicate', ['key', 'other', 'score'])
+
+# up to this many distinct strings, all pairs are scored by default
+EXHAUSTIVE_LIMIT = 1000
+# n-gram blocks up to this size are scored pair by pair, larger ones as a score matrix
+SMALL_BLOCK = 64
+
+
+def _groups(items: Iterable) -> tuple:
+    """ Returns the items or keys, their distinct search strings, and the positions of each """
+    from fuzzy_types.fuzzy import FuzzyBase
+
+    if isinstance(items, FuzzyBase):
+        index = items._choice_index
+        live = [slot for slot, key in enumerate(index.keys) if key is not TOMBSTONE]
+        keys = [index.keys[slot] for slot in live]
+        forms = [index.forms[slot] for slot in live]
+    else:
+        keys = list(items)
+        forms = [FuzzyBase.mapper(item) for item in keys]
+
+    groups = {}
+    for position, form in enumerate(forms):
+        groups.setdefault(form, []).append(position)
+    return keys, list(groups), list(groups.values())
+
+
+def _settings(items: Iterable, scorer: Callable = None, processor: Callable = None) -> tuple:
+    """ Returns the scorer and processor, following the matcher of a fuzzy object """
+    matcher = getattr(items, 'use_fuzzy', None)
+    if isinstance(matcher, Matcher):
+        scorer = matcher.scorer if scorer is None else scorer
+        processor = matcher.processor if processor is None else processor
+    return (default_scorer() if scorer is None else scorer), processor
+
+
+def _cutoff(threshold: float) -> float:
+    """ Returns the rapidfuzz score cutoff of a threshold """
+    # rapidfuzz rounds float cutoffs, so leave a margin to not drop pairs at the threshold
+    return max(0, threshold - CUTOFF_MARGIN)
+
+
+def _matrix_pairs(strings: Sequence, ids: 'numpy.ndarray', scorer: Callable,
+                  processor: Callable, threshold: float, workers: int) -> tuple:
+    """ Scores all pairs of the strings at ``ids``, a chunk of the score matrix at a time """
+    import numpy as np
+    from rapidfuzz import process
+
+    block = [strings[i] for i in ids]
+    size = len(block)
+    chunk = max(1, CDIST_CELLS // size)
+    lefts, rights, scores = [], [], []
+    for start in range(0, size, chunk):
+        # only the upper triangle, as the scorers are symmetric
+        matrix = process.cdist(block[start:start + chunk], block[start:], scorer=scorer,
+                               processor=processor, score_cutoff=_cutoff(threshold),
+                               dtype=np.float64, workers=workers)
+        rows, cols = np.nonzero(matrix >= threshold)
+        keep = cols > rows
+        rows, cols = rows[keep], cols[keep]
+        lefts.append(ids[start + rows])
+        rights.append(ids[start + cols])
+        scores.append(matrix[rows, cols])
+    return lefts, rights, scores
+
+
+def _listed_pairs(strings: 'numpy.ndarray', codes: list, scorer: Callable, processor: Callable,
+                  threshold: float, workers: int) -> tuple:
+    """ Scores the pairs of an object array of strings, encoded as ``i * len(strings) + j`` """
+    import numpy as np
+    from rapidfuzz import process
+
+    # pairs sharing several blocks are only scored once per chunk; sorting is much
+    # faster than np.unique here
+    codes = np.sort(np.concatenate(codes))
+    codes = codes[np.concatenate(([True], codes[1:] != codes[:-1]))]
+    lefts, rights = np.divmod(codes, len(strings))
+    queries = strings[lefts]
+    choices = strings[rights]
+    cpdist = getattr(process, 'cpdist', None)
+    if cpdist is not None:
+        scores = cpdist(queries, choices, scorer=scorer, processor=processor,
+                        score_cutoff=_cutoff(threshold), dtype=np.float64, workers=workers)
+    else:
+        # rapidfuzz < 3.6 has no pairwise scoring
+        scores = np.array([scorer(query, choice, processor=processor)
+                           for query, choice in zip(queries, choices)], dtype=np.float64)
+    keep = scores >= threshold
+    return lefts[keep], rights[keep], scores[keep]
+
+
+def _blocks(strings: Sequence, threshold: float, processor: Callable = None) -> list:
+    """ Returns the n-gram blocks of candidate near-duplicates
+
+    A prefix filter: strings within an Indel similarity of ``threshold`` share most of
+    their n-grams, so each string is only blocked with the rarest of its n-grams it
+    can't lose to edits, and pairs sharing none of them are never scored.  Short or
+    repetitive strings that edits could leave with no n-gram in common are all
+    blocked together.
+    """
+    import numpy as np
+
+    forms = strings if processor is None else [processor(value) for value in strings]
+    ngrams = NgramIndex(forms)
+    frequency = {gram: len(ids) for gram, ids in ngrams.postings.items()}
+    blocks = {}
+    unblocked = []
+    for i, form in enumerate(forms):
+        grams = sorted(ngrams.grams(form), key=lambda gram: (frequency[gram], gram))
+        # the most edits keeping the threshold with the longest possible other string,
+        # with a margin for rounding errors; each edit loses at most n n-grams
+        edits = math.floor((100 - threshold) * 2 * len(form) / threshold + 1e-9)
+        if ngrams.n * edits >= len(grams):
+            unblocked.append(i)
+        for gram in grams[:ngrams.n * edits + 1]:
+            blocks.setdefault(gram, []).append(i)
+    blocks = [ids for ids in blocks.values() if len(ids) > 1]
+    if len(unblocked) > 1:
+        blocks.append(unblocked)
+    return [np.array(ids, dtype=np.int64) for ids in blocks]
+
+
+def _scored_pairs(strings: Sequence, scorer: Callable, processor: Callable, threshold: float,
+                  exhaustive: bool, workers: int) -> dict:
+    """ Returns the score of each pair of strings (i, j), with i < j, above the threshold """
+    import numpy as np
+
+    if len(strings) < 2:
+        return {}
+    if exhaustive:
+        lefts, rights, scores = _matrix_pairs(strings, np.arange(len(strings)), scorer,
+                                              processor, threshold, workers)
+    else:
+        lefts, rights, scores = [], [], []
+        pending, size = [], 0
+        array = np.array(strings, dtype=object)
+        for block in _blocks(strings, threshold, processor=processor):
+            if len(block) > SMALL_BLOCK:
+                found = _matrix_pairs(strings, block, scorer, processor, threshold, workers)
+                for found_list, result in zip((lefts, rights, scores), found):
+                    found_list.extend(result)
+                continue
+            # the pairs of the small blocks are scored together, in chunks
+            rows, cols = np.triu_indices(len(block), 1)
+            pending.append(block[rows] * len(strings) + block[cols])
+            size += len(rows)
+            if size >= CDIST_CELLS:
+                found = _listed_pairs(array, pending, scorer, processor, threshold, workers)
+                for found_list, result in zip((lefts, rights, scores), found):
+                    found_list.append(result)
+                pending, size = [], 0
+        if pending:
+            found = _listed_pairs(array, pending, scorer, processor, threshold, workers)
+            for found_list, result in zip((lefts, rights, scores), found):
+                found_list.append(result)
+
+    pairs = {}
+    for left, right, score in zip(lefts, rights, scores):
+        pairs.update(zip(zip(left.tolist(), right.tolist()), score.tolist()))
+    return pairs
+
+
+def _near_pairs(items: Iterable, threshold: Union[int, float], scorer: Callable,
+                processor: Callable, exhaustive: bool, workers: int) -> tuple:
+    """ Returns the keys, positions of each distinct string, and near-duplicate string pairs """
+    assert 0 < threshold <= 100, 'threshold must be between 0 and 100.'
+    keys, strings, groups = _groups(items)
+    scorer, processor = _settings(items, scorer=scorer, processor=processor)
+    if exhaustive is None:
+        exhaustive = len(strings) <= EXHAUSTIVE_LIMIT
+    return keys, groups, _scored_pairs(strings, scorer, processor, threshold, exhaustive,
+                                       workers)
+
+
+def find_near_duplicates(items: Iterable, threshold: Union[int, float] = 90,
+                         scorer: Callable = None, processor: Callable = None,
+                         exhaustive: bool = None, workers: int = -1) -> list:
+    """ Finds the pairs of items, or dictionary keys, scoring at least ``threshold``
+
+    Items are compared by their search strings, i.e. for a fuzzy object, the output
+    of its ``mapper`` and ``normalize`` steps, with its matcher's scorer and
+    processor.  Items with the same search string are near-duplicates with a
+    score of 100.
+
+    Up to `EXHAUSTIVE_LIMIT` distinct strings, all pairs are scored, in chunks of
+    ``rapidfuzz.process.cdist`` score matrices.  Beyond, the strings are blocked by
+    character n-grams, and only the pairs sharing one of the rarest n-grams of each
+    string are scored.  The blocking finds all the pairs of the ``ratio`` scorer,
+    but may miss a few pairs that other scorers, such as the default WRatio, only
+    score highly for partial or reordered matches.  Lower thresholds block fewer
+    pairs out, down to scoring most pairs at 80 or less.
+
+    Parameters
+    ----------
+    items : Iterable
+        The strings or items to compare, or a fuzzy object
+    threshold : Union[int, float]
+        The minimum score of a near-duplicate pair.  By default, 90.
+    scorer : Callable
+        The rapidfuzz score ratio to use.  By default, that of the fuzzy object's
+        matcher, or WRatio.
+    processor : Callable
+        A function preprocessing the strings before scoring.  By default, that of
+        the fuzzy object's matcher, or None.
+    exhaustive : bool
+        If True, scores all pairs, and if False, only the n-gram blocked ones.  By
+        default, chosen from the number of distinct strings.
+    workers : int
+        The number of threads used for scoring.  By default, -1, for all cores.
+
+    Returns
+    -------
+    list
+        A `NearDuplicate` of (key, other, score) per pair, from the highest score
+        down, with the key first in the collection order
+    """
+    keys, groups, pairs = _near_pairs(items, threshold, scorer, processor, exhaustive, workers)
+    found = [(100, first, second) for positions in groups
+             for first, second in itertools.combinations(positions, 2)]
+    for (i, j), score in pairs.items():
+        found.extend((score, *sorted(positions))
+                     for positions in itertools.product(groups[i], groups[j]))
+    found.sort(key=lambda pair: (-pair[0], pair[1], pair[2]))
+    return [NearDuplicate(keys[first], keys[second], score) for score, first, second in found]
+
+
+def cluster(items: Iterable, threshold: Union[int, float] = 90, scorer: Callable = None,
+            processor: Callable = None, exhaustive: bool = None, workers: int = -1) -> list:
+    """ Groups the near-duplicate items, or dictionary keys, of a collection
+
+    Items are grouped with all the items they score at least ``threshold`` with,
+    transitively, so two items of a group may score less than ``threshold`` with
+    each other.  See `find_near_duplicates` for how the items are compared.
+
+    Parameters
+    ----------
+    items : Iterable
+        The strings or items to group, or a fuzzy object
+    threshold : Union[int, float]
+        The minimum score of a near-duplicate pair.  By default, 90.
+    scorer : Callable
+        The rapidfuzz score ratio to use.  By default, that of the fuzzy object's
+        matcher, or WRatio.
+    processor : Callable
+        A function preprocessing the strings before scoring.  By default, that of
+        the fuzzy object's matcher, or None.
+    exhaustive : bool
+        If True, scores all pairs, and if False, only the n-gram blocked ones.  By
+        default, chosen from the number of distinct strings.
+    workers : int
+        The number of threads used for scoring.  By default, -1, for all cores.
+
+    Returns
+    -------
+    list
+        The groups of two or more near-duplicate items or keys, each in the
+        collection order, ordered by their first item
+    """
+    keys, groups, pairs = _near_pairs(items, threshold, scorer, processor, exhaustive, workers)
+
+    # union-find over the distinct strings, with the first string as the root
+    parents = list(range(len(groups)))
+
+    def root(i):
+        while parents[i] != i:
+            parents[i] = parents[parents[i]]
+            i = parents[i]
+        return i
+
+    for i, j in pairs:
+        first, second = sorted((root(i), root(j)))
+        parents[second] = first
+
+    members = {}
+    for i, positions in enumerate(groups):
+        members.setdefault(root(i), []).extend(positions)
+    return [[keys[position] for position in sorted(positions)]
+            for positions in members.values() if len(positions) > 1]
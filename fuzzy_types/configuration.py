@@ -6,20 +6,20 @@
 # @Filename: configuration.py
 # @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
 
-import inspect
 import os
-import pathlib
-import yaml
-from typing import Union
+import sys
+from typing import Callable, Union
 
 
-__all__ = ['read_yaml_file', 'merge_config', 'get_config']
+__all__ = ['read_yaml_file', 'merge_config', 'get_config', 'LazyConfig']
 
 
-def read_yaml_file(path: Union[str, pathlib.Path]) -> dict:
+def read_yaml_file(path: Union[str, os.PathLike]) -> dict:
     """Read a YAML file and returns a dictionary."""
 
-    if isinstance(path, (str, pathlib.Path)):
+    import yaml
+
+    if isinstance(path, (str, os.PathLike)):
         with open(path, 'r') as fp:
             config = yaml.safe_load(fp)
     else:
@@ -87,9 +87,8 @@ def get_config(name: str, config_file: str = None, allow_user: bool = True,
     assert merge_mode in ['update', 'replace'], 'invalid merge mode.'
 
     if not config_file:
-        frame = inspect.stack()[1]
-        module = inspect.getmodule(frame[0])
-        dirname = os.path.dirname(module.__file__)
+        # only look up the caller's file; inspect.stack reads the source of every frame
+        dirname = os.path.dirname(sys._getframe(1).f_globals['__file__'])
         config_file = os.path.join(dirname, f'etc/{name}.yml')
 
     if os.path.exists(config_file):
@@ -121,3 +120,133 @@ def get_config(name: str, config_file: str = None, allow_user: bool = True,
     else:
         return user_config
 
+
+class LazyConfig(dict):
+    """A configuration dictionary only loaded on first access.
+
+    Behaves as the dictionary returned by the loader, but defers calling it,
+    e.g. to avoid parsing YAML files when importing a package.  The ``version``
+    is incremented whenever the configuration is changed or reloaded, so
+    objects caching config values can tell when to refresh them.  Changes to
+    nested dictionaries are not tracked.
+
+    Parameters
+    ----------
+    loader : Callable
+        A function returning the configuration dictionary, e.g. `.get_config`.
+
+    """
+
+    def __init__(self, loader: Callable[[], dict]):
+        super().__init__()
+        self._source = loader
+        self._loader = loader
+        self.version = 0
+
+    def _load(self) -> None:
+        if self._loader is not None:
+            loader, self._loader = self._loader, None
+            super().update(loader() or {})
+
+    def _changed(self) -> None:
+        self.version += 1
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the configuration has been loaded."""
+        return self._loader is None
+
+    def reload(self) -> None:
+        """Discards the configuration, so it is loaded again on next access."""
+        super().clear()
+        self._loader = self._source
+        self._changed()
+
+    def __getitem__(self, key):
+        self._load()
+        return super().__getitem__(key)
+
+    def __setitem__(self, key, value):
+        self._load()
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key):
+        self._load()
+        super().__delitem__(key)
+        self._changed()
+
+    def __contains__(self, key) -> bool:
+        self._load()
+        return super().__contains__(key)
+
+    def __iter__(self):
+        self._load()
+        return super().__iter__()
+
+    def __len__(self) -> int:
+        self._load()
+        return super().__len__()
+
+    def __eq__(self, other) -> bool:
+        self._load()
+        return super().__eq__(other)
+
+    def __ne__(self, other) -> bool:
+        return not self == other
+
+    def __repr__(self) -> str:
+        self._load()
+        return super().__repr__()
+
+    def __reduce__(self):
+        self._load()
+        return (dict, (dict(self),))
+
+    def get(self, key, default=None):
+        self._load()
+        return super().get(key, default)
+
+    def keys(self):
+        self._load()
+        return super().keys()
+
+    def values(self):
+        self._load()
+        return super().values()
+
+    def items(self):
+        self._load()
+        return super().items()
+
+    def copy(self) -> dict:
+        self._load()
+        return dict(self)
+
+    def pop(self, *args):
+        self._load()
+        value = super().pop(*args)
+        self._changed()
+        return value
+
+    def popitem(self):
+        self._load()
+        item = super().popitem()
+        self._changed()
+        return item
+
+    def setdefault(self, key, default=None):
+        self._load()
+        if key not in self:
+            self._changed()
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs) -> None:
+        self._load()
+        super().update(*args, **kwargs)
+        self._changed()
+
+    def clear(self) -> None:
+        self._loader = None
+        super().clear()
+        self._changed()
@@ -15,10 +15,18 @@ from __future__ import print_function, division, absolute_import
 from collections import OrderedDict
 
 import abc
-import inspect
-import six
-from fuzzy_types.utils import get_best_fuzzy
-from typing import Callable, Union, TypeVar
+import os
+import threading
+import time
+from fuzzy_types import config
+from fuzzy_types.cache import CacheInfo, LRUCache
+from fuzzy_types.index import TOMBSTONE, ChoiceIndex, Prefilter
+from fuzzy_types.matcher import Matcher
+from fuzzy_types.normalize import Normalizer, get_normalizer
+from fuzzy_types.stats import Lookup, MatchStats
+from fuzzy_types.storage import load_index, save_index
+from fuzzy_types.utils import Match, _no_match, get_best_fuzzy, handle_error
+from typing import Callable, Iterable, Iterator, Mapping, Union, TypeVar
 
 __all__ = ['FuzzyBase', 'FuzzyBaseDict', 'FuzzyList', 'FuzzyDict', 'FuzzyOrderedDict', 'FuzzyStr']
 
@@ -32,11 +40,40 @@ AF = Union[FL, FD, FOD, FS]
 class FuzzyBase(abc.ABC):
     """ Abstract Base Class for all Fuzzy objects """
     _base = None
+    _dottable = True
+    _exact_first = True
+    _index = None
+    _cache = None
+    _ngram_candidates = 0
+    _prefilter = True
+    _stats = None
+    _normalizer = None
+    _batcher = None
+    _concurrent = False
+    _incremental = True
 
     def __init__(self, the_items: Union[list, dict], use_fuzzy: Callable = None, 
-                 dottable: bool = True):
-        self.use_fuzzy = use_fuzzy or get_best_fuzzy
+                 dottable: bool = True, exact_first: bool = True, cache_size: int = None,
+                 ngram_candidates: int = 0, prefilter: bool = True,
+                 instrument: Union[bool, MatchStats] = False,
+                 normalize: Union[str, Callable, Iterable, Normalizer] = None,
+                 concurrent: bool = False):
+        # each object compiles its own matcher, unless given a custom function
+        if use_fuzzy is None or use_fuzzy is get_best_fuzzy:
+            use_fuzzy = Matcher()
+        self.use_fuzzy = use_fuzzy
         self._dottable = dottable
+        self._exact_first = exact_first
+        self._ngram_candidates = ngram_candidates
+        self._prefilter = prefilter
+        self._concurrent = concurrent
+        if instrument is not False:
+            self._stats = MatchStats(source=self.__class__.__name__) if instrument is True \
+                else instrument
+        self._normalizer = get_normalizer(config.get('fuzzy_normalize') if normalize is None
+                                          else normalize)
+        cache_size = config.get('fuzzy_cache_size', 0) if cache_size is None else cache_size
+        self._cache = LRUCache(cache_size) if cache_size > 0 else None
         self._base.__init__(self, the_items)
 
     def __getattr__(self, value: Union[str, int, object]):
@@ -80,16 +117,676 @@ class FuzzyBase(abc.ABC):
     def choices(self):
         pass
 
+    @abc.abstractmethod
+    def _iter_keys(self) -> Iterable:
+        pass
+
+    def __getstate__(self) -> dict:
+        # the lock and event loop batcher are specific to this process
+        state = self.__dict__.copy()
+        state.pop('_rlock', None)
+        state.pop('_batcher', None)
+        return state
+
+    @property
+    def _lock(self) -> threading.RLock:
+        """ The lock held while mutating the object or building its choices index """
+        # created on first use, also by unpickled objects; setdefault is atomic
+        lock = self.__dict__.get('_rlock')
+        if lock is None:
+            lock = self.__dict__.setdefault('_rlock', threading.RLock())
+        return lock
+
+    @property
+    def _choice_index(self) -> ChoiceIndex:
+        """ The current snapshot of the choices index, built on first use
+
+        A lookup reads the snapshot once and uses it throughout, without locking.
+        Snapshots are only updated in place by appending slots or tombstoning them,
+        so the positions a lookup finds stay valid; any other change swaps in a new
+        snapshot.  When ``concurrent``, snapshots are never changed once published,
+        and updates are made to a copy swapped in instead.  Stale snapshots are
+        freed once no lookup uses them.
+        """
+        index = self._index
+        if index is None:
+            with self._lock:
+                index = self._index
+                if index is None:
+                    index = self._index = self._build_index()
+        return index
+
+    @property
+    def _ties(self) -> str:
+        """ How distinct keys sharing a choice are resolved, following the matcher """
+        return getattr(self.use_fuzzy, 'ties', 'raise')
+
+    def _build_index(self) -> ChoiceIndex:
+        """ Returns a new choices index of the current items """
+        return ChoiceIndex(self._iter_keys(), self.mapper, normalizer=self._normalizer)
+
+    def _reset_index(self) -> None:
+        """ Replaces the choices index and clears the match cache after a mutation
+
+        By default the index is dropped, and rebuilt on the next lookup.  When
+        ``concurrent``, a new index snapshot is built right away and swapped in, so
+        concurrent lookups keep using the previous snapshot instead of waiting for it.
+        """
+        if self._concurrent is True and self._index is not None:
+            self._index = self._build_index()
+        else:
+            self._index = None
+        if self._cache is not None:
+            self._cache.clear()
+
+    def _update_index(self, added: Iterable = (), removed: Iterable = (),
+                      truncated: int = 0) -> None:
+        """ Updates the choices index in place and clears the match cache after a mutation
+
+        The ``removed`` dictionary keys are tombstoned, the last ``truncated`` list
+        items dropped, and the ``added`` keys or items appended, each in time
+        proportional to the size of the key rather than of the object.  Once the
+        in-place updates pile up, the index is compacted into a new snapshot.
+        When ``concurrent``, lookups may hold the current snapshot, so a copy is
+        updated and swapped in instead.  Without an index yet, the index is simply
+        reset, see `_reset_index`.
+
+        Parameters
+        ----------
+        added : Iterable
+            The new list items or dictionary keys, in order
+        removed : Iterable
+            The removed dictionary keys
+        truncated : int
+            The number of items removed from the end of the list
+        """
+        index = self._index
+        if index is None or self._incremental is False:
+            self._reset_index()
+            return
+        if self._concurrent is True:
+            index = index.copy()
+
+        try:
+            for key in removed:
+                index.discard(key)
+            for __ in range(truncated):
+                index.pop()
+            for key in added:
+                index.add(key, self.mapper, self._normalizer)
+        except Exception:
+            # e.g. a failing mapper; dropped, so the error is raised by the next lookup
+            self._index = None
+            self._reset_index()
+            return
+
+        if index.needs_compaction:
+            index = index.compacted()
+        # published whole, so concurrent lookups see the snapshot before or after the change
+        self._index = index
+        if self._cache is not None:
+            self._cache.clear()
+
+    def _settings(self) -> dict:
+        """ Returns the keyword arguments creating a fuzzy object with the same settings """
+        return {'use_fuzzy': self.use_fuzzy, 'dottable': self._dottable,
+                'exact_first': self._exact_first,
+                'cache_size': self._cache.maxsize if self._cache is not None else 0,
+                'ngram_candidates': self._ngram_candidates, 'prefilter': self._prefilter,
+                'instrument': self._stats if self._stats is not None else False,
+                'normalize': self._normalizer or [], 'concurrent': self._concurrent}
+
+    def _candidates(self, index: ChoiceIndex, value: str, lookup: Lookup = None) -> list:
+        """ Returns the unique choices a string is fuzzy-matched against
+
+        A shortlist from the n-gram index when ``ngram_candidates`` is set.
+        Otherwise, all unique choices that can reach the score cutoff of the
+        matcher, according to the choices `~fuzzy_types.index.Prefilter`, which
+        fills in the choices it scanned and pruned in the ``lookup`` record.
+        """
+        if self._ngram_candidates > 0:
+            return index.ngrams.shortlist(value, self._ngram_candidates)
+
+        matcher = self.use_fuzzy
+        if (self._prefilter is True and isinstance(matcher, Matcher) and
+                matcher.processor is None and len(index.unique) >= Prefilter.min_choices):
+            return index.prefilter.shortlist(value, matcher.scorer, matcher.min_score,
+                                             lookup=lookup)
+        # matchers skip the None of removed choices, custom functions may not
+        return index.unique if isinstance(matcher, Matcher) else index.live_unique()
+
+    def cache_info(self) -> Union[CacheInfo, None]:
+        """ Returns the statistics of the fuzzy match cache
+
+        Returns
+        -------
+        Union[CacheInfo, None]
+            A tuple of (hits, misses, maxsize, currsize), or None if caching is disabled
+        """
+        return self._cache.info() if self._cache is not None else None
+
+    def stats(self) -> Union[dict, None]:
+        """ Returns a snapshot of the lookup statistics
+
+        Returns
+        -------
+        Union[dict, None]
+            See `~fuzzy_types.stats.MatchStats.snapshot`, or None if instrumentation
+            is disabled
+        """
+        return self._stats.snapshot() if self._stats is not None else None
+
+    def reset_stats(self) -> None:
+        """ Clears the lookup statistics """
+        if self._stats is not None:
+            self._stats.reset()
+
+    def _resolve(self, value: str, index: ChoiceIndex = None) -> int:
+        """ Returns the index position of the item best matching a string
+
+        Exact matches to a choice are looked up directly, unless ``exact_first``
+        is disabled.  Otherwise the string is fuzzy-matched against the unique
+        choices, and the best choice mapped back to the position of its first
+        occurrence.  When ``ngram_candidates`` is set, only a shortlist of the
+        choices is fuzzy-matched.  When caching is enabled, the fuzzy match result,
+        or its failure, is memoized until the object is next mutated.  With a
+        normalizer, the string is normalized first, and matched against the
+        normalized choices.
+
+        Parameters
+        ----------
+        value : str
+            The string to match on
+        index : ChoiceIndex
+            The choices index snapshot to match against.  By default, the current one.
+
+        Returns
+        -------
+        int
+            The position of the matched item in the choices index
+
+        Raises
+        ------
+        ValueError
+            when no single best match can be found
+        """
+        stats = self._stats
+        if stats is None:
+            return self._match(value, index=index)
+
+        with stats.lookup(value) as lookup:
+            return self._match(value, lookup=lookup, index=index)
+
+    def _match(self, value: str, lookup: Lookup = None, index: ChoiceIndex = None) -> int:
+        """ Performs `_resolve`, filling in the lookup record when instrumented """
+        if index is None:
+            index = self._choice_index
+        query = value if self._normalizer is None else self._normalizer(value)
+        if self._exact_first is True:
+            position = index.exact(query, key=value, ties=self._ties)
+            if position is not None:
+                if lookup is not None:
+                    lookup.outcome = 'exact'
+                return position
+
+        # cached results are tagged with their index snapshot and its number of changes,
+        # since a lookup racing a mutation may store its result after the cache is cleared
+        cache = self._cache
+        if cache is not None:
+            version = index.changes
+            snapshot, changes, position = cache.get(value, (None, None, None))
+            if snapshot is not index or changes != version:
+                position = None
+            if lookup is not None:
+                lookup.cached = position is not None
+            if isinstance(position, ValueError):
+                # raise a fresh error, so tracebacks don't pile up on the cached one
+                raise position.__class__(*position.args)
+            elif position is not None:
+                return position
+
+        try:
+            best = self._best(index, query, lookup=lookup)
+            position = index.exact(best, key=value, ties=self._ties)
+            if position is None:
+                # the best choice is not in the index, e.g. a custom matcher's
+                raise _no_match(value)
+        except ValueError as error:
+            if cache is not None:
+                cache.put(value, (index, version, error))
+            raise
+
+        if cache is not None:
+            cache.put(value, (index, version, position))
+        return position
+
+    def _best(self, index: ChoiceIndex, query: str, lookup: Lookup = None) -> str:
+        """ Returns the choice best fuzzy-matching a (normalized) string
+
+        Parameters
+        ----------
+        index : ChoiceIndex
+            The choices index to match against
+        query : str
+            The string to match on, normalized if the object has a normalizer
+        lookup : Lookup
+            The lookup record to fill in when instrumented
+
+        Returns
+        -------
+        str
+            The best matching choice, or its normalized form
+
+        Raises
+        ------
+        ValueError
+            when no single best match can be found
+        """
+        candidates = self._candidates(index, query, lookup=lookup)
+        if lookup is not None:
+            lookup.candidates = len(candidates)
+        return self.use_fuzzy(query, candidates)
+
     def __contains__(self, value: Union[str, int, object]) -> bool:
-        if not isinstance(value, six.string_types):
+        if not isinstance(value, str):
             return super(FuzzyBase, self).__contains__(value)
 
         try:
-            best = self.use_fuzzy(value, self.choices)
+            self._resolve(value)
         except ValueError:
-            best = None
+            return False
+        return True
+
+    @abc.abstractmethod
+    def _item(self, position: int, index: ChoiceIndex = None):
+        pass
+
+    def match_many(self, values: Iterable[str], errors: str = 'raise', workers: int = -1) -> list:
+        """ Fuzzy-matches many strings against the choices at once
+
+        Exact matches are looked up first, unless ``exact_first`` is disabled.  The
+        remaining strings are scored in a single batch using
+        `~fuzzy_types.matcher.Matcher.many`, which follows the same rules as single
+        lookups.  With a custom ``use_fuzzy`` function, each string is
+        matched one at a time instead, and the match score is None.
+
+        Parameters
+        ----------
+        values : Iterable[str]
+            The strings to match on
+        errors : str
+            How unresolved strings are returned.  Either ``raise`` to raise the error,
+            ``none`` to return None, or ``marker`` to return the error instance.
+        workers : int
+            The number of threads used for scoring.  By default, -1, for all cores.
+
+        Returns
+        -------
+        list
+            A `~fuzzy_types.utils.Match` record of (choice, score, index), or the
+            error policy result, per string.  The index is the position of the
+            matched item or key in the choices index.  For dictionaries, removed
+            keys leave gaps in the positions until the index is compacted.
+        """
+        assert errors in ('raise', 'none', 'marker'), 'invalid errors policy.'
+        return self._matches(list(values), errors, workers, self._choice_index)
+
+    def _matches(self, values: list, errors: str, workers: int, index: ChoiceIndex) -> list:
+        """ Performs `match_many` against a choices index snapshot, recording the batch """
+        if self._stats is None:
+            return self._match_many(values, errors, workers, index)
+
+        start = time.perf_counter()
+        try:
+            return self._match_many(values, errors, workers, index)
+        finally:
+            self._stats.record_batch(len(values), time.perf_counter() - start)
+
+    def _match_many(self, values: list, errors: str, workers: int, index: ChoiceIndex) -> list:
+        """ Performs `match_many` """
+        results = [None] * len(values)
+        raw_values = values
+        if self._normalizer is not None:
+            values = [self._normalizer(value) for value in values]
+
+        ties = self._ties
+        misses = []
+        for i, value in enumerate(values):
+            position = None
+            if self._exact_first is True:
+                try:
+                    position = index.exact(value, key=raw_values[i], ties=ties)
+                except ValueError as error:
+                    results[i] = handle_error(error, errors)
+                    continue
+            if position is None:
+                misses.append(i)
+            else:
+                results[i] = Match(index.choices[position], 100, position)
+
+        matcher = self.use_fuzzy
+        if isinstance(matcher, Matcher) and self._ngram_candidates > 0:
+            # each string has its own shortlist, so can't be scored in one batch
+            for i in misses:
+                try:
+                    best = matcher(values[i], self._candidates(index, values[i]),
+                                   return_score=True)
+                    position = index.exact(best[0], key=raw_values[i], ties=ties)
+                except (ValueError, AssertionError) as error:
+                    results[i] = handle_error(error, errors)
+                else:
+                    if position is None:
+                        results[i] = handle_error(_no_match(raw_values[i]), errors)
+                    else:
+                        results[i] = Match(index.choices[position], best[1], position)
+        elif isinstance(matcher, Matcher):
+            matches = matcher.many([values[i] for i in misses], index.live_unique(),
+                                   workers=workers, errors=errors)
+            for i, match in zip(misses, matches):
+                if isinstance(match, Match):
+                    try:
+                        position = index.exact(match.choice, key=raw_values[i], ties=ties)
+                    except ValueError as error:
+                        results[i] = handle_error(error, errors)
+                        continue
+                    if position is None:
+                        match = handle_error(_no_match(raw_values[i]), errors)
+                    else:
+                        match = Match(index.choices[position], match.score, position)
+                results[i] = match
+        else:
+            for i in misses:
+                try:
+                    position = self._match(raw_values[i], index=index)
+                except (ValueError, AssertionError) as error:
+                    results[i] = handle_error(error, errors)
+                else:
+                    results[i] = Match(index.choices[position], None, position)
+
+        return results
+
+    def get_many(self, values: Iterable[str], errors: str = 'raise', workers: int = -1) -> list:
+        """ Returns the items or values best matching many strings at once
+
+        See `match_many` for how the strings are matched.
+
+        Parameters
+        ----------
+        values : Iterable[str]
+            The strings to match on
+        errors : str
+            How unresolved strings are returned.  Either ``raise`` to raise the error,
+            ``none`` to return None, or ``marker`` to return the error instance.
+        workers : int
+            The number of threads used for scoring.  By default, -1, for all cores.
+
+        Returns
+        -------
+        list
+            The matched list item or dictionary value, or the error policy result, per string
+        """
+        assert errors in ('raise', 'none', 'marker'), 'invalid errors policy.'
+        index = self._choice_index
+        matches = self._matches(list(values), errors, workers, index)
+        return [self._item(match.index, index) if isinstance(match, Match) else match
+                for match in matches]
+
+    def join(self, other: Iterable, one_to_one: bool = False, candidates: int = 3,
+             unmatched: bool = False, workers: int = -1) -> list:
+        """ Fuzzy-matches each item or key of another collection to an item or key of this object
 
-        return best in self.choices
+        See :func:`fuzzy_types.join.fuzzy_join`, with this object as the right collection.
+
+        Parameters
+        ----------
+        other : Iterable
+            The strings or items to match, or a fuzzy object
+        one_to_one : bool
+            If True, matches each item or key of this object at most once.  Default is False.
+        candidates : int
+            The number of best choices of each item considered by a one-to-one join.
+            By default, 3.
+        unmatched : bool
+            If True, also returns the unmatched items, paired with None.  Default is False.
+        workers : int
+            The number of threads used for scoring.  By default, -1, for all cores.
+
+        Returns
+        -------
+        list
+            A `~fuzzy_types.join.Pair` of (other item, item or key, score) per matched item
+        """
+        from fuzzy_types.join import fuzzy_join
+
+        return fuzzy_join(other, self, one_to_one=one_to_one, candidates=candidates,
+                          unmatched=unmatched, workers=workers)
+
+    def match_stream(self, source: Union[Iterable[str], str, os.PathLike], batch_size: int = 1024,
+                     processes: int = 0, errors: str = 'none', workers: int = -1) -> Iterator:
+        """ Lazily fuzzy-matches a stream of strings, in batches
+
+        See :func:`fuzzy_types.stream.match_stream`.
+
+        Parameters
+        ----------
+        source : Union[Iterable[str], str, os.PathLike]
+            An iterable of strings, or the path of a text file with one string per line
+        batch_size : int
+            The number of strings matched per batch.  By default, 1024.
+        processes : int
+            The number of worker processes.  By default, 0, to match in this process.
+        errors : str
+            How unresolved strings are returned.  Either ``raise`` to raise the error,
+            ``none`` to yield a record with no match, or ``marker`` to yield the error
+            instance as the match.  Default is ``none``.
+        workers : int
+            The number of threads used for scoring each batch.  By default, -1, for all cores.
+
+        Returns
+        -------
+        Iterator
+            A `~fuzzy_types.stream.Record` of (input, match, score, value) per string, in order
+        """
+        from fuzzy_types.stream import match_stream
+
+        return match_stream(self, source, batch_size=batch_size, processes=processes,
+                            errors=errors, workers=workers)
+
+    def find_near_duplicates(self, threshold: Union[int, float] = 90, exhaustive: bool = None,
+                             workers: int = -1) -> list:
+        """ Finds the pairs of items or keys whose search strings score at least ``threshold``
+
+        See :func:`fuzzy_types.cluster.find_near_duplicates`.
+
+        Parameters
+        ----------
+        threshold : Union[int, float]
+            The minimum score of a near-duplicate pair.  By default, 90.
+        exhaustive : bool
+            If True, scores all pairs, and if False, only the n-gram blocked ones.  By
+            default, chosen from the number of choices.
+        workers : int
+            The number of threads used for scoring.  By default, -1, for all cores.
+
+        Returns
+        -------
+        list
+            A `~fuzzy_types.cluster.NearDuplicate` of (key, other, score) per pair
+        """
+        from fuzzy_types.cluster import find_near_duplicates
+
+        return find_near_duplicates(self, threshold=threshold, exhaustive=exhaustive,
+                                    workers=workers)
+
+    def cluster(self, threshold: Union[int, float] = 90, exhaustive: bool = None,
+                workers: int = -1) -> list:
+        """ Groups the near-duplicate items or keys
+
+        See :func:`fuzzy_types.cluster.cluster`.
+
+        Parameters
+        ----------
+        threshold : Union[int, float]
+            The minimum score of a near-duplicate pair.  By default, 90.
+        exhaustive : bool
+            If True, scores all pairs, and if False, only the n-gram blocked ones.  By
+            default, chosen from the number of choices.
+        workers : int
+            The number of threads used for scoring.  By default, -1, for all cores.
+
+        Returns
+        -------
+        list
+            The groups of two or more near-duplicate items or keys
+        """
+        from fuzzy_types.cluster import cluster
+
+        return cluster(self, threshold=threshold, exhaustive=exhaustive, workers=workers)
+
+    def ambiguity_report(self, exhaustive: bool = None, workers: int = -1) -> list:
+        """ Reports the pairs of items or keys that can make lookups ambiguous
+
+        Lists the pairs of choices scoring at least the current cutoff of the
+        matcher against each other, so that strings close to either can also match
+        the other, and tie with it.  Pairs with a score of 100, e.g. keys with the
+        same search string, tie on every string matching them, and come first.
+
+        Parameters
+        ----------
+        exhaustive : bool
+            If True, scores all pairs, and if False, only the n-gram blocked ones.  By
+            default, chosen from the number of choices.
+        workers : int
+            The number of threads used for scoring.  By default, -1, for all cores.
+
+        Returns
+        -------
+        list
+            A `~fuzzy_types.cluster.NearDuplicate` of (key, other, score) per pair,
+            from the highest score down
+        """
+        assert isinstance(self.use_fuzzy, Matcher), 'the report needs a Matcher as use_fuzzy.'
+        # without a cutoff, all pairs scoring above 0 are reported
+        return self.find_near_duplicates(threshold=max(self.use_fuzzy.min_score, 1),
+                                         exhaustive=exhaustive, workers=workers)
+
+    async def aget(self, value: Union[str, int, object]):
+        """ Returns the item or value best matching a string, without blocking the event loop
+
+        Exact matches are looked up directly.  Otherwise, the string is fuzzy-matched
+        in the executor of `~fuzzy_types.aio.get_executor`, in a batch with any other
+        strings looked up within the ``fuzzy_async_window`` config time, and
+        concurrent lookups of the same string share one match.  See
+        `~fuzzy_types.aio.Batcher`.
+
+        Parameters
+        ----------
+        value : Union[str, int, object]
+            The string to match on.  Other values are looked up as with ``[]``.
+
+        Returns
+        -------
+            The matched list item or dictionary value
+
+        Raises
+        ------
+        ValueError
+            when no single best match can be found
+        """
+        if not isinstance(value, str):
+            return self[value]
+
+        from fuzzy_types.aio import get_batcher
+
+        index, match = await get_batcher(self).submit(value)
+        if isinstance(match, Exception):
+            raise match.__class__(*match.args)
+        return self._item(match.index, index)
+
+    async def aget_many(self, values: Iterable[str], errors: str = 'raise') -> list:
+        """ Returns the items or values best matching many strings, without blocking the event loop
+
+        The strings are matched as with `aget`, in one batch.
+
+        Parameters
+        ----------
+        values : Iterable[str]
+            The strings to match on
+        errors : str
+            How unresolved strings are returned.  Either ``raise`` to raise the error,
+            ``none`` to return None, or ``marker`` to return the error instance.
+
+        Returns
+        -------
+        list
+            The matched list item or dictionary value, or the error policy result, per string
+        """
+        assert errors in ('raise', 'none', 'marker'), 'invalid errors policy.'
+        import asyncio
+        from fuzzy_types.aio import get_batcher
+
+        batcher = get_batcher(self)
+        matches = await asyncio.gather(*[batcher.submit(value) for value in values])
+        return [handle_error(match.__class__(*match.args), errors) if isinstance(match, Exception)
+                else self._item(match.index, index) for index, match in matches]
+
+    def save_index(self, path: Union[str, os.PathLike], fingerprint: str = None) -> None:
+        """ Saves the choices index to a binary file
+
+        See :func:`fuzzy_types.storage.save_index`.
+
+        Parameters
+        ----------
+        path : Union[str, os.PathLike]
+            The path of the index file
+        fingerprint : str
+            An optional identifier of the source data, checked when the file is loaded
+        """
+        save_index(self, path, fingerprint=fingerprint)
+
+    @classmethod
+    def from_index(cls, path: Union[str, os.PathLike], store: Mapping = None,
+                   verify: bool = True, fingerprint: str = None, **kwargs) -> AF:
+        """ Creates a fuzzy object from an index file saved with `save_index`
+
+        The choices and acceleration indexes are read from the memory-mapped file
+        instead of being recomputed.  The file must be saved from the same fuzzy
+        class, or one with the same ``mapper``, and with the same ``normalize`` steps.
+
+        Parameters
+        ----------
+        path : Union[str, os.PathLike]
+            The path of the index file
+        store : Mapping
+            For dictionaries, a mapping from each key to its value, e.g. a dict or
+            a ``shelve``.  If None, all values are None.
+        verify : bool
+            If True, checks the file checksum.  Default is True.
+        fingerprint : str
+            If given, the source data identifier the file must have been saved with
+        kwargs
+            Any other keyword arguments used to initialize the fuzzy object
+
+        Returns
+        -------
+        Union[FuzzyList, FuzzyDict, FuzzyOrderedDict]
+            A new fuzzy object
+
+        Raises
+        ------
+        IndexFileError
+            when the file is invalid, corrupt, stale or saved from another class
+        """
+        index_file = load_index(path, verify=verify, fingerprint=fingerprint)
+        keys = index_file.keys
+        if issubclass(cls, dict):
+            items = dict.fromkeys(keys) if store is None else {key: store[key] for key in keys}
+        else:
+            items = keys
+        fuzzy = cls(items, **kwargs)
+        index_file.check(cls, normalizer=fuzzy._normalizer)
+        fuzzy._index = index_file.choice_index(keys)
+        return fuzzy
 
     def copy(self) -> AF:
         """ Returns a copy of the fuzzy instance
@@ -103,33 +800,194 @@ class FuzzyBase(abc.ABC):
             kopied = dict(self)
         else:
             kopied = self._base.copy(self)
-        return self.__class__(kopied, use_fuzzy=self.use_fuzzy, dottable=self._dottable)
+        return self.__class__(kopied, **self._settings())
+
+    def to_original(self, deep: bool = False) -> Union[list, dict]:
+        """ Convert fuzzy object back to original Python datatype
+
+        Parameters
+        ----------
+        deep : bool
+            If True, also converts any nested fuzzy objects.  Nested dictionaries
+            never wrapped by a lazy fuzzy dictionary are returned as is, without
+            copying.  Default is False.
+
+        Returns
+        -------
+        Union[list, dict]
+            The original Python list or dictionary
+        """
+        if deep is False:
+            return self._base(self)
 
-    def to_original(self) -> Union[list, dict]:
-        """ Convert fuzzy object back to original Python datatype """
-        return self._base(self)
+        def unwrap(item):
+            return item.to_original(deep=True) if isinstance(item, FuzzyBase) else item
+
+        if isinstance(self, dict):
+            return self._base((key, unwrap(val)) for key, val in self._base.items(self))
+        return self._base(unwrap(item) for item in list.__iter__(self))
 
 
 class FuzzyBaseDict(FuzzyBase):
+    _lazy = False
+    # also while unpickling, where items are set before the attributes
+    _unwrapped = frozenset()
+
+    def __init__(self, the_dict: dict, use_fuzzy: Callable = None, dottable: bool = True,
+                 lazy: bool = False, **kwargs):
+        self._lazy = lazy
+        # the keys of the nested dictionaries not made fuzzy yet, when lazy
+        self._unwrapped = set()
+        super(FuzzyBaseDict, self).__init__(the_dict, use_fuzzy=use_fuzzy, dottable=dottable,
+                                            **kwargs)
+        if lazy is True:
+            self._unwrapped.update(key for key, val in the_dict.items() if isinstance(val, dict))
+            return
 
-    def __init__(self, the_dict: dict, use_fuzzy: Callable = None, dottable: bool = True):
-        super(FuzzyBaseDict, self).__init__(the_dict, use_fuzzy=use_fuzzy, dottable=dottable)
         # in case a value is another dictionary; also make it fuzzy
         for key, val in the_dict.items():
             if isinstance(val, dict):
-                self[key] = self.__class__(val)
+                self[key] = self.__class__(val, **self._settings())
+
+    def _settings(self) -> dict:
+        settings = super(FuzzyBaseDict, self)._settings()
+        settings['lazy'] = self._lazy
+        return settings
+
+    def _wrap(self, key, value):
+        """ Returns the value of a key, making a nested dictionary fuzzy on first access when lazy
+
+        Lazy objects return the same values as eager ones, from every method.
+        """
+        if key not in self._unwrapped:
+            return value
+        with self._lock:
+            value = self._base.__getitem__(self, key)
+            if key in self._unwrapped:
+                value = self.__class__(value, **self._settings())
+                # only the value changes, so the choices are untouched
+                self._base.__setitem__(self, key, value)
+                self._unwrapped.discard(key)
+        return value
+
+    def _wrap_all(self) -> None:
+        """ Makes all nested dictionaries fuzzy, e.g. before iterating over the values """
+        for key in list(self._unwrapped):
+            self._wrap(key, None)
+
+    def _forget(self, key) -> None:
+        """ Drops a key whose nested dictionary is replaced or removed before it was made fuzzy """
+        if key in self._unwrapped:
+            self._unwrapped.discard(key)
+
+    def _removed(self, key, value):
+        """ Returns the value of a removed key, made fuzzy if it was a nested dictionary """
+        if key in self._unwrapped:
+            self._unwrapped.discard(key)
+            value = self.__class__(value, **self._settings())
+        return value
 
     def __getitem__(self, value: Union[int, str]):
-        if not isinstance(value, six.string_types):
+        if not isinstance(value, str):
             return self.get(value)
 
-        best = self.use_fuzzy(value, self.choices)
-        return self._base.__getitem__(self, best)
+        # match and read the key from the same index snapshot
+        index = self._choice_index
+        return self._item(self._resolve(value, index), index)
+
+    def _item(self, position: int, index: ChoiceIndex = None):
+        if index is None:
+            index = self._choice_index
+        key = index.keys[position]
+        if key is TOMBSTONE:
+            # the key was removed while the lookup ran
+            raise KeyError(index.choices[position])
+        return self._wrap(key, self._base.__getitem__(self, key))
+
+    def get(self, key, default=None):
+        if not self._base.__contains__(self, key):
+            return default
+        return self._wrap(key, self._base.__getitem__(self, key))
+
+    def values(self):
+        self._wrap_all()
+        return self._base.values(self)
+
+    def items(self):
+        self._wrap_all()
+        return self._base.items(self)
+
+    def __setitem__(self, key, value) -> None:
+        # updating the value of an existing key leaves the choices untouched
+        if self._base.__contains__(self, key) and key not in self._unwrapped:
+            self._base.__setitem__(self, key, value)
+            return
+        with self._lock:
+            added = not self._base.__contains__(self, key)
+            self._base.__setitem__(self, key, value)
+            self._forget(key)
+            if added:
+                self._update_index(added=(key,))
+
+    def __delitem__(self, key) -> None:
+        with self._lock:
+            self._base.__delitem__(self, key)
+            self._forget(key)
+            self._update_index(removed=(key,))
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwargs) -> None:
+        with self._lock:
+            items = dict(*args, **kwargs)
+            added = [key for key in items if not self._base.__contains__(self, key)]
+            # set one by one, as OrderedDict.update would call our __setitem__
+            for key, value in items.items():
+                self._base.__setitem__(self, key, value)
+                self._forget(key)
+            self._update_index(added=added)
+
+    def pop(self, key, *args):
+        with self._lock:
+            if not self._base.__contains__(self, key):
+                # the default, or a KeyError
+                return self._base.pop(self, key, *args)
+            value = self._removed(key, self._base.pop(self, key))
+            self._update_index(removed=(key,))
+        return value
+
+    def popitem(self, *args, **kwargs) -> tuple:
+        with self._lock:
+            key, value = self._base.popitem(self, *args, **kwargs)
+            value = self._removed(key, value)
+            self._update_index(removed=(key,))
+        return key, value
+
+    def setdefault(self, key, default=None):
+        if self._base.__contains__(self, key):
+            return self._wrap(key, self._base.setdefault(self, key, default))
+        with self._lock:
+            if not self._base.__contains__(self, key):
+                self._base.__setitem__(self, key, default)
+                self._update_index(added=(key,))
+            value = self._wrap(key, self._base.__getitem__(self, key))
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._base.clear(self)
+            self._unwrapped = set()
+            self._reset_index()
+
+    def _iter_keys(self) -> Iterable:
+        return self._base.keys(self)
 
     def __dir__(self) -> list:
         members = super(FuzzyBaseDict, self).__dir__()
         if self._dottable is True:
-            members.extend(self.choices)
+            members.extend(self._choice_index.live_choices())
         return members
 
     @property
@@ -139,14 +997,15 @@ class FuzzyBaseDict(FuzzyBase):
         The list of choices passes into ``rapidfuzz`` to use 
         for fuzzy-matching a string.  The list of choices is computed
         by iterating over the dictionary keys, passing each item through
-        the `~FuzzyBase.mapper` method. 
+        the `~FuzzyBase.mapper` method.  The choices are cached, and only
+        updated for the keys added or removed.
 
         Returns
         -------
         list
             The list of options used by ``rapidfuzz`` when fuzzy matching
         """
-        return [self.mapper(i) for i in self.keys()]
+        return self._choice_index.live_choices()
 
 
 class FuzzyDict(FuzzyBaseDict, dict):
@@ -158,9 +1017,39 @@ class FuzzyDict(FuzzyBaseDict, dict):
         A dictionary of items to make fuzzy
     use_fuzzy : Callable 
         The function used to perform the fuzzy-matching.
-        Default is :func:`fuzzy_types.utils.get_best_fuzzy`.
+        Default is a `~fuzzy_types.matcher.Matcher` following the config.
     dottable : bool
         If False, turns off dottable attributes.  Default is True.
+    exact_first : bool
+        If True, strings exactly matching a choice are returned directly without
+        fuzzy-matching.  Default is True.
+    cache_size : int
+        The maximum number of fuzzy match results to memoize.  Default is the
+        ``fuzzy_cache_size`` config value, 0, which disables caching.
+    ngram_candidates : int
+        If positive, only this many choices, shortlisted by their character n-gram
+        overlap, are fuzzy-matched per lookup.  Larger values improve recall at the
+        cost of speed.  Default is 0, which matches against all choices.
+    prefilter : bool
+        If True, skips choices that provably cannot reach the score cutoff before
+        fuzzy-matching large objects.  Default is True.
+    instrument : Union[bool, MatchStats]
+        If True, records lookup statistics, returned by ``stats``.  Pass a
+        `~fuzzy_types.stats.MatchStats` to share statistics or add sinks.  Default
+        is False.
+    normalize : Union[str, Callable, Iterable, Normalizer]
+        The normalization steps applied once to each choice, and to each search
+        string, e.g. ``['casefold', 'accents']``.  See
+        `~fuzzy_types.normalize.Normalizer`.  Default is the ``fuzzy_normalize``
+        config value, i.e. none.
+    concurrent : bool
+        If True, each mutation that cannot update the choices index in place builds
+        a new snapshot and swaps it in, so lookups from other threads keep using the
+        previous snapshot instead of waiting for a rebuild.  Default is False, which
+        rebuilds on the next lookup.
+    lazy : bool
+        If True, nested dictionaries are only made fuzzy when first accessed,
+        instead of on initialization, with the same results.  Default is False.
 
     Returns
     -------
@@ -178,9 +1067,39 @@ class FuzzyOrderedDict(FuzzyBaseDict, OrderedDict):
         A dictionary of items to make fuzzy
     use_fuzzy : Callable 
         The function used to perform the fuzzy-matching.
-        Default is :func:`fuzzy_types.utils.get_best_fuzzy`.
+        Default is a `~fuzzy_types.matcher.Matcher` following the config.
     dottable : bool
         If False, turns off dottable attributes.  Default is True.
+    exact_first : bool
+        If True, strings exactly matching a choice are returned directly without
+        fuzzy-matching.  Default is True.
+    cache_size : int
+        The maximum number of fuzzy match results to memoize.  Default is the
+        ``fuzzy_cache_size`` config value, 0, which disables caching.
+    ngram_candidates : int
+        If positive, only this many choices, shortlisted by their character n-gram
+        overlap, are fuzzy-matched per lookup.  Larger values improve recall at the
+        cost of speed.  Default is 0, which matches against all choices.
+    prefilter : bool
+        If True, skips choices that provably cannot reach the score cutoff before
+        fuzzy-matching large objects.  Default is True.
+    instrument : Union[bool, MatchStats]
+        If True, records lookup statistics, returned by ``stats``.  Pass a
+        `~fuzzy_types.stats.MatchStats` to share statistics or add sinks.  Default
+        is False.
+    normalize : Union[str, Callable, Iterable, Normalizer]
+        The normalization steps applied once to each choice, and to each search
+        string, e.g. ``['casefold', 'accents']``.  See
+        `~fuzzy_types.normalize.Normalizer`.  Default is the ``fuzzy_normalize``
+        config value, i.e. none.
+    concurrent : bool
+        If True, each mutation that cannot update the choices index in place builds
+        a new snapshot and swaps it in, so lookups from other threads keep using the
+        previous snapshot instead of waiting for a rebuild.  Default is False, which
+        rebuilds on the next lookup.
+    lazy : bool
+        If True, nested dictionaries are only made fuzzy when first accessed,
+        instead of on initialization, with the same results.  Default is False.
 
     Returns
     -------
@@ -189,6 +1108,15 @@ class FuzzyOrderedDict(FuzzyBaseDict, OrderedDict):
     """
     _base = OrderedDict
 
+    def move_to_end(self, key, last: bool = True) -> None:
+        with self._lock:
+            self._base.move_to_end(self, key, last=last)
+            if last is True:
+                self._update_index(added=(key,), removed=(key,))
+            else:
+                # the choices keep the order of the keys
+                self._reset_index()
+
 
 class FuzzyList(FuzzyBase, list):
     """ A dottable python list that uses rapidfuzz to select a string item
@@ -199,9 +1127,36 @@ class FuzzyList(FuzzyBase, list):
         A list of items to make fuzzy
     use_fuzzy : Callable 
         The function used to perform the fuzzy-matching.
-        Default is :func:`fuzzy_types.utils.get_best_fuzzy`.
+        Default is a `~fuzzy_types.matcher.Matcher` following the config.
     dottable : bool
         If False, turns off dottable attributes.  Default is True.
+    exact_first : bool
+        If True, strings exactly matching a choice are returned directly without
+        fuzzy-matching.  Default is True.
+    cache_size : int
+        The maximum number of fuzzy match results to memoize.  Default is the
+        ``fuzzy_cache_size`` config value, 0, which disables caching.
+    ngram_candidates : int
+        If positive, only this many choices, shortlisted by their character n-gram
+        overlap, are fuzzy-matched per lookup.  Larger values improve recall at the
+        cost of speed.  Default is 0, which matches against all choices.
+    prefilter : bool
+        If True, skips choices that provably cannot reach the score cutoff before
+        fuzzy-matching large objects.  Default is True.
+    instrument : Union[bool, MatchStats]
+        If True, records lookup statistics, returned by ``stats``.  Pass a
+        `~fuzzy_types.stats.MatchStats` to share statistics or add sinks.  Default
+        is False.
+    normalize : Union[str, Callable, Iterable, Normalizer]
+        The normalization steps applied once to each choice, and to each search
+        string, e.g. ``['casefold', 'accents']``.  See
+        `~fuzzy_types.normalize.Normalizer`.  Default is the ``fuzzy_normalize``
+        config value, i.e. none.
+    concurrent : bool
+        If True, each mutation that cannot update the choices index in place builds
+        a new snapshot and swaps it in, so lookups from other threads keep using the
+        previous snapshot instead of waiting for a rebuild.  Default is False, which
+        rebuilds on the next lookup.
 
     Returns
     -------
@@ -217,50 +1172,243 @@ class FuzzyList(FuzzyBase, list):
         The list of choices passes into ``rapidfuzz`` to use 
         for fuzzy-matching a string.  The list of choices is computed
         by iterating over the list items, passing each item through
-        the `~FuzzyBase.mapper` method. 
+        the `~FuzzyBase.mapper` method.  The choices are cached, and only
+        updated after the list is modified.
 
         Returns
         -------
         list
             The list of options used by ``rapidfuzz`` when fuzzy matching
         """
-        return [self.mapper(item) for item in self]
+        return list(self._choice_index.choices)
 
     def __getitem__(self, value):
-        if not isinstance(value, six.string_types):
+        if not isinstance(value, str):
             return list.__getitem__(self, value)
 
-        best = self.use_fuzzy(value, self.choices)
-        return self[self.choices.index(best)]
+        index = self._choice_index
+        return self._item(self._resolve(value, index), index)
+
+    def _item(self, position: int, index: ChoiceIndex = None):
+        if index is None:
+            index = self._choice_index
+        return index.keys[position]
+
+    def __setitem__(self, index, value) -> None:
+        with self._lock:
+            list.__setitem__(self, index, value)
+            self._reset_index()
+
+    def __delitem__(self, index) -> None:
+        with self._lock:
+            last = self._is_last(index)
+            list.__delitem__(self, index)
+            if last:
+                self._update_index(truncated=1)
+            else:
+                self._reset_index()
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def __imul__(self, other: int):
+        with self._lock:
+            list.__imul__(self, other)
+            self._reset_index()
+        return self
+
+    def append(self, item) -> None:
+        with self._lock:
+            list.append(self, item)
+            self._update_index(added=(item,))
+
+    def extend(self, items: Iterable) -> None:
+        with self._lock:
+            items = list(items)
+            list.extend(self, items)
+            self._update_index(added=items)
+
+    def insert(self, index: int, item) -> None:
+        with self._lock:
+            end = index >= len(self)
+            list.insert(self, index, item)
+            if end:
+                self._update_index(added=(item,))
+            else:
+                self._reset_index()
+
+    def remove(self, item) -> None:
+        with self._lock:
+            list.remove(self, item)
+            self._reset_index()
+
+    def pop(self, *args):
+        with self._lock:
+            last = self._is_last(args[0] if args else -1)
+            item = list.pop(self, *args)
+            if last:
+                self._update_index(truncated=1)
+            else:
+                self._reset_index()
+        return item
+
+    def clear(self) -> None:
+        with self._lock:
+            list.clear(self)
+            self._reset_index()
+
+    def sort(self, *args, **kwargs) -> None:
+        with self._lock:
+            list.sort(self, *args, **kwargs)
+            self._reset_index()
+
+    def reverse(self) -> None:
+        with self._lock:
+            list.reverse(self)
+            self._reset_index()
+
+    def _is_last(self, index) -> bool:
+        """ Returns True if an index refers to the last item, which can be removed in place
+
+        Only the positions after the last item change, so the choices index is updated
+        in place, except when ``concurrent``, where lookups may still use the position.
+        """
+        size = len(self)
+        return (self._concurrent is False and isinstance(index, int) and size > 0 and
+                index in (-1, size - 1))
+
+    def _iter_keys(self) -> Iterable:
+        return list.__iter__(self)
 
     def __dir__(self) -> list:
         members = super(FuzzyList, self).__dir__()
         if self._dottable is True:
-            members.extend(self.choices)
+            members.extend(self._choice_index.choices)
         return members
 
 
 class FuzzyStr(str):
     """ A fuzzy string that uses rapidfuzz for equality checks
 
+    Equal strings, or strings with the same normalized form, are equal without
+    scoring.  Otherwise a string is equal when its score against this one reaches
+    the score cutoff of the `~fuzzy_types.matcher.Matcher`, in a single scorer
+    call.  Strings shorter than the matcher's minimum length are only equal when
+    exact.  Fuzzy strings store their settings in slots rather than a
+    ``__dict__``, and share one default matcher.
+
+    Fuzzy strings hash by their normalized form, or as plain strings without
+    a normalizer, so they can be dictionary keys or set members.  Hash-based
+    membership only finds strings with the same normalized form; to fuzzy-match
+    a string against many strings, use `matches_any`, or a
+    `~fuzzy_types.fuzzy.FuzzyDict`.
+
     Parameters
     ----------
     the_string : str
         A string to make fuzzy
     use_fuzzy : Callable
         The function used to perform the fuzzy-matching.
-        Default is :func:`fuzzy_types.utils.get_best_fuzzy`.
+        Default is a `~fuzzy_types.matcher.Matcher` following the config.
+    normalize : Union[str, Callable, Iterable, Normalizer]
+        The normalization steps applied to both strings before comparing them, e.g.
+        ``'casefold'``.  See `~fuzzy_types.normalize.Normalizer`.  Default is the
+        ``fuzzy_normalize`` config value, i.e. none.
     """
+    __slots__ = ('use_fuzzy', '_normalizer', '_form')
     _base = str
+    # shared by all fuzzy strings without their own matcher
+    _matcher = Matcher()
 
-    def __init__(self, the_string: str, use_fuzzy: Callable = None):
-        self.use_fuzzy = use_fuzzy or get_best_fuzzy
-        self._base.__init__(the_string)
+    def __new__(cls, the_string: str, use_fuzzy: Callable = None,
+                normalize: Union[str, Callable, Iterable, Normalizer] = None) -> FS:
+        self = str.__new__(cls, the_string)
+        if use_fuzzy is None or use_fuzzy is get_best_fuzzy:
+            use_fuzzy = cls._matcher
+        self.use_fuzzy = use_fuzzy
+        normalizer = get_normalizer(config.get('fuzzy_normalize') if normalize is None
+                                    else normalize)
+        self._normalizer = normalizer
+        self._form = str(self) if normalizer is None else normalizer(str(self))
+        return self
+
+    def __reduce__(self) -> tuple:
+        use_fuzzy = None if self.use_fuzzy is self._matcher else self.use_fuzzy
+        return (self.__class__, (str(self), use_fuzzy, self._normalizer or []))
+
+    def __hash__(self) -> int:
+        return hash(self._form)
 
     def __eq__(self, value: str) -> bool:
-        try:
-            self.use_fuzzy(value, [self])
-        except ValueError:
+        if not isinstance(value, str):
+            return NotImplemented
+
+        normalizer = self._normalizer
+        query = str(value) if normalizer is None else normalizer(str(value))
+        if query == self._form:
+            return True
+
+        matcher = self.use_fuzzy
+        if not isinstance(matcher, Matcher):
+            try:
+                matcher(query, [self._form])
+            except (ValueError, AssertionError):
+                return False
+            return True
+
+        if len(query) < matcher.min_length:
             return False
-        else:
+        min_score = matcher.min_score
+        return matcher.scorer(query, self._form, processor=matcher.processor,
+                              score_cutoff=min_score) >= min_score
+
+    def __ne__(self, value: str) -> bool:
+        equal = self.__eq__(value)
+        return equal if equal is NotImplemented else not equal
+
+    def matches_any(self, values: Iterable[str], workers: int = 1) -> bool:
+        """ Returns True if any of the strings is equal to this fuzzy string
+
+        Exact matches of the normalized forms are checked first.  The remaining
+        strings are then scored in one ``rapidfuzz.process.cdist`` call, with the
+        same rules as ``==``.  With a custom ``use_fuzzy`` function, the strings
+        are compared one at a time instead.
+
+        Parameters
+        ----------
+        values : Iterable[str]
+            The strings to compare with
+        workers : int
+            The number of threads used for scoring.  By default, 1.
+
+        Returns
+        -------
+        bool
+            True if any string is equal to this one
+        """
+        values = [str(value) for value in values]
+        normalizer = self._normalizer
+        queries = values
+        if normalizer is not None:
+            queries = [normalizer(query) for query in queries]
+        if self._form in queries:
             return True
+
+        matcher = self.use_fuzzy
+        if not isinstance(matcher, Matcher):
+            return any(self.__eq__(value) for value in values)
+
+        import numpy as np
+        from rapidfuzz import process
+
+        min_length = matcher.min_length
+        queries = [query for query in queries if len(query) >= min_length]
+        if not queries:
+            return False
+        min_score = matcher.min_score
+        # this string is the query, so is preprocessed once; the rapidfuzz ratios are symmetric
+        scores = process.cdist([self._form], queries, scorer=matcher.scorer,
+                               processor=matcher.processor, score_cutoff=min_score,
+                               dtype=np.float64, workers=workers)
+        return bool((scores >= min_score).any())
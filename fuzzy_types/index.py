@@ -0,0 +1,815 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: index.py
+# Project: fuzzy_types
+# Author: Brian Cherinka
+# Created: Friday, 16th October 2026 9:12:04 am
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Friday, 16th October 2026 9:12:04 am
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+from collections import defaultdict
+from typing import TYPE_CHECKING, Callable, Iterable, Sequence, Union
+
+from fuzzy_types.utils import _no_match
+
+if TYPE_CHECKING:
+    # numpy is only imported when an index is built, to keep the import fast
+    import numpy
+    from fuzzy_types.stats import Lookup
+
+__all__ = ['ChoiceIndex', 'NgramIndex', 'Prefilter', 'TOMBSTONE']
+
+
+class _Tombstone(object):
+    """ The key of a slot removed from a choices index """
+
+    def __repr__(self) -> str:
+        return '<tombstone>'
+
+    def __reduce__(self) -> str:
+        # unpickles to the same sentinel
+        return 'TOMBSTONE'
+
+
+TOMBSTONE = _Tombstone()
+
+
+def _same(key, other) -> bool:
+    """ Returns True if two keys sharing a choice are equal, e.g. repeated list items """
+    try:
+        return key is other or (type(key) is type(other) and bool(key == other))
+    except Exception:
+        # e.g. arrays, whose comparison is not a boolean
+        return False
+
+
+def _reserve(buffer: 'numpy.ndarray', array: 'numpy.ndarray', size: int) -> 'numpy.ndarray':
+    """ Returns a writable buffer starting with an array, with room for ``size`` elements
+
+    The buffer is reused when large enough, otherwise the array is copied into a
+    new buffer of twice its length, so appending is amortized constant time.
+    Read-only arrays, e.g. memory-mapped from an index file, are copied on first write.
+    """
+    import numpy as np
+
+    if buffer is not None and len(buffer) >= size:
+        return buffer
+    grown = np.empty(max(size, 2 * len(array), 16), dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+
+class ChoiceIndex(object):
+    """ A cached index of the choices used during fuzzy matching
+
+    Holds the list/dict items alongside their mapped string representations, so
+    the `~fuzzy_types.fuzzy.FuzzyBase.mapper` only runs once per item rather than
+    on every lookup.  Also holds a hash table from each choice to the position of
+    its first occurrence, for constant-time exact matches and for mapping a fuzzy
+    match back to its item, and the list of unique choices to score against.
+    Duplicate choices are only scored once, but the positions of each are kept, so
+    a match to a choice shared by distinct keys stays ambiguous, see `exact`.  The
+    fuzzy objects own an instance of this index.
+
+    With a normalizer, the choices are normalized once into search ``forms``,
+    which the hash table, the unique choices and the acceleration indexes are
+    built from instead.  Search strings must then be normalized the same way.
+
+    The index can be updated in place, in time proportional to the size of a
+    key: `add` appends a key, `discard` replaces the key of a removed slot by
+    `TOMBSTONE`, and `pop` removes the last slot.  Positions are never reused, so
+    a position found by a lookup keeps pointing at the same key.  Choices no
+    longer in use are replaced by None in the unique choices, and excluded from
+    the acceleration indexes.  The number of tombstones is kept in ``dead``, and
+    the number of in-place updates since the index was built in ``changes``.
+    Once `needs_compaction`, `compacted` returns a new index without them.
+
+    Parameters
+    ----------
+    keys : Iterable
+        The list items or dictionary keys to index
+    mapper : Callable
+        The function mapping each key to its string choice
+    choices : list
+        The precomputed choices of the keys, e.g. read from an index file.  If
+        given, the mapper is not used.
+    normalizer : Callable
+        The function normalizing each choice to its search form
+    forms : list
+        The precomputed search forms of the choices.  If given, the normalizer
+        is not used.
+    """
+
+    # compact after in-place updates reach this fraction of the slots, or this number
+    compact_fraction = 0.25
+    compact_min = 1000
+
+    def __init__(self, keys: Iterable, mapper: Callable, choices: list = None,
+                 normalizer: Callable = None, forms: list = None):
+        self.keys = list(keys)
+        self.choices = [mapper(key) for key in self.keys] if choices is None else choices
+        if forms is None:
+            forms = self.choices if normalizer is None else [normalizer(c) for c in self.choices]
+        self.forms = forms
+        # filled in reverse so the hash table points at the first occurrence of a form
+        size = len(forms)
+        self.lookup = dict(zip(reversed(forms), range(size - 1, -1, -1)))
+        # duplicate forms are scored once, and resolved by `exact` from their repeats
+        self.unique = list(dict.fromkeys(forms))
+        self.dead = 0
+        self.vacant = 0
+        self.changes = 0
+        self._ngrams = None
+        self._prefilter = None
+        # the positions of the forms occurring more than once, in order
+        self._repeats = {}
+        if len(self.unique) < size:
+            lookup = self.lookup
+            for slot, form in enumerate(forms):
+                first = lookup[form]
+                if first != slot:
+                    self._repeats.setdefault(form, [first]).append(slot)
+        # reverse maps for in-place updates, built on first use
+        self._places = None
+        self._slots = None
+
+    def __repr__(self) -> str:
+        return f'<ChoiceIndex(n_choices={len(self)})>'
+
+    def __len__(self) -> int:
+        return len(self.choices)
+
+    def exact(self, value: str, key: str = None, ties: str = 'raise') -> Union[int, None]:
+        """ Returns the position of the key whose choice matches a string exactly
+
+        When distinct keys share the choice, e.g. the dictionary keys ``1`` and
+        ``'1'``, or ``'Color'`` and ``'color'`` once casefolded, the position of
+        ``key`` is returned if it is one of them.  Otherwise the choice is
+        ambiguous, as the keys would tie if scored separately.  Equal keys, e.g.
+        repeated list items, resolve to the first one.
+
+        Parameters
+        ----------
+        value : str
+            The string, or normalized string, to look up
+        key : str
+            The string looked up, preferred when it is itself one of the keys
+        ties : str
+            Either ``raise`` to raise an `~fuzzy_types.utils.AmbiguousMatchError`
+            when distinct keys share the choice, or ``first`` to return the first.
+
+        Returns
+        -------
+        Union[int, None]
+            The position of the matching key, or None if there is no exact match
+
+        Raises
+        ------
+        AmbiguousMatchError
+            when distinct keys share the choice and ``ties`` is ``raise``
+        """
+        position = self.lookup.get(value)
+        repeats = self._repeats.get(value) if position is not None else None
+        if repeats is None:
+            return position
+
+        keys = self.keys
+        if key is not None:
+            for slot in repeats:
+                if isinstance(keys[slot], str) and keys[slot] == key:
+                    return slot
+        if ties == 'first' or all(_same(keys[slot], keys[position]) for slot in repeats):
+            return position
+        raise _no_match(value if key is None else key, ambiguous=True)
+
+    @property
+    def ngrams(self) -> 'NgramIndex':
+        """ An n-gram index over the unique choices, built on first use """
+        if self._ngrams is None:
+            self._ngrams = NgramIndex(self.unique)
+        return self._ngrams
+
+    @property
+    def prefilter(self) -> 'Prefilter':
+        """ A length and character prefilter over the unique choices, built on first use """
+        if self._prefilter is None:
+            self._prefilter = Prefilter(self.unique)
+        return self._prefilter
+
+    def live_choices(self) -> list:
+        """ Returns the choices of the keys not removed, in order """
+        if not self.dead:
+            return list(self.choices)
+        return [choice for key, choice in zip(self.keys, self.choices) if key is not TOMBSTONE]
+
+    def live_unique(self) -> list:
+        """ Returns the unique choices still in use, without the None left by removals """
+        if not self.vacant:
+            return self.unique
+        return [form for form in self.unique if form is not None]
+
+    @property
+    def needs_compaction(self) -> bool:
+        """ True when enough in-place updates have piled up to rebuild the index """
+        return self.changes > max(self.compact_min, self.compact_fraction * len(self))
+
+    def _prepare(self) -> None:
+        """ Builds the reverse map of the unique forms, on the first in-place update """
+        if self._places is None:
+            self._places = {form: place for place, form in enumerate(self.unique)}
+
+    def add(self, key, mapper: Callable, normalizer: Callable = None) -> int:
+        """ Appends a key to the index in place
+
+        Parameters
+        ----------
+        key : object
+            The list item or dictionary key to add
+        mapper : Callable
+            The function mapping the key to its string choice
+        normalizer : Callable
+            The function normalizing the choice to its search form
+
+        Returns
+        -------
+        int
+            The position of the key
+        """
+        choice = mapper(key)
+        form = choice if normalizer is None else normalizer(choice)
+        self._prepare()
+
+        # the slot is filled before the hash table points at it
+        slot = len(self.keys)
+        self.keys.append(key)
+        if self.forms is not self.choices:
+            self.forms.append(form)
+        self.choices.append(choice)
+        if self._slots is not None:
+            self._slots[key] = slot
+
+        first = self.lookup.get(form)
+        if first is not None:
+            self._repeats.setdefault(form, [first]).append(slot)
+        else:
+            place = len(self.unique)
+            self._places[form] = place
+            self.unique.append(form)
+            if self._prefilter is not None:
+                self._prefilter.append(form)
+            if self._ngrams is not None:
+                self._ngrams.append(form)
+            self.lookup[form] = slot
+        self.changes += 1
+        return slot
+
+    def discard(self, key) -> None:
+        """ Removes a dictionary key from the index in place, leaving a tombstone
+
+        Parameters
+        ----------
+        key : object
+            The dictionary key to remove
+
+        Raises
+        ------
+        KeyError
+            when the key is not in the index
+        """
+        self._prepare()
+        if self._slots is None:
+            self._slots = {key: slot for slot, key in enumerate(self.keys)
+                           if key is not TOMBSTONE}
+        slot = self._slots.pop(key)
+        self._release(slot)
+        self.keys[slot] = TOMBSTONE
+        self.choices[slot] = None
+        if self.forms is not self.choices:
+            self.forms[slot] = None
+        self.dead += 1
+        self.changes += 1
+
+    def pop(self) -> None:
+        """ Removes the last slot of the index in place, e.g. for the last list item """
+        self._prepare()
+        slot = len(self.keys) - 1
+        self._release(slot)
+        key = self.keys.pop()
+        if self.forms is not self.choices:
+            self.forms.pop()
+        self.choices.pop()
+        if key is TOMBSTONE:
+            self.dead -= 1
+        elif self._slots is not None:
+            del self._slots[key]
+        self.changes += 1
+
+    def _release(self, slot: int) -> None:
+        """ Points the hash table past a removed slot, or vacates its unique choice """
+        if self.keys[slot] is TOMBSTONE:
+            return
+
+        form = self.forms[slot]
+        repeats = self._repeats.get(form)
+        if repeats is not None:
+            repeats.remove(slot)
+            if len(repeats) == 1:
+                del self._repeats[form]
+            self.lookup[form] = repeats[0]
+            return
+
+        del self.lookup[form]
+        place = self._places.pop(form)
+        self.unique[place] = None
+        self.vacant += 1
+        if self._prefilter is not None:
+            self._prefilter.discard(place)
+        if self._ngrams is not None:
+            self._ngrams.discard(place)
+
+    def copy(self) -> 'ChoiceIndex':
+        """ Returns a copy of the index, to update in place without changing this one
+
+        The lists and hash tables are copied, and the arrays of the acceleration
+        indexes shared until either copy is next updated.
+
+        Returns
+        -------
+        ChoiceIndex
+            A copy of this index
+        """
+        index = ChoiceIndex.__new__(ChoiceIndex)
+        index.__dict__.update(self.__dict__)
+        index.keys = list(self.keys)
+        index.choices = list(self.choices)
+        index.forms = index.choices if self.forms is self.choices else list(self.forms)
+        index.lookup = dict(self.lookup)
+        index.unique = list(self.unique)
+        index._repeats = {form: list(slots) for form, slots in self._repeats.items()}
+        if self._places is not None:
+            index._places = dict(self._places)
+        if self._slots is not None:
+            index._slots = dict(self._slots)
+        if self._ngrams is not None:
+            index._ngrams = self._ngrams.copy(index.unique)
+        if self._prefilter is not None:
+            index._prefilter = self._prefilter.copy(index.unique)
+        return index
+
+    def compacted(self) -> 'ChoiceIndex':
+        """ Returns a new index of the keys not removed
+
+        The choices and search forms are reused rather than recomputed.  An
+        n-gram index is rebuilt if this index has one; the prefilter is built on
+        first use.
+
+        Returns
+        -------
+        ChoiceIndex
+            A new index without tombstones or in-place updates
+        """
+        keys, choices, forms = self.keys, self.choices, self.forms
+        if self.dead:
+            live = [slot for slot, key in enumerate(keys) if key is not TOMBSTONE]
+            keys = [keys[slot] for slot in live]
+            forms = None if forms is choices else [forms[slot] for slot in live]
+            choices = [choices[slot] for slot in live]
+        else:
+            forms = None if forms is choices else list(forms)
+            choices = list(choices)
+        index = ChoiceIndex(keys, None, choices=choices,
+                            forms=choices if forms is None else forms)
+        if self._ngrams is not None:
+            index._ngrams = NgramIndex(index.unique, n=self._ngrams.n)
+        return index
+
+
+class NgramIndex(object):
+    """ An inverted index of character n-grams, for shortlisting fuzzy candidates
+
+    Maps each character n-gram to the choices containing it.  A string is compared
+    against the choices by the overlap of their n-grams, with a Dice coefficient,
+    which is cheap to compute for every choice at once.  Only the best overlapping
+    choices are then passed on to the much slower ``rapidfuzz`` scorer.  The
+    shortlist is approximate; a larger shortlist trades speed for recall.
+
+    Choices appended to, or replaced by None in, the list of choices are indexed
+    in place with `append` and `discard`.  The postings of appended choices are
+    kept in ``extra`` lists, merged when the index is rebuilt.
+
+    Parameters
+    ----------
+    choices : Sequence
+        The list of string choices to index
+    n : int
+        The n-gram size.  By default, 3.
+    postings : dict
+        The precomputed n-gram postings, e.g. read from an index file
+    sizes : numpy.ndarray
+        The precomputed number of n-grams of each choice, given with the postings
+    """
+
+    def __init__(self, choices: Sequence, n: int = 3, postings: dict = None,
+                 sizes: 'numpy.ndarray' = None):
+        import numpy as np
+
+        self.n = n
+        self.choices = choices
+        self.extra = {}
+        self._buffer = None
+        if postings is not None:
+            self.postings = postings
+            self.sizes = sizes
+            return
+
+        postings = defaultdict(list)
+        sizes = []
+        for idx, choice in enumerate(choices):
+            grams = self.grams(choice)
+            sizes.append(len(grams))
+            for gram in grams:
+                postings[gram].append(idx)
+
+        self.sizes = np.array(sizes, dtype=np.int32)
+        self.postings = {gram: np.array(ids, dtype=np.int32) for gram, ids in postings.items()}
+
+    def __repr__(self) -> str:
+        return f'<NgramIndex(n={self.n}, n_grams={len(self.postings)})>'
+
+    def grams(self, value: str) -> set:
+        """ Returns the set of n-grams in a string, padded at both ends
+
+        Parameters
+        ----------
+        value : str
+            The string to split into n-grams
+
+        Returns
+        -------
+        set
+            The unique n-grams of the string
+        """
+        padded = f' {value} '
+        if len(padded) <= self.n:
+            return {padded}
+        return {padded[i:i + self.n] for i in range(len(padded) - self.n + 1)}
+
+    def candidates(self, value: str, limit: int) -> list:
+        """ Returns the positions of the choices sharing the most n-grams with a string
+
+        Parameters
+        ----------
+        value : str
+            The string to match on
+        limit : int
+            The maximum number of candidates to return
+
+        Returns
+        -------
+        list
+            The positions of the candidate choices, in no particular order
+        """
+        import numpy as np
+
+        grams = self.grams(value)
+        hits = [self.postings[gram] for gram in grams if gram in self.postings]
+        extra = self.extra
+        if extra:
+            hits.extend(np.array(extra[gram], dtype=np.int32) for gram in grams if gram in extra)
+        if not hits:
+            return []
+
+        overlap = np.bincount(np.concatenate(hits), minlength=len(self.choices))
+        found = np.flatnonzero(overlap)
+        if len(found) > limit:
+            # rank by the dice coefficient, so long choices aren't favoured; the sizes
+            # are read after the postings, since appended choices are sized first
+            dice = overlap[found] / (self.sizes[found] + len(grams))
+            found = found[np.argpartition(dice, -limit)[-limit:]]
+        return found.tolist()
+
+    def shortlist(self, value: str, limit: int) -> list:
+        """ Returns the choices sharing the most n-grams with a string
+
+        Parameters
+        ----------
+        value : str
+            The string to match on
+        limit : int
+            The maximum number of choices to return
+
+        Returns
+        -------
+        list
+            The candidate choices, in their original order
+        """
+        choices = self.choices
+        shortlist = [choices[idx] for idx in sorted(self.candidates(value, limit))]
+        return [choice for choice in shortlist if choice is not None]
+
+    def copy(self, choices: Sequence) -> 'NgramIndex':
+        """ Returns a copy over a copy of the choices, to update without changing this one """
+        index = NgramIndex(choices, n=self.n, postings=self.postings, sizes=self.sizes)
+        index.extra = {gram: list(ids) for gram, ids in self.extra.items()}
+        return index
+
+    def append(self, choice: str) -> None:
+        """ Indexes a choice appended to the list of choices
+
+        Parameters
+        ----------
+        choice : str
+            The new last choice
+        """
+        idx = len(self.sizes)
+        grams = self.grams(choice)
+        self._buffer = buffer = _reserve(self._buffer, self.sizes, idx + 1)
+        buffer[idx] = len(grams)
+        self.sizes = buffer[:idx + 1]
+        for gram in grams:
+            self.extra.setdefault(gram, []).append(idx)
+
+    def discard(self, position: int) -> None:
+        """ Ranks a choice replaced by None last, so it is only shortlisted to fill up
+
+        Parameters
+        ----------
+        position : int
+            The position of the removed choice
+        """
+        size = len(self.sizes)
+        self._buffer = buffer = _reserve(self._buffer, self.sizes, size)
+        buffer[position] = 2 ** 30
+        self.sizes = buffer[:size]
+
+
+def char_mask(value: str) -> int:
+    """ Returns a 64-bit mask of the characters in a string
+
+    Each character sets the bit of its code point modulo 64, so a character
+    missing from the mask is missing from the string.
+
+    Parameters
+    ----------
+    value : str
+        The string to mask
+
+    Returns
+    -------
+    int
+        The character bitmask
+    """
+    mask = 0
+    for char in set(value):
+        mask |= 1 << (ord(char) & 63)
+    return mask
+
+
+def popcount(masks: 'numpy.ndarray') -> 'numpy.ndarray':
+    """ Returns the number of set bits in each element of an array of uint64 masks """
+    import numpy as np
+
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(masks).astype(np.int64)
+    table = np.array([bin(i).count('1') for i in range(256)], dtype=np.int64)
+    return table[masks.view(np.uint8)].reshape(-1, 8).sum(axis=1)
+
+
+class Prefilter(object):
+    """ A prefilter skipping choices that provably cannot reach a score cutoff
+
+    Holds the length and a 64-bit character mask of each choice.  For a given
+    string, the characters missing from a choice, and the choice's characters
+    missing from the string, bound how many characters the two can share.  This
+    gives an upper bound on the best possible score for the scorers below,
+    computed for all choices at once.  Choices whose bound falls under the score
+    cutoff are skipped.  Scorers without a known bound are not filtered.
+
+    - ``ratio``, ``QRatio``: the normalized Indel similarity bound
+    - ``partial_ratio``: the ``ratio`` bound of the shorter string's characters found
+      in the longer one
+    - ``WRatio``: the ``ratio`` bound, or the largest scaled partial or token ratio
+      allowed by the length ratio, and zero for strings with no characters in common
+
+    The number of choices scanned and pruned are counted in the ``scanned`` and
+    ``pruned`` attributes, and per lookup in the statistics of instrumented
+    fuzzy objects, see `~fuzzy_types.stats.MatchStats.snapshot`.
+
+    Choices appended to, or replaced by None in, the list of choices are filtered
+    in place with `append` and `discard`.  Removed choices get an empty character
+    mask and an out-of-range length, which bound their ``ratio`` and ``WRatio``
+    scores near zero.
+
+    Parameters
+    ----------
+    choices : Sequence
+        The list of string choices to filter
+    lengths : numpy.ndarray
+        The precomputed lengths of the choices, e.g. read from an index file
+    masks : numpy.ndarray
+        The precomputed character masks of the choices, given with the lengths
+    """
+
+    # skip the shortlist when it would keep nearly all choices anyway
+    min_pruned_fraction = 0.1
+    # filtering only pays off over the fixed cost of the array operations for many choices
+    min_choices = 1000
+
+    def __init__(self, choices: Sequence, lengths: 'numpy.ndarray' = None,
+                 masks: 'numpy.ndarray' = None):
+        import numpy as np
+        from rapidfuzz import fuzz
+
+        self.choices = choices
+        if lengths is None:
+            lengths = np.array([len(choice) for choice in choices], dtype=np.int64)
+            masks = np.array([char_mask(choice) for choice in choices], dtype=np.uint64)
+        # swapped as a pair, so lookups always see arrays of the same length
+        self._arrays = (lengths, masks)
+        self._buffers = (None, None)
+        self.scanned = 0
+        self.pruned = 0
+        self._bounds = {fuzz.ratio: self._ratio_bound, fuzz.QRatio: self._ratio_bound,
+                        fuzz.partial_ratio: self._partial_bound, fuzz.WRatio: self._wratio_bound}
+
+    def __repr__(self) -> str:
+        return f'<Prefilter(scanned={self.scanned}, pruned={self.pruned})>'
+
+    @property
+    def lengths(self) -> 'numpy.ndarray':
+        """ The length of each choice """
+        return self._arrays[0]
+
+    @property
+    def masks(self) -> 'numpy.ndarray':
+        """ The character mask of each choice """
+        return self._arrays[1]
+
+    def supports(self, scorer: Callable) -> bool:
+        """ Returns True if a score bound is known for the scorer """
+        return scorer in self._bounds
+
+    def _resize(self, size: int) -> tuple:
+        """ Returns writable length and mask buffers with room for ``size`` choices """
+        lengths, masks = self._arrays
+        self._buffers = (_reserve(self._buffers[0], lengths, size),
+                         _reserve(self._buffers[1], masks, size))
+        return self._buffers
+
+    def copy(self, choices: Sequence) -> 'Prefilter':
+        """ Returns a copy over a copy of the choices, to update without changing this one """
+        prefilter = Prefilter(choices, *self._arrays)
+        prefilter.scanned, prefilter.pruned = self.scanned, self.pruned
+        return prefilter
+
+    def append(self, choice: str) -> None:
+        """ Filters a choice appended to the list of choices
+
+        Parameters
+        ----------
+        choice : str
+            The new last choice
+        """
+        size = len(self.lengths)
+        lengths, masks = self._resize(size + 1)
+        lengths[size] = len(choice)
+        masks[size] = char_mask(choice)
+        self._arrays = (lengths[:size + 1], masks[:size + 1])
+
+    def discard(self, position: int) -> None:
+        """ Bounds the score of a choice replaced by None near zero
+
+        Parameters
+        ----------
+        position : int
+            The position of the removed choice
+        """
+        size = len(self.lengths)
+        lengths, masks = self._resize(size)
+        lengths[position] = 2 ** 40
+        masks[position] = 0
+        self._arrays = (lengths[:size], masks[:size])
+
+    @staticmethod
+    def _missing(value: str, masks: 'numpy.ndarray') -> tuple:
+        """ Returns the characters of the string missing from each choice, and vice versa """
+        import numpy as np
+
+        mask = np.uint64(char_mask(value))
+        return popcount(mask & ~masks), popcount(masks & ~mask), mask
+
+    def _ratio_bound(self, value: str, lengths: 'numpy.ndarray',
+                     masks: 'numpy.ndarray') -> 'numpy.ndarray':
+        import numpy as np
+
+        size = len(value)
+        missing, extra, __ = self._missing(value, masks)
+        total = size + lengths
+        common = np.minimum(size - missing, lengths - extra)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            bound = np.where(total > 0, 200.0 * common / total, 100.0)
+        # comparisons against an empty string are left unfiltered
+        bound[(lengths == 0) | (size == 0)] = 100.0
+        return bound
+
+    def _partial_bound(self, value: str, lengths: 'numpy.ndarray',
+                       masks: 'numpy.ndarray') -> 'numpy.ndarray':
+        import numpy as np
+
+        size = len(value)
+        missing, extra, __ = self._missing(value, masks)
+        shortest = np.minimum(size, lengths)
+        lost = np.where(size < lengths, missing,
+                        np.where(size > lengths, extra, np.minimum(missing, extra)))
+        # alignments at the string edges can use a shorter substring of the longer string
+        with np.errstate(divide='ignore', invalid='ignore'):
+            bound = np.where(shortest > 0, 200.0 * (shortest - lost) / (2 * shortest - lost),
+                             100.0)
+        return bound
+
+    def _wratio_bound(self, value: str, lengths: 'numpy.ndarray',
+                      masks: 'numpy.ndarray') -> 'numpy.ndarray':
+        import numpy as np
+
+        size = len(value)
+        bound = self._ratio_bound(value, lengths, masks)
+        shortest = np.minimum(size, lengths)
+        longest = np.maximum(size, lengths)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            len_ratio = np.where(shortest > 0, longest / shortest, 1.0)
+        cap = np.where(len_ratio < 1.5, 95.0, np.where(len_ratio <= 8, 90.0, 60.0))
+        bound = np.maximum(bound, cap)
+        if size > 0:
+            __, __, mask = self._missing(value, masks)
+            bound[((masks & mask) == 0) & (lengths > 0)] = 0.0
+        return bound
+
+    def candidates(self, value: str, scorer: Callable, score_cutoff: float,
+                   lookup: 'Lookup' = None) -> Union[list, None]:
+        """ Returns the positions of the choices that may reach the score cutoff
+
+        Parameters
+        ----------
+        value : str
+            The string to match on
+        scorer : Callable
+            The rapidfuzz scorer used for matching
+        score_cutoff : float
+            The minimum score to consider when matching
+        lookup : Lookup
+            The lookup record to fill in with the choices scanned and pruned
+
+        Returns
+        -------
+        Union[list, None]
+            The positions of the remaining choices, or None if the scorer has no
+            known bound
+        """
+        import numpy as np
+
+        bound = self._bounds.get(scorer)
+        if bound is None:
+            return None
+
+        # the same margin used against rapidfuzz's rounding of float cutoffs
+        lengths, masks = self._arrays
+        keep = np.flatnonzero(bound(value, lengths, masks) >= score_cutoff - 1e-3)
+        self.scanned += len(lengths)
+        self.pruned += len(lengths) - len(keep)
+        if lookup is not None:
+            lookup.scanned = len(lengths)
+            lookup.pruned = len(lengths) - len(keep)
+        return keep.tolist()
+
+    def shortlist(self, value: str, scorer: Callable, score_cutoff: float,
+                  lookup: 'Lookup' = None) -> Sequence:
+        """ Returns the choices that may reach the score cutoff
+
+        Falls back to all choices when the scorer has no known bound, or
+        when too few choices would be pruned to make a shortlist worthwhile.
+
+        Parameters
+        ----------
+        value : str
+            The string to match on
+        scorer : Callable
+            The rapidfuzz scorer used for matching
+        score_cutoff : float
+            The minimum score to consider when matching
+        lookup : Lookup
+            The lookup record to fill in with the choices scanned and pruned
+
+        Returns
+        -------
+        Sequence
+            The remaining choices, in their original order
+        """
+        keep = self.candidates(value, scorer, score_cutoff, lookup=lookup)
+        if keep is None or len(keep) > (1 - self.min_pruned_fraction) * len(self.choices):
+            return self.choices
+        return [self.choices[idx] for idx in keep]
@@ -0,0 +1,178 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: join.py
+# Project: fuzzy_types
+# Author: Brian Cherinka
+# Created: Friday, 16th October 2026 11:31:52 pm
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Friday, 16th October 2026 11:31:52 pm
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+from collections import deque, namedtuple
+from typing import TYPE_CHECKING, Callable, Iterable, Union
+
+from fuzzy_types.index import TOMBSTONE, ChoiceIndex
+from fuzzy_types.matcher import Matcher
+from fuzzy_types.utils import CDIST_CELLS
+
+if TYPE_CHECKING:
+    # fuzzy_types.fuzzy uses this module, so FuzzyBase is imported where it is used
+    from fuzzy_types.fuzzy import FuzzyBase
+
+__all__ = ['Pair', 'fuzzy_join']
+
+# a joined pair of items, with the match score
+Pair = namedtuple('Pair', ['left', 'right', 'score'])
+
+
+def _left_items(left: Iterable) -> tuple:
+    """ Returns the items of the left collection and their strings """
+    from fuzzy_types.fuzzy import FuzzyBase
+
+    if isinstance(left, FuzzyBase):
+        index = left._choice_index
+        items = [key for key in index.keys if key is not TOMBSTONE]
+        return items, index.live_choices()
+    items = list(left)
+    return items, [FuzzyBase.mapper(item) for item in items]
+
+
+def _right_fuzzy(right: Iterable, matcher: Matcher = None,
+                 normalize: Union[str, Callable, Iterable] = None) -> 'FuzzyBase':
+    """ Returns the right collection as a fuzzy object, keeping the settings of fuzzy ones """
+    from fuzzy_types.fuzzy import FuzzyBase, FuzzyList
+
+    if isinstance(right, FuzzyBase):
+        return right
+    return FuzzyList(list(right), use_fuzzy=matcher, dottable=False, normalize=normalize)
+
+
+def fuzzy_join(left: Iterable, right: Iterable, one_to_one: bool = False,
+               matcher: Matcher = None, normalize: Union[str, Callable, Iterable] = None,
+               candidates: int = 3, unmatched: bool = False, workers: int = -1) -> list:
+    """ Fuzzy-matches each item of a collection to an item of another
+
+    Joins the items, or dictionary keys, of ``left`` to those of ``right``,
+    following the matching rules of the right collection as a fuzzy object: its
+    ``mapper``, ``normalize`` steps, ``exact_first`` setting and matcher.  A plain
+    right collection is matched as a `~fuzzy_types.fuzzy.FuzzyList` with the given
+    ``matcher`` and ``normalize``.
+
+    By default the join is many-to-one, and each left item is matched as with
+    `~fuzzy_types.fuzzy.FuzzyBase.match_many`, in chunks of ``rapidfuzz.process.cdist``
+    score matrices.  With ``one_to_one``, each right item is matched at most once.
+    The best ``candidates`` right choices of each left item are kept from the score
+    matrix chunks, so memory stays proportional to the number of left items.
+    Exact matches are then assigned first, in order, and the remaining candidate
+    pairs greedily, from the highest score down, with ties resolved in order of the
+    left and right items.  Left items whose candidates are all taken stay unmatched.
+
+    Parameters
+    ----------
+    left : Iterable
+        The items to match, e.g. column names, or a fuzzy object
+    right : Iterable
+        The items to match against, e.g. a schema, or a fuzzy object
+    one_to_one : bool
+        If True, matches each right item at most once.  Default is False.
+    matcher : Matcher
+        The matcher of a plain right collection.  By default, a
+        `~fuzzy_types.matcher.Matcher` following the config.
+    normalize : Union[str, Callable, Iterable]
+        The normalization steps of a plain right collection.  See
+        `~fuzzy_types.normalize.Normalizer`.
+    candidates : int
+        The number of best right choices of each left item considered by a
+        one-to-one join.  By default, 3.
+    unmatched : bool
+        If True, also returns the unmatched left items, paired with None.  Default is False.
+    workers : int
+        The number of threads used for scoring.  By default, -1, for all cores.
+
+    Returns
+    -------
+    list
+        A `Pair` of (left, right, score) per matched left item, in left order.  The
+        score is None for a custom ``use_fuzzy`` function.
+    """
+    assert candidates >= 1, 'candidates must be at least 1.'
+    items, strings = _left_items(left)
+    fuzzy = _right_fuzzy(right, matcher=matcher, normalize=normalize)
+    index = fuzzy._choice_index
+    if one_to_one:
+        matches = _assign(fuzzy, index, strings, candidates, workers)
+    else:
+        matches = [None if match is None else (match.index, match.score)
+                   for match in fuzzy._matches(strings, 'none', workers, index)]
+
+    pairs = []
+    for item, match in zip(items, matches):
+        if match is not None:
+            pairs.append(Pair(item, index.keys[match[0]], match[1]))
+        elif unmatched:
+            pairs.append(Pair(item, None, None))
+    return pairs
+
+
+def _assign(fuzzy: 'FuzzyBase', index: ChoiceIndex, strings: list, candidates: int,
+            workers: int) -> list:
+    """ Returns the (position, score) of the right item matched one-to-one to each string """
+    import numpy as np
+    from rapidfuzz import process
+
+    matcher = fuzzy.use_fuzzy
+    assert isinstance(matcher, Matcher), 'one-to-one joins need a Matcher as use_fuzzy.'
+    normalizer = fuzzy._normalizer
+    queries = strings if normalizer is None else [normalizer(value) for value in strings]
+    min_score = matcher.min_score
+    min_length = matcher.min_length
+
+    # the free positions of each search form, as duplicate forms can be matched more than once
+    free = {}
+    for slot, (key, form) in enumerate(zip(index.keys, index.forms)):
+        if key is not TOMBSTONE:
+            free.setdefault(form, deque()).append(slot)
+
+    exact, rows = [], []
+    for i, query in enumerate(queries):
+        if fuzzy._exact_first is True and query in free:
+            exact.append(i)
+        elif len(query) >= min_length:
+            rows.append(i)
+
+    # the best candidates of each row, a chunk of the score matrix at a time
+    unique = index.live_unique()
+    lefts, rights, scores = [], [], []
+    size = min(candidates, len(unique))
+    chunk = max(1, CDIST_CELLS // max(1, len(unique)))
+    for start in range(0, len(rows) if size else 0, chunk):
+        batch = np.array(rows[start:start + chunk])
+        matrix = process.cdist([queries[i] for i in batch], unique, scorer=matcher.scorer,
+                               processor=matcher.processor, score_cutoff=min_score,
+                               dtype=np.float64, workers=workers)
+        top = np.argpartition(matrix, -size, axis=1)[:, -size:]
+        top_scores = np.take_along_axis(matrix, top, axis=1)
+        keep = top_scores >= min_score
+        lefts.append(np.repeat(batch, size).reshape(-1, size)[keep])
+        rights.append(top[keep])
+        scores.append(top_scores[keep])
+
+    results = [None] * len(queries)
+    for i in exact:
+        slots = free[queries[i]]
+        if slots:
+            results[i] = (slots.popleft(), 100)
+
+    if lefts:
+        lefts, rights, scores = (np.concatenate(lefts), np.concatenate(rights),
+                                 np.concatenate(scores))
+        for edge in np.lexsort((rights, lefts, -scores)).tolist():
+            i = int(lefts[edge])
+            slots = free[unique[rights[edge]]]
+            if results[i] is None and slots:
+                results[i] = (slots.popleft(), float(scores[edge]))
+    return results
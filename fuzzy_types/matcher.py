@@ -0,0 +1,209 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: matcher.py
+# Project: fuzzy_types
+# Author: Brian Cherinka
+# Created: Friday, 16th October 2026 8:04:52 pm
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Friday, 16th October 2026 8:04:52 pm
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+from typing import Callable, Iterable, Sequence, Union
+
+from fuzzy_types import config, stats
+from fuzzy_types.utils import best_fuzzy, best_fuzzy_many, default_scorer
+
+__all__ = ['Matcher']
+
+
+class Matcher(object):
+    """ A reusable fuzzy-matching function with compiled settings
+
+    Holds the scorer, score cutoff, minimum search length, processor and tie
+    policy used to find the best match, so they are not looked up on every
+    call.  Calling a matcher behaves as `~fuzzy_types.utils.get_best_fuzzy`,
+    and it can be passed as the ``use_fuzzy`` of any fuzzy object.  Each fuzzy
+    object creates its own matcher by default.
+
+    Settings left as None follow the ``fuzzy_score_cutoff`` and
+    ``minimum_fuzzy_characters`` config values.  They are resolved on first
+    use, and again on the next call after the config is changed or reloaded,
+    which is detected from the config ``version``.  Explicit settings never
+    change.  Matchers can be pickled, e.g. to send to worker processes, where
+    they follow the config of the worker.
+
+    Parameters
+    ----------
+    scorer : Callable
+        The rapidfuzz score ratio to use.  By default, WRatio.
+    min_score : Union[int, float]
+        The minimum score of a match.  By default, the ``fuzzy_score_cutoff`` config
+        value.  0 disables the cutoff.
+    min_length : int
+        The minimum length of a search string.  By default, the
+        ``minimum_fuzzy_characters`` config value.
+    processor : Callable
+        A function preprocessing the search string and choices before scoring, e.g.
+        ``rapidfuzz.utils.default_process``.  By default, None.
+    ties : str
+        What to do when the two best choices have the same score.  Either ``raise``
+        to raise an `~fuzzy_types.utils.AmbiguousMatchError`, or ``first`` to
+        return the first of them.  Default is ``raise``.
+    shortlist : int
+        Enables a scorer cascade for large lists of choices.  All choices are
+        ranked with the cheap ``shortlist_scorer``, and only this many of the
+        best are scored with ``scorer``, under the same cutoff and tie rules.
+        Faster, but approximate, see `~fuzzy_types.utils.get_best_two`.  By
+        default, None, to score all choices with ``scorer``.
+    shortlist_scorer : Callable
+        The rapidfuzz score ratio ranking the shortlist.  By default, ratio.
+    """
+
+    def __init__(self, scorer: Callable = None, min_score: Union[int, float] = None,
+                 min_length: int = None, processor: Callable = None, ties: str = 'raise',
+                 shortlist: int = None, shortlist_scorer: Callable = None):
+        assert ties in ('raise', 'first'), 'invalid ties policy.'
+        assert min_score is None or 0 <= min_score <= 100, 'min_score must be between 0 and 100.'
+        assert shortlist is None or shortlist >= 2, 'shortlist must be at least 2.'
+        self._options = {'scorer': scorer, 'min_score': min_score, 'min_length': min_length}
+        self.processor = processor
+        self.ties = ties
+        self.shortlist = shortlist
+        self.shortlist_scorer = shortlist_scorer
+        self._version = None
+        self._follows = None in self._options.values()
+
+    def __repr__(self) -> str:
+        options = ', '.join(f'{key}={self._describe(value)}'
+                            for key, value in self._state().items())
+        return f'<Matcher({options})>'
+
+    @staticmethod
+    def _describe(value) -> str:
+        if value is None:
+            return 'None'
+        return getattr(value, '__name__', repr(value))
+
+    def _state(self) -> dict:
+        return dict(self._options, processor=self.processor, ties=self.ties,
+                    shortlist=self.shortlist, shortlist_scorer=self.shortlist_scorer)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Matcher):
+            return NotImplemented
+        return self._state() == other._state()
+
+    def __hash__(self) -> int:
+        return hash(tuple(self._state().items()))
+
+    def __getstate__(self) -> dict:
+        return self._state()
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(**state)
+
+    def compile(self) -> None:
+        """ Resolves the settings following the config from its current values """
+        # read the version first, so a concurrent change triggers another compile
+        version = config.version
+        options = self._options
+        self._scorer = options['scorer'] or default_scorer()
+        self._min_score = config.get('fuzzy_score_cutoff', 75) \
+            if options['min_score'] is None else options['min_score']
+        self._min_length = config.get('minimum_fuzzy_characters', 3) \
+            if options['min_length'] is None else options['min_length']
+        self._version = version
+
+    def _refresh(self) -> None:
+        if self._version is None or (self._follows and self._version != config.version):
+            self.compile()
+
+    @property
+    def scorer(self) -> Callable:
+        """ The rapidfuzz scorer """
+        self._refresh()
+        return self._scorer
+
+    @property
+    def min_score(self) -> Union[int, float]:
+        """ The resolved minimum score of a match """
+        self._refresh()
+        return self._min_score
+
+    @property
+    def min_length(self) -> int:
+        """ The resolved minimum length of a search string """
+        self._refresh()
+        return self._min_length
+
+    def __call__(self, value: str, choices: Sequence,
+                 return_score: bool = False) -> Union[str, tuple]:
+        """ Returns the best match in a list of choices
+
+        Parameters
+        ----------
+        value : str
+            A string to match on
+        choices : Sequence
+            A list of string choices to match from
+        return_score : bool
+            If True, returns a tuple of (choice, score, index).  By default, False.
+
+        Returns
+        -------
+        Union[str, tuple]
+            The best match from the list of choices
+
+        Raises
+        ------
+        ValueError
+            when no choice reaches the score cutoff, or an `AmbiguousMatchError`
+            when the two best choices tie and ``ties`` is ``raise``
+        AssertionError
+            when the string is too short to fuzzy match
+        """
+        self._refresh()
+        recorder = stats.function_stats
+        if recorder is None:
+            return best_fuzzy(value, choices, self._scorer, self._min_score, self._min_length,
+                              self.processor, self.ties, return_score,
+                              shortlist=self.shortlist, shortlist_scorer=self.shortlist_scorer)
+
+        with recorder.lookup(value) as lookup:
+            return best_fuzzy(value, choices, self._scorer, self._min_score, self._min_length,
+                              self.processor, self.ties, return_score, lookup=lookup,
+                              shortlist=self.shortlist, shortlist_scorer=self.shortlist_scorer)
+
+    def many(self, values: Iterable[str], choices: Sequence, workers: int = -1,
+             errors: str = 'raise') -> list:
+        """ Returns the best match in a list of choices for many strings at once
+
+        Behaves as `~fuzzy_types.utils.get_best_fuzzy_many`, with the settings of
+        this matcher.
+
+        Parameters
+        ----------
+        values : Iterable[str]
+            The strings to match on
+        choices : Sequence
+            A list of string choices to match from
+        workers : int
+            The number of threads used for scoring.  By default, -1, for all cores.
+        errors : str
+            How unresolved values are returned.  Either ``raise`` to raise the error,
+            ``none`` to return None, or ``marker`` to return the error instance.
+
+        Returns
+        -------
+        list
+            A `~fuzzy_types.utils.Match` record of (choice, score, index), or the
+            error policy result, per value
+        """
+        self._refresh()
+        return best_fuzzy_many(values, choices, self._scorer, self._min_score, self._min_length,
+                               self.processor, self.ties, workers=workers, errors=errors,
+                               shortlist=self.shortlist, shortlist_scorer=self.shortlist_scorer)
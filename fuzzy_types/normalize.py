@@ -0,0 +1,137 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: normalize.py
+# Project: fuzzy_types
+# Author: Brian Cherinka
+# Created: Friday, 16th October 2026 8:51:37 pm
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Friday, 16th October 2026 8:51:37 pm
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+import unicodedata
+from typing import Callable, Iterable, Union
+
+__all__ = ['Normalizer', 'get_normalizer', 'casefold', 'collapse_whitespace', 'strip_accents',
+           'strip_punctuation', 'default_process', 'STEPS']
+
+
+def casefold(value: str) -> str:
+    """ Folds the case of a string, for caseless matching """
+    return value.casefold()
+
+
+def collapse_whitespace(value: str) -> str:
+    """ Collapses runs of whitespace to a single space, and strips the ends """
+    return ' '.join(value.split())
+
+
+def strip_accents(value: str) -> str:
+    """ Removes accents and other combining marks, e.g. from ``café`` to ``cafe`` """
+    if value.isascii():
+        return value
+    decomposed = unicodedata.normalize('NFKD', value)
+    return ''.join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def strip_punctuation(value: str) -> str:
+    """ Replaces punctuation and symbols with spaces """
+    return ''.join(' ' if unicodedata.category(char)[0] in 'PS' else char for char in value)
+
+
+def default_process(value: str) -> str:
+    """ The rapidfuzz default processor: lowercases, replaces non-alphanumerics with spaces,
+    and strips the ends """
+    from rapidfuzz.utils import default_process
+
+    return default_process(value)
+
+
+# the named normalization steps
+STEPS = {'casefold': casefold, 'whitespace': collapse_whitespace, 'accents': strip_accents,
+         'punctuation': strip_punctuation, 'default': default_process}
+
+
+class Normalizer(object):
+    """ A pipeline of string normalization steps
+
+    Fuzzy objects with a normalizer apply it once to each choice when building
+    their choices index, and once to each search string, so exact and fuzzy
+    matching work on the normalized text while returning the original items.
+    A normalizer can also be passed as the ``processor`` of a
+    `~fuzzy_types.matcher.Matcher`, to normalize choices that are not indexed.
+
+    Parameters
+    ----------
+    steps : Union[str, Callable]
+        The steps, applied in order.  Either a name from `STEPS`, i.e. ``casefold``,
+        ``whitespace``, ``accents``, ``punctuation``, or ``default`` for the rapidfuzz
+        default processor, or any function taking and returning a string.
+    """
+
+    def __init__(self, *steps: Union[str, Callable]):
+        for step in steps:
+            assert step in STEPS or callable(step), f'invalid normalization step {step!r}.'
+        self.steps = steps
+        self._funcs = tuple(STEPS[step] if isinstance(step, str) else step for step in steps)
+        if len(self._funcs) == 1 and steps[0] == 'default':
+            # call the rapidfuzz C function directly
+            from rapidfuzz.utils import default_process
+            self._funcs = (default_process,)
+
+    def __repr__(self) -> str:
+        return f'<Normalizer(steps={self.spec})>'
+
+    def __call__(self, value: str) -> str:
+        for func in self._funcs:
+            value = func(value)
+        return value
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Normalizer):
+            return NotImplemented
+        return self.steps == other.steps
+
+    def __hash__(self) -> int:
+        return hash(self.steps)
+
+    def __reduce__(self):
+        return (self.__class__, self.steps)
+
+    @property
+    def spec(self) -> list:
+        """ The names of the steps, with functions named by their qualified name """
+        return [step if isinstance(step, str) else f'{self._module(step)}.{step.__qualname__}'
+                for step in self.steps]
+
+    @staticmethod
+    def _module(func: Callable) -> str:
+        # methods of builtin types, e.g. str.lower, only know their class
+        owner = getattr(func, '__objclass__', None)
+        return getattr(func, '__module__', None) or getattr(owner, '__module__', '')
+
+
+def get_normalizer(normalize: Union[str, Callable, Iterable, None]) -> Union[Normalizer, None]:
+    """ Returns the normalizer for a normalization setting
+
+    Parameters
+    ----------
+    normalize : Union[str, Callable, Iterable, None]
+        A `Normalizer`, a step name or function, or a list of them.  None or an
+        empty list disables normalization.
+
+    Returns
+    -------
+    Union[Normalizer, None]
+        The normalizer, or None
+    """
+    if not normalize:
+        return None
+    elif isinstance(normalize, Normalizer):
+        return normalize
+    elif isinstance(normalize, str) or callable(normalize):
+        return Normalizer(normalize)
+    return Normalizer(*normalize)
@@ -0,0 +1,481 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: sharded.py
+# Project: fuzzy_types
+# Author: Brian Cherinka
+# Created: Friday, 16th October 2026 9:47:26 pm
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Friday, 16th October 2026 9:47:26 pm
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+import mmap
+import multiprocessing
+import os
+import struct
+import tempfile
+import threading
+import weakref
+from typing import Callable, Sequence, Union
+
+from fuzzy_types.fuzzy import FuzzyDict
+from fuzzy_types.index import ChoiceIndex
+from fuzzy_types.matcher import Matcher
+from fuzzy_types.stats import Lookup
+from fuzzy_types.utils import (CDIST_CELLS, Match, _no_match, get_best_two, handle_error,
+                               pick_best)
+
+__all__ = ['ShardPool', 'ShardedFuzzyDict']
+
+# a tmpfs on linux, so the choices file handed to the workers never touches the disk
+SHM_DIR = '/dev/shm'
+COUNT = struct.Struct('<q')
+
+
+def _write_choices(choices: Sequence) -> str:
+    """ Writes choices to a temporary file of utf-8 byte offsets and text
+
+    Parameters
+    ----------
+    choices : Sequence
+        The string choices
+
+    Returns
+    -------
+    str
+        The path of the file
+    """
+    import numpy as np
+
+    encoded = [choice.encode('utf-8') for choice in choices]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(data) for data in encoded], out=offsets[1:])
+    fd, path = tempfile.mkstemp(prefix='fuzzy_types-', suffix='.shards',
+                                dir=SHM_DIR if os.path.isdir(SHM_DIR) else None)
+    with os.fdopen(fd, 'wb') as fp:
+        fp.write(COUNT.pack(len(encoded)))
+        fp.write(offsets.tobytes())
+        fp.write(b''.join(encoded))
+    return path
+
+
+def _read_choices(path: str, start: int, stop: int) -> list:
+    """ Reads the choices from position start to stop of a file written by `_write_choices` """
+    import numpy as np
+
+    with open(path, 'rb') as fp:
+        data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        size, = COUNT.unpack_from(data, 0)
+        offsets = np.frombuffer(data, dtype=np.int64, count=size + 1, offset=COUNT.size)
+        bounds = (offsets[start:stop + 1] + COUNT.size * (size + 2)).tolist()
+        del offsets
+        return [data[first:last].decode('utf-8') for first, last in zip(bounds, bounds[1:])]
+    finally:
+        data.close()
+
+
+def best_two_many(values: Sequence, choices: Sequence, scorer: Callable,
+                  score_cutoff: Union[int, float], processor: Callable = None,
+                  shortlist: int = None, shortlist_scorer: Callable = None) -> list:
+    """ Returns the two best matches in a list of choices for many strings
+
+    Scores the strings with ``rapidfuzz.process.cdist`` on a single thread, and
+    returns the same matches as `~fuzzy_types.utils.get_best_two` for each.  With a
+    ``shortlist``, each string is matched with `~fuzzy_types.utils.get_best_two`.
+
+    Returns
+    -------
+    list
+        Per string, up to two tuples of (choice, score, index), sorted by
+        descending score, then by position
+    """
+    if not choices:
+        return [[] for __ in values]
+    if shortlist is not None and len(choices) > shortlist:
+        return [get_best_two(value, choices, scorer=scorer, score_cutoff=score_cutoff,
+                             processor=processor, shortlist=shortlist,
+                             shortlist_scorer=shortlist_scorer) for value in values]
+
+    import numpy as np
+    from rapidfuzz import process
+
+    results = []
+    rows = max(1, CDIST_CELLS // len(choices))
+    for start in range(0, len(values), rows):
+        batch = values[start:start + rows]
+        scores = process.cdist(batch, choices, scorer=scorer, processor=processor,
+                               score_cutoff=score_cutoff, dtype=np.float64, workers=1)
+        # the first best of each row, then the first best of the rest
+        positions = np.arange(len(batch))
+        firsts = np.argmax(scores, axis=1)
+        first_scores = scores[positions, firsts].tolist()
+        scores[positions, firsts] = -1
+        seconds = np.argmax(scores, axis=1)
+        second_scores = scores[positions, seconds].tolist()
+        for first, first_score, second, second_score in zip(firsts.tolist(), first_scores,
+                                                            seconds.tolist(), second_scores):
+            bests = [(choices[idx], score, idx) for idx, score in
+                     ((first, first_score), (second, second_score)) if score >= score_cutoff]
+            results.append(bests)
+    return results
+
+
+def _serve(conn, path: str, start: int, stop: int) -> None:
+    """ Runs a shard worker, answering match requests for its choices until told to stop """
+    try:
+        choices = _read_choices(path, start, stop)
+    except Exception as error:
+        conn.send(('error', error))
+        conn.close()
+        return
+    conn.send(('ok', len(choices)))
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+        if message is None:
+            break
+
+        kind, values, settings = message
+        try:
+            if kind == 'one':
+                result = get_best_two(values, choices, **settings)
+            else:
+                result = best_two_many(values, choices, **settings)
+        except Exception as error:
+            conn.send(('error', error))
+        else:
+            conn.send(('ok', result))
+    conn.close()
+
+
+def _shutdown(procs: list, conns: list, timeout: float = 5) -> None:
+    """ Stops the shard workers, terminating any that do not exit in time """
+    for conn in conns:
+        try:
+            conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        conn.close()
+    for proc in procs:
+        proc.join(timeout)
+        if proc.is_alive():
+            proc.terminate()
+            proc.join()
+
+
+class ShardPool(object):
+    """ A local process pool holding a list of choices in shards
+
+    The choices are split into contiguous shards, one per worker process.  They
+    are handed to the workers through a temporary file in shared memory, which
+    each worker maps and only decodes its own shard of, and which is removed once
+    all workers have started.  Each query is sent to every shard, which returns
+    its local two best matches, and these are merged into the global two best
+    matches.  Since the shards are contiguous and each returns its first best
+    choices, the merge returns the same matches, ties and positions as
+    `~fuzzy_types.utils.get_best_two` on the whole list.
+
+    Requests are serialized, so a pool can be shared by threads.  Close the pool
+    with `close`, or use it as a context manager.  Pools still open are closed
+    when garbage-collected, or at interpreter exit.
+
+    Parameters
+    ----------
+    choices : Sequence
+        The string choices
+    shards : int
+        The number of shards and worker processes.  By default, the number of CPUs.
+    """
+
+    def __init__(self, choices: Sequence, shards: int = None):
+        shards = shards or os.cpu_count() or 1
+        self.size = len(choices)
+        shards = max(1, min(shards, self.size))
+        bounds = [self.size * i // shards for i in range(shards + 1)]
+        self.starts = bounds[:-1]
+        self._lock = threading.Lock()
+        self._procs = []
+        self._conns = []
+        self._finalizer = weakref.finalize(self, _shutdown, self._procs, self._conns)
+
+        context = multiprocessing.get_context()
+        path = _write_choices(choices)
+        try:
+            for start, stop in zip(bounds, bounds[1:]):
+                parent, child = context.Pipe()
+                proc = context.Process(target=_serve, args=(child, path, start, stop),
+                                       name=f'fuzzy_types-shard-{len(self._procs)}', daemon=True)
+                proc.start()
+                child.close()
+                self._procs.append(proc)
+                self._conns.append(parent)
+            # wait for every worker to load its shard
+            self._receive()
+        except BaseException:
+            self.close()
+            raise
+        finally:
+            os.remove(path)
+
+    def __repr__(self) -> str:
+        return (f'<ShardPool(n_choices={self.size}, shards={len(self.starts)}, '
+                f'closed={self.closed})>')
+
+    def __enter__(self) -> 'ShardPool':
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.close()
+
+    @property
+    def shards(self) -> int:
+        """ The number of shards """
+        return len(self.starts)
+
+    @property
+    def closed(self) -> bool:
+        """ Whether the pool is closed """
+        return not self._finalizer.alive
+
+    def close(self) -> None:
+        """ Stops the worker processes """
+        self._finalizer()
+
+    def _receive(self) -> list:
+        """ Returns the reply of every shard, raising the first error """
+        replies = []
+        for conn in self._conns:
+            try:
+                replies.append(conn.recv())
+            except (EOFError, OSError):
+                replies.append(('error', RuntimeError('A shard worker exited unexpectedly.')))
+
+        for status, reply in replies:
+            if status == 'error':
+                raise reply
+        return [reply for __, reply in replies]
+
+    def _request(self, kind: str, values: Union[str, list], settings: dict) -> list:
+        """ Sends a request to every shard, and returns their replies """
+        with self._lock:
+            if self.closed:
+                raise RuntimeError('The shard pool is closed.')
+            for conn in self._conns:
+                conn.send((kind, values, settings))
+            return self._receive()
+
+    @staticmethod
+    def _merge(parts: list, starts: list) -> list:
+        bests = [(choice, score, idx + start) for part, start in zip(parts, starts)
+                 for choice, score, idx in part]
+        bests.sort(key=lambda best: (-best[1], best[2]))
+        return bests[:2]
+
+    def best_two(self, value: str, **settings) -> list:
+        """ Returns the two best matches in the choices
+
+        Parameters
+        ----------
+        value : str
+            A string to match on
+        settings
+            The ``scorer``, ``score_cutoff``, ``processor``, ``shortlist`` and
+            ``shortlist_scorer`` of `~fuzzy_types.utils.get_best_two`
+
+        Returns
+        -------
+        list
+            Up to two tuples of (choice, score, index), sorted by descending score,
+            then by position
+        """
+        return self._merge(self._request('one', value, settings), self.starts)
+
+    def best_two_many(self, values: Sequence, **settings) -> list:
+        """ Returns the two best matches in the choices for many strings
+
+        Each shard scores all strings in one batch, see `best_two_many`.
+
+        Parameters
+        ----------
+        values : Sequence
+            The strings to match on
+        settings
+            The settings of `best_two`
+
+        Returns
+        -------
+        list
+            The two best matches of `best_two`, per string
+        """
+        parts = self._request('many', list(values), settings)
+        return [self._merge(shard_bests, self.starts) for shard_bests in zip(*parts)]
+
+
+class ShardedFuzzyDict(FuzzyDict):
+    """ A fuzzy dictionary matching its keys across a local process pool
+
+    For very large dictionaries, the unique choices are split across a
+    `ShardPool` of worker processes, which each fuzzy lookup, or batch of
+    lookups, is sent to.  The best match and tie rules are the same as for a
+    `~fuzzy_types.fuzzy.FuzzyDict`.  Exact matches, the match cache and the
+    values stay in this process.  The pool is started on the first fuzzy lookup,
+    and restarted on the next lookup after the keys change.  Dictionaries with
+    fewer than ``min_choices`` unique choices, e.g. nested ones, are matched in
+    this process instead.  The n-gram shortlist and prefilter are not used across
+    shards, but the ``shortlist`` of a `~fuzzy_types.matcher.Matcher` is.
+
+    Close the pool with `close`, or use the dictionary as a context manager.
+
+    Parameters
+    ----------
+    the_items : dict
+        A dictionary of items to make fuzzy
+    shards : int
+        The number of shards and worker processes.  By default, the number of CPUs.
+    use_fuzzy : Matcher
+        The matcher whose settings are used by the shards.  Its scorer and
+        processor must be picklable.  Default is a `~fuzzy_types.matcher.Matcher`
+        following the config.
+    kwargs
+        Any other keyword arguments of `~fuzzy_types.fuzzy.FuzzyDict`
+
+    Returns
+    -------
+        A python dictionary with fuzzy keys
+    """
+    # the number of unique choices from which lookups are sharded
+    min_choices = 10000
+    _shards = None
+    _pool = None
+    # the choices index snapshot the pool holds the choices of
+    _pool_index = None
+    # the shards hold copies of the choices, so any change of keys restarts the pool
+    _incremental = False
+
+    def __init__(self, the_items: dict, shards: int = None, **kwargs):
+        self._shards = shards
+        super(ShardedFuzzyDict, self).__init__(the_items, **kwargs)
+        assert isinstance(self.use_fuzzy, Matcher), 'use_fuzzy must be a Matcher.'
+
+    def __enter__(self) -> 'ShardedFuzzyDict':
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.close()
+
+    def __getstate__(self) -> dict:
+        state = super(ShardedFuzzyDict, self).__getstate__()
+        state.pop('_pool', None)
+        state.pop('_pool_index', None)
+        return state
+
+    def _settings(self) -> dict:
+        settings = super(ShardedFuzzyDict, self)._settings()
+        settings['shards'] = self._shards
+        return settings
+
+    def _reset_index(self) -> None:
+        super(ShardedFuzzyDict, self)._reset_index()
+        self.close()
+
+    @property
+    def pool(self) -> ShardPool:
+        """ The process pool of the choices, started on first use after any change of keys """
+        return self._pool_for(self._choice_index)
+
+    def _pool_for(self, index: ChoiceIndex) -> ShardPool:
+        """ Returns the process pool of the choices of an index snapshot, restarted if needed """
+        pool = self._pool
+        if pool is None or pool.closed or self._pool_index is not index:
+            with self._lock:
+                pool = self._pool
+                if pool is None or pool.closed or self._pool_index is not index:
+                    if pool is not None:
+                        pool.close()
+                    pool = self._pool = ShardPool(index.unique, shards=self._shards)
+                    self._pool_index = index
+        return pool
+
+    def close(self) -> None:
+        """ Stops the process pool, if started """
+        pool, self._pool = self._pool, None
+        self._pool_index = None
+        if pool is not None:
+            pool.close()
+
+    def _sharded(self, index: ChoiceIndex) -> bool:
+        return len(index.unique) >= self.min_choices
+
+    def _shard_settings(self) -> dict:
+        matcher = self.use_fuzzy
+        return {'scorer': matcher.scorer, 'score_cutoff': matcher.min_score,
+                'processor': matcher.processor, 'shortlist': matcher.shortlist,
+                'shortlist_scorer': matcher.shortlist_scorer}
+
+    def _check(self, value: str) -> None:
+        min_length = self.use_fuzzy.min_length
+        assert isinstance(value, str), 'Invalid value. Must be a string.'
+        assert len(value) >= min_length, \
+            f'Your fuzzy search value must be at least {min_length} characters long.'
+
+    def _best(self, index: ChoiceIndex, query: str, lookup: Lookup = None) -> str:
+        if not self._sharded(index):
+            return super(ShardedFuzzyDict, self)._best(index, query, lookup=lookup)
+
+        self._check(query)
+        bests = self._pool_for(index).best_two(query, **self._shard_settings())
+        if lookup is not None:
+            lookup.candidates = len(index.unique)
+        return pick_best(query, bests, self.use_fuzzy.ties)[0]
+
+    def _match_many(self, values: list, errors: str, workers: int, index: ChoiceIndex) -> list:
+        """ Performs `match_many`, sending the strings not matched exactly to the shards
+
+        Each shard scores the strings on one thread, so ``workers`` is not used.
+        """
+        if not self._sharded(index):
+            return super(ShardedFuzzyDict, self)._match_many(values, errors, workers, index)
+
+        raw_values = values
+        if self._normalizer is not None:
+            values = [self._normalizer(value) for value in values]
+
+        results = [None] * len(values)
+        queries = []
+        ties = self.use_fuzzy.ties
+        for i, value in enumerate(values):
+            position = None
+            try:
+                if self._exact_first is True:
+                    position = index.exact(value, key=raw_values[i], ties=ties)
+                if position is None:
+                    self._check(value)
+            except (ValueError, AssertionError) as error:
+                results[i] = handle_error(error, errors)
+            else:
+                if position is None:
+                    queries.append(i)
+                else:
+                    results[i] = Match(index.choices[position], 100, position)
+
+        pool = self._pool_for(index)
+        matches = pool.best_two_many([values[i] for i in queries], **self._shard_settings())
+        for i, bests in zip(queries, matches):
+            try:
+                choice, score, __ = pick_best(values[i], bests, ties)
+                position = index.exact(choice, key=raw_values[i], ties=ties)
+            except ValueError as error:
+                results[i] = handle_error(error, errors)
+            else:
+                if position is None:
+                    results[i] = handle_error(_no_match(raw_values[i]), errors)
+                else:
+                    results[i] = Match(index.choices[position], float(score), position)
+        return results
@@ -0,0 +1,294 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: stats.py
+# Project: fuzzy_types
+# Author: Brian Cherinka
+# Created: Friday, 16th October 2026 6:12:40 pm
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Friday, 16th October 2026 6:12:40 pm
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+import bisect
+import threading
+import time
+from collections import namedtuple
+from typing import Callable, Iterable, Union
+
+__all__ = ['MatchStats', 'MatchEvent', 'Lookup', 'OUTCOMES', 'BUCKETS', 'instrument', 'stats',
+           'reset_stats']
+
+# the outcomes of a lookup: an exact choice, a fuzzy match, a tie between the two best
+# choices, no choice above the score cutoff, or an invalid search value
+OUTCOMES = ('exact', 'fuzzy', 'ambiguous', 'miss', 'invalid')
+
+# the upper bounds in seconds of the latency histogram buckets, from 1 microsecond to 10
+# seconds; the last bucket counts anything slower
+BUCKETS = tuple(scale * 10 ** exp for exp in range(-6, 1) for scale in (1, 2, 5)) + (10,)
+
+MatchEvent = namedtuple('MatchEvent', ['source', 'value', 'outcome', 'elapsed', 'candidates',
+                                       'cached'])
+MatchEvent.__doc__ = """ A lookup record of (source, value, outcome, elapsed seconds, number of
+candidates scored, cache hit) sent to the sinks of a `MatchStats` """
+
+
+def outcome_of(error: Exception) -> str:
+    """ Returns the lookup outcome of a failed match """
+    from fuzzy_types.utils import AmbiguousMatchError
+
+    if isinstance(error, AmbiguousMatchError):
+        return 'ambiguous'
+    return 'invalid' if isinstance(error, AssertionError) else 'miss'
+
+
+class Lookup(object):
+    """ Times a lookup and records it to a `MatchStats` on exit
+
+    The code performing the lookup fills in the outcome, the number of
+    candidates scored, whether the match cache was hit, and the number of
+    choices the `~fuzzy_types.index.Prefilter` scanned and pruned.  A lookup
+    exiting on an error is recorded with the outcome of the error.
+    """
+    __slots__ = ('stats', 'value', 'outcome', 'candidates', 'cached', 'scanned', 'pruned',
+                 'start')
+
+    def __init__(self, stats: 'MatchStats', value: str):
+        self.stats = stats
+        self.value = value
+        self.outcome = 'fuzzy'
+        self.candidates = 0
+        self.cached = None
+        self.scanned = 0
+        self.pruned = 0
+        self.start = None
+
+    def __enter__(self) -> 'Lookup':
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        elapsed = time.perf_counter() - self.start
+        if exc_type is not None:
+            if not issubclass(exc_type, (ValueError, AssertionError)):
+                return
+            self.outcome = outcome_of(exc)
+        self.stats.record(self.outcome, elapsed, candidates=self.candidates, cached=self.cached,
+                          value=self.value, scanned=self.scanned, pruned=self.pruned)
+
+
+class MatchStats(object):
+    """ Counters and latency histograms of fuzzy lookups
+
+    Records the number and latency of lookups per outcome, the number of
+    candidates scored, the match cache hit rate, and the number of choices
+    scanned and pruned by the prefilter.  Each recorded lookup is
+    also sent as a `MatchEvent` to every sink, e.g. to forward it to a metrics
+    system.  Sinks are called synchronously, so should be fast.  Recording is
+    thread-safe.
+
+    Parameters
+    ----------
+    sinks : Iterable[Callable]
+        Functions called with a `MatchEvent` for each lookup
+    source : str
+        A name identifying the recorded object in events
+    """
+
+    def __init__(self, sinks: Iterable[Callable] = None, source: str = None):
+        self.sinks = list(sinks or [])
+        self.source = source
+        self._lock = threading.Lock()
+        self.reset()
+
+    def __repr__(self) -> str:
+        return f'<MatchStats(lookups={self.lookups}, sinks={len(self.sinks)})>'
+
+    def add_sink(self, sink: Callable) -> None:
+        """ Adds a function called with a `MatchEvent` for each lookup """
+        self.sinks.append(sink)
+
+    def remove_sink(self, sink: Callable) -> None:
+        """ Removes a sink added with `add_sink` """
+        self.sinks.remove(sink)
+
+    def lookup(self, value: str = None) -> Lookup:
+        """ Returns a context manager timing and recording one lookup
+
+        Parameters
+        ----------
+        value : str
+            The string looked up
+
+        Returns
+        -------
+        Lookup
+            The lookup record, to fill in with its outcome, number of candidates
+            and cache hit
+        """
+        return Lookup(self, value)
+
+    def record(self, outcome: str, elapsed: float, candidates: int = 0, cached: bool = None,
+               value: str = None, scanned: int = 0, pruned: int = 0) -> None:
+        """ Records a lookup
+
+        Parameters
+        ----------
+        outcome : str
+            The outcome of the lookup, one of `OUTCOMES`
+        elapsed : float
+            The lookup time in seconds
+        candidates : int
+            The number of choices scored
+        cached : bool
+            Whether the match cache was hit, or None if no cache was used
+        value : str
+            The string looked up, sent to the sinks
+        scanned : int
+            The number of choices scanned by the prefilter
+        pruned : int
+            The number of scanned choices pruned by the prefilter
+        """
+        with self._lock:
+            counts = self._outcomes[outcome]
+            counts['count'] += 1
+            counts['seconds'] += elapsed
+            counts['histogram'][bisect.bisect_left(BUCKETS, elapsed)] += 1
+            self._candidates += candidates
+            self._max_candidates = max(self._max_candidates, candidates)
+            if cached is not None:
+                self._cache[cached] += 1
+            self._prefilter['scanned'] += scanned
+            self._prefilter['pruned'] += pruned
+
+        if self.sinks:
+            event = MatchEvent(self.source, value, outcome, elapsed, candidates, cached)
+            for sink in self.sinks:
+                sink(event)
+
+    def record_batch(self, size: int, elapsed: float) -> None:
+        """ Records a batch lookup of many strings
+
+        Batch lookups are counted separately from single lookups, since their
+        strings are not timed individually.  Sinks receive an event with a
+        ``batch`` outcome, and the number of strings as the candidates.
+
+        Parameters
+        ----------
+        size : int
+            The number of strings looked up
+        elapsed : float
+            The batch time in seconds
+        """
+        with self._lock:
+            self._batches['calls'] += 1
+            self._batches['values'] += size
+            self._batches['seconds'] += elapsed
+
+        if self.sinks:
+            event = MatchEvent(self.source, None, 'batch', elapsed, size, None)
+            for sink in self.sinks:
+                sink(event)
+
+    @property
+    def lookups(self) -> int:
+        """ The number of recorded single lookups """
+        return sum(counts['count'] for counts in self._outcomes.values())
+
+    def snapshot(self) -> dict:
+        """ Returns a copy of the statistics
+
+        Returns
+        -------
+        dict
+            The total number of ``lookups``; per outcome, the ``count``, total
+            ``seconds`` and latency ``histogram``, with one count per `BUCKETS`
+            bound plus one for slower lookups; the total, mean and max
+            ``candidates`` scored; the ``cache`` hits, misses and hit rate; the
+            choices scanned and pruned by the ``prefilter``, and the fraction
+            pruned; and the number of ``batches``, strings and seconds of batch
+            lookups.
+        """
+        with self._lock:
+            lookups = self.lookups
+            hits, misses = self._cache[True], self._cache[False]
+            scanned, pruned = self._prefilter['scanned'], self._prefilter['pruned']
+            return {'lookups': lookups,
+                    'outcomes': {outcome: dict(counts, histogram=list(counts['histogram']))
+                                 for outcome, counts in self._outcomes.items()},
+                    'candidates': {'total': self._candidates, 'max': self._max_candidates,
+                                   'mean': self._candidates / lookups if lookups else 0.0},
+                    'cache': {'hits': hits, 'misses': misses,
+                              'hit_rate': hits / (hits + misses) if hits + misses else 0.0},
+                    'prefilter': {'scanned': scanned, 'pruned': pruned,
+                                  'pruned_fraction': pruned / scanned if scanned else 0.0},
+                    'batches': dict(self._batches),
+                    'buckets': list(BUCKETS)}
+
+    def reset(self) -> None:
+        """ Clears all counters and histograms, keeping the sinks """
+        with self._lock:
+            self._outcomes = {outcome: {'count': 0, 'seconds': 0.0,
+                                        'histogram': [0] * (len(BUCKETS) + 1)}
+                              for outcome in OUTCOMES}
+            self._candidates = 0
+            self._max_candidates = 0
+            self._cache = {True: 0, False: 0}
+            self._prefilter = {'scanned': 0, 'pruned': 0}
+            self._batches = {'calls': 0, 'values': 0, 'seconds': 0.0}
+
+
+# the statistics of the get_best_fuzzy function, None when disabled
+function_stats = None
+
+
+def instrument(enabled: Union[bool, MatchStats] = True,
+               sinks: Iterable[Callable] = None) -> Union[MatchStats, None]:
+    """ Enables or disables the statistics of `~fuzzy_types.utils.get_best_fuzzy`
+
+    These are separate from the statistics of fuzzy objects, which are enabled
+    per object with their ``instrument`` keyword argument.  Fuzzy objects using
+    the default ``use_fuzzy`` also count towards the function statistics.
+
+    Parameters
+    ----------
+    enabled : Union[bool, MatchStats]
+        If True, records the calls to new statistics.  If a `MatchStats`, records
+        them there.  If False, disables recording.  Default is True.
+    sinks : Iterable[Callable]
+        Functions called with a `MatchEvent` for each call, when enabling
+
+    Returns
+    -------
+    Union[MatchStats, None]
+        The statistics recorded to, or None when disabled
+    """
+    global function_stats
+    if enabled is False:
+        function_stats = None
+    elif enabled is True:
+        function_stats = MatchStats(sinks=sinks, source='get_best_fuzzy')
+    else:
+        function_stats = enabled
+        for sink in sinks or []:
+            enabled.add_sink(sink)
+    return function_stats
+
+
+def stats() -> Union[dict, None]:
+    """ Returns a snapshot of the `~fuzzy_types.utils.get_best_fuzzy` statistics
+
+    Returns
+    -------
+    Union[dict, None]
+        See `MatchStats.snapshot`, or None if instrumentation is disabled
+    """
+    return function_stats.snapshot() if function_stats is not None else None
+
+
+def reset_stats() -> None:
+    """ Clears the `~fuzzy_types.utils.get_best_fuzzy` statistics """
+    if function_stats is not None:
+        function_stats.reset()
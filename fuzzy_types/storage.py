@@ -0,0 +1,299 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: storage.py
+# Project: fuzzy_types
+# Author: Brian Cherinka
+# Created: Friday, 16th October 2026 4:10:26 pm
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Friday, 16th October 2026 4:10:26 pm
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+import mmap
+import os
+import struct
+import zlib
+from typing import TYPE_CHECKING, Union
+
+from fuzzy_types.index import ChoiceIndex, NgramIndex, Prefilter
+
+if TYPE_CHECKING:
+    import numpy
+    from fuzzy_types.normalize import Normalizer
+
+__all__ = ['IndexFileError', 'IndexFile', 'save_index', 'load_index']
+
+# file layout: header, section table, then the 8-byte aligned sections.  The checksum
+# covers everything after the header.
+MAGIC = b'FZTYIDX\0'
+VERSION = 1
+HEADER = struct.Struct('<8sHHI')
+SECTION = struct.Struct('<16sQQ')
+
+
+class IndexFileError(ValueError):
+    """ Raised when an index file is invalid, corrupt or stale """
+
+
+def _mapper_name(kls: type) -> str:
+    """ Returns the qualified name of a fuzzy class mapper, to detect stale choices """
+    return f'{kls.mapper.__module__}.{kls.mapper.__qualname__}'
+
+
+def _normalizer_spec(normalizer) -> Union[list, None]:
+    """ Returns the step names of a normalizer, to detect choices normalized differently """
+    return normalizer.spec if normalizer is not None else None
+
+
+def _pack_strings(strings: list) -> tuple:
+    """ Returns the code point offsets and utf-8 blob of a list of strings """
+    import numpy as np
+
+    offsets = np.zeros(len(strings) + 1, dtype=np.int64)
+    np.cumsum([len(string) for string in strings], out=offsets[1:])
+    return offsets.tobytes(), ''.join(strings).encode('utf-8')
+
+
+def save_index(fuzzy, path: Union[str, os.PathLike], fingerprint: str = None) -> None:
+    """ Saves the choices index of a fuzzy object to a binary file
+
+    Writes the keys or items, their choices and any normalized search forms,
+    the prefilter arrays and, if built, the n-gram postings, so that `load_index`
+    can restore the index without recomputing any of them.  The keys of a
+    `~fuzzy_types.fuzzy.FuzzyDict` or items of a `~fuzzy_types.fuzzy.FuzzyList`
+    must be strings.  Dictionary values are not saved; see
+    `~fuzzy_types.fuzzy.FuzzyBase.from_index`.
+
+    Parameters
+    ----------
+    fuzzy : FuzzyBase
+        The fuzzy object to save
+    path : Union[str, os.PathLike]
+        The path of the index file
+    fingerprint : str
+        An optional identifier of the source data, e.g. a hash of a vocabulary
+        file, checked when the file is loaded
+    """
+    import json
+    import numpy as np
+
+    index = fuzzy._choice_index
+    if index.changes:
+        # saved without tombstones or in-place postings
+        index = index.compacted()
+    assert all(isinstance(key, str) for key in index.keys), 'Invalid keys. Must be strings.'
+
+    meta = {'kind': 'dict' if isinstance(fuzzy, dict) else 'list',
+            'mapper': _mapper_name(fuzzy.__class__), 'fingerprint': fingerprint,
+            'size': len(index), 'unique': len(index.unique),
+            'same_choices': index.choices == index.keys,
+            'normalize': _normalizer_spec(fuzzy._normalizer),
+            'same_forms': index.forms is index.choices or index.forms == index.choices}
+
+    sections = {'meta': json.dumps(meta).encode('utf-8')}
+    sections['key_offsets'], sections['keys'] = _pack_strings(index.keys)
+    if not meta['same_choices']:
+        sections['choice_offsets'], sections['choices'] = _pack_strings(index.choices)
+    if not meta['same_forms']:
+        sections['form_offsets'], sections['forms'] = _pack_strings(index.forms)
+
+    prefilter = index.prefilter
+    sections['lengths'] = prefilter.lengths.astype(np.int64).tobytes()
+    sections['masks'] = prefilter.masks.astype(np.uint64).tobytes()
+
+    ngrams = index._ngrams
+    if ngrams is not None:
+        meta['ngram'] = ngrams.n
+        sections['meta'] = json.dumps(meta).encode('utf-8')
+        grams = list(ngrams.postings)
+        sections['gram_offsets'], sections['grams'] = _pack_strings(grams)
+        postings = [ngrams.postings[gram] for gram in grams]
+        offsets = np.zeros(len(postings) + 1, dtype=np.int64)
+        np.cumsum([len(ids) for ids in postings], out=offsets[1:])
+        sections['posting_offsets'] = offsets.tobytes()
+        sections['postings'] = np.concatenate(postings or [[]]).astype(np.int32).tobytes()
+        sections['gram_sizes'] = ngrams.sizes.astype(np.int32).tobytes()
+
+    # lay out the 8-byte aligned sections after the header and section table
+    table = []
+    body = bytearray()
+    start = HEADER.size + SECTION.size * len(sections)
+    for name, data in sections.items():
+        body.extend(b'\0' * (-(start + len(body)) % 8))
+        table.append(SECTION.pack(name.encode('ascii'), start + len(body), len(data)))
+        body.extend(data)
+
+    payload = b''.join(table) + bytes(body)
+    header = HEADER.pack(MAGIC, VERSION, len(sections), zlib.crc32(payload))
+
+    # write atomically, so readers never see a partial file
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'wb') as fp:
+        fp.write(header)
+        fp.write(payload)
+    os.replace(tmp_path, path)
+
+
+class IndexFile(object):
+    """ A memory-mapped fuzzy index file
+
+    The file is mapped read-only, so the prefilter and n-gram arrays are read
+    directly from the page cache, and shared by all processes opening the same
+    file.  Use `load_index` to open a file.
+
+    Parameters
+    ----------
+    path : Union[str, os.PathLike]
+        The path of the index file
+    verify : bool
+        If True, checks the file checksum.  Default is True.
+    fingerprint : str
+        If given, the source data identifier the file must have been saved with
+
+    Raises
+    ------
+    IndexFileError
+        when the file is not an index file, has another format version, is
+        corrupt, or has a different fingerprint
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], verify: bool = True,
+                 fingerprint: str = None):
+        self.path = path
+        if os.path.getsize(path) < HEADER.size:
+            raise IndexFileError(f'{path} is not a fuzzy index file.')
+        with open(path, 'rb') as fp:
+            self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, n_sections, checksum = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise IndexFileError(f'{path} is not a fuzzy index file.')
+        if version != VERSION:
+            raise IndexFileError(f'{path} has index format version {version}, '
+                                 f'expected {VERSION}. Please rebuild it.')
+        if verify and zlib.crc32(memoryview(self._mmap)[HEADER.size:]) != checksum:
+            raise IndexFileError(f'{path} failed its checksum. Please rebuild it.')
+
+        self.sections = {}
+        for i in range(n_sections):
+            name, offset, size = SECTION.unpack_from(self._mmap, HEADER.size + i * SECTION.size)
+            self.sections[name.rstrip(b'\0').decode('ascii')] = (offset, size)
+
+        import json
+
+        self.meta = json.loads(self._bytes('meta').decode('utf-8'))
+        if fingerprint is not None and self.meta['fingerprint'] != fingerprint:
+            raise IndexFileError(f'{path} was built from other data. Please rebuild it.')
+
+    def __repr__(self) -> str:
+        return f'<IndexFile(path={self.path}, kind={self.meta["kind"]}, size={self.meta["size"]})>'
+
+    def _bytes(self, name: str) -> bytes:
+        offset, size = self.sections[name]
+        return self._mmap[offset:offset + size]
+
+    def _array(self, name: str, dtype: str) -> 'numpy.ndarray':
+        import numpy as np
+
+        offset, size = self.sections[name]
+        dtype = np.dtype(dtype)
+        return np.frombuffer(self._mmap, dtype=dtype, count=size // dtype.itemsize, offset=offset)
+
+    def _strings(self, name: str) -> list:
+        offsets = self._array(f'{name[:-1]}_offsets', 'int64').tolist()
+        text = self._bytes(name).decode('utf-8')
+        return [text[start:stop] for start, stop in zip(offsets, offsets[1:])]
+
+    def check(self, kls: type, normalizer: 'Normalizer' = None) -> None:
+        """ Checks the index file was saved from a compatible fuzzy class
+
+        Parameters
+        ----------
+        kls : type
+            The fuzzy class to load the index into
+        normalizer : Normalizer
+            The normalizer of the fuzzy object to load the index into
+
+        Raises
+        ------
+        IndexFileError
+            when the class is of another kind, or maps or normalizes its choices
+            differently
+        """
+        kind = 'dict' if issubclass(kls, dict) else 'list'
+        if self.meta['kind'] != kind:
+            raise IndexFileError(f'{self.path} holds a fuzzy {self.meta["kind"]}, '
+                                 f'not a fuzzy {kind}.')
+        if self.meta['mapper'] != _mapper_name(kls):
+            raise IndexFileError(f'{self.path} was saved with mapper {self.meta["mapper"]}, '
+                                 f'not {_mapper_name(kls)}.')
+        saved = self.meta.get('normalize')
+        if saved != _normalizer_spec(normalizer):
+            raise IndexFileError(f'{self.path} was saved with normalizer {saved}, '
+                                 f'not {_normalizer_spec(normalizer)}.')
+
+    @property
+    def keys(self) -> list:
+        """ The saved list items or dictionary keys """
+        return self._strings('keys')
+
+    def choice_index(self, keys: list = None) -> ChoiceIndex:
+        """ Returns the saved choices index
+
+        Parameters
+        ----------
+        keys : list
+            The already decoded keys, to avoid decoding them twice
+
+        Returns
+        -------
+        ChoiceIndex
+            The choices index, with its prefilter and any n-gram index restored
+        """
+        keys = self.keys if keys is None else keys
+        choices = keys if self.meta['same_choices'] else self._strings('choices')
+        forms = choices if self.meta.get('same_forms', True) else self._strings('forms')
+        index = ChoiceIndex(keys, None, choices=choices, forms=forms)
+        if len(index.unique) != self.meta['unique']:
+            raise IndexFileError(f'{self.path} has inconsistent choices. Please rebuild it.')
+
+        index._prefilter = Prefilter(index.unique, lengths=self._array('lengths', 'int64'),
+                                     masks=self._array('masks', 'uint64'))
+        if 'ngram' in self.meta:
+            grams = self._strings('grams')
+            offsets = self._array('posting_offsets', 'int64').tolist()
+            ids = self._array('postings', 'int32')
+            postings = {gram: ids[start:stop]
+                        for gram, start, stop in zip(grams, offsets, offsets[1:])}
+            index._ngrams = NgramIndex(index.unique, n=self.meta['ngram'], postings=postings,
+                                       sizes=self._array('gram_sizes', 'int32'))
+        return index
+
+
+def load_index(path: Union[str, os.PathLike], verify: bool = True,
+               fingerprint: str = None) -> IndexFile:
+    """ Opens a fuzzy index file saved with `save_index`
+
+    Parameters
+    ----------
+    path : Union[str, os.PathLike]
+        The path of the index file
+    verify : bool
+        If True, checks the file checksum.  Default is True.
+    fingerprint : str
+        If given, the source data identifier the file must have been saved with
+
+    Returns
+    -------
+    IndexFile
+        The memory-mapped index file
+
+    Raises
+    ------
+    IndexFileError
+        when the file is invalid, corrupt or stale
+    """
+    return IndexFile(path, verify=verify, fingerprint=fingerprint)
@@ -0,0 +1,155 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: stream.py
+# Project: fuzzy_types
+# Author: Brian Cherinka
+# Created: Saturday, 17th October 2026 12:06:41 am
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Saturday, 17th October 2026 12:06:41 am
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+import itertools
+import os
+from collections import deque, namedtuple
+from typing import Iterable, Iterator, Union
+
+from fuzzy_types.utils import Match, handle_error
+
+__all__ = ['Record', 'iter_batches', 'match_stream']
+
+# a streamed input string, with its matched item or key, score and value
+Record = namedtuple('Record', ['input', 'match', 'score', 'value'])
+
+# the fuzzy object and choices index snapshot of a worker process
+_worker_fuzzy = None
+
+
+def _read_lines(path: Union[str, os.PathLike], encoding: str, buffer_size: int) -> Iterator[str]:
+    """ Yields the lines of a text file, without their line endings """
+    with open(path, 'r', encoding=encoding, buffering=buffer_size) as fp:
+        for line in fp:
+            yield line.rstrip('\r\n')
+
+
+def iter_batches(values: Iterable, size: int) -> Iterator[list]:
+    """ Yields lists of up to ``size`` consecutive values of an iterable
+
+    Parameters
+    ----------
+    values : Iterable
+        Any iterable, consumed one batch at a time
+    size : int
+        The maximum number of values per batch
+
+    Returns
+    -------
+    Iterator[list]
+        The batches, in order
+    """
+    assert size >= 1, 'size must be at least 1.'
+    iterator = iter(values)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _init_worker(fuzzy, index) -> None:
+    global _worker_fuzzy
+    _worker_fuzzy = (fuzzy, index)
+
+
+def _match_batch(batch: list, workers: int) -> list:
+    """ Matches a batch in a worker process, returning positions rather than items """
+    fuzzy, index = _worker_fuzzy
+    return [(match.index, match.score) if isinstance(match, Match) else match
+            for match in fuzzy._matches(batch, 'marker', workers, index)]
+
+
+def match_stream(fuzzy, source: Union[Iterable[str], str, os.PathLike], batch_size: int = 1024,
+                 processes: int = 0, errors: str = 'none', workers: int = -1,
+                 encoding: str = 'utf-8', buffer_size: int = 2 ** 20) -> Iterator[Record]:
+    """ Fuzzy-matches a stream of strings, yielding a record per string
+
+    The strings are read lazily, and matched in batches of ``batch_size`` with
+    `~fuzzy_types.fuzzy.FuzzyBase.match_many`, so memory stays bounded by the
+    batch size whatever the length of the stream.  All batches are matched against
+    the choices index snapshot current when the stream starts.
+
+    With ``processes``, the batches are matched in a pool of worker processes,
+    each with a copy of the fuzzy object, at most two batches per process at a
+    time.  Records are still yielded in input order.
+
+    Parameters
+    ----------
+    fuzzy : FuzzyBase
+        The fuzzy object to match against
+    source : Union[Iterable[str], str, os.PathLike]
+        An iterable of strings, or the path of a text file with one string per line
+    batch_size : int
+        The number of strings matched per batch.  By default, 1024.
+    processes : int
+        The number of worker processes.  By default, 0, to match in this process.
+    errors : str
+        How unresolved strings are returned.  Either ``raise`` to raise the error,
+        ``none`` to yield a record with no match, or ``marker`` to yield the error
+        instance as the match.  Default is ``none``.
+    workers : int
+        The number of threads used for scoring each batch.  By default, -1, for all cores.
+    encoding : str
+        The encoding of a text file.  By default, utf-8.
+    buffer_size : int
+        The read buffer size of a text file, in bytes.  By default, 1 MiB.
+
+    Returns
+    -------
+    Iterator[Record]
+        A `Record` of (input, match, score, value) per string, in order.  The match is
+        the matched list item or dictionary key, and the value the list item or
+        dictionary value.
+    """
+    assert errors in ('raise', 'none', 'marker'), 'invalid errors policy.'
+    assert batch_size >= 1, 'batch_size must be at least 1.'
+    if isinstance(source, (str, os.PathLike)):
+        source = _read_lines(source, encoding, buffer_size)
+    batches = iter_batches(source, batch_size)
+    index = fuzzy._choice_index
+
+    def records(batch, results):
+        for value, result in zip(batch, results):
+            if isinstance(result, tuple):
+                position, score = result
+                yield Record(value, index.keys[position], score, fuzzy._item(position, index))
+            else:
+                yield Record(value, handle_error(result, errors), None, None)
+
+    if processes <= 0:
+        for batch in batches:
+            results = [(match.index, match.score) if isinstance(match, Match) else match
+                       for match in fuzzy._matches(batch, 'marker', workers, index)]
+            yield from records(batch, results)
+        return
+
+    import concurrent.futures
+
+    # the workers get a copy of the snapshot, so the positions they return map back to it
+    pending = deque()
+    with concurrent.futures.ProcessPoolExecutor(processes, initializer=_init_worker,
+                                                initargs=(fuzzy, index)) as pool:
+        try:
+            for batch in itertools.chain(batches, [None]):
+                if batch is not None:
+                    pending.append((batch, pool.submit(_match_batch, batch, workers)))
+                    if len(pending) < 2 * processes:
+                        continue
+                while pending and (batch is None or len(pending) >= 2 * processes):
+                    done, future = pending.popleft()
+                    yield from records(done, future.result())
+        finally:
+            for __, future in pending:
+                future.cancel()
@@ -12,15 +12,209 @@
 
 
 from __future__ import print_function, division, absolute_import
-import six
-from rapidfuzz import fuzz as fuzz_fuzz
-from rapidfuzz import process as fuzz_proc
-from fuzzy_types import config
-from typing import Callable, Union
+from collections import namedtuple
+
+from fuzzy_types import config, stats
+from typing import Callable, Iterable, Sequence, Union
+
+
+# rapidfuzz is only imported on the first fuzzy match, to keep the import fast
+CUTOFF_MARGIN = 1e-3
+# the maximum number of scores held in memory at once during batch matching
+CDIST_CELLS = 2 ** 22
+
+Match = namedtuple('Match', ['choice', 'score', 'index'])
+Match.__doc__ = """ A fuzzy match record of (choice, score, index of choice) """
+
+
+def default_scorer() -> Callable:
+    """ Returns the default rapidfuzz scorer, WRatio """
+    from rapidfuzz import fuzz
+
+    return fuzz.WRatio
+
+
+def identity_scorers() -> tuple:
+    """ Returns the rapidfuzz scorers only giving a perfect score to identical strings """
+    from rapidfuzz import fuzz
+
+    return (fuzz.ratio, fuzz.QRatio, fuzz.WRatio)
+
+
+def __getattr__(name: str):
+    # the scorer constants of earlier versions, resolved on access
+    if name == 'DEFAULT_SCORER':
+        return default_scorer()
+    elif name == 'IDENTITY_SCORERS':
+        return identity_scorers()
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+class AmbiguousMatchError(ValueError):
+    """ Raised when the two best choices tie for the best match """
+
+
+def _no_match(value: str, ambiguous: bool = False) -> ValueError:
+    """ Returns the error raised when no single best match is found """
+    error = AmbiguousMatchError if ambiguous else ValueError
+    return error(f"Cannot find a good match for '{value}'. "
+                 'Your input value is too ambiguous.')
+
+
+def handle_error(error: Exception, errors: str = 'raise') -> Union[None, Exception]:
+    """ Applies a batch error policy to a failed match
+
+    Parameters
+    ----------
+    error : Exception
+        The error raised by the failed match
+    errors : str
+        The policy.  Either ``raise`` to raise the error, ``none`` to return None,
+        or ``marker`` to return the error instance in place of the match.
+
+    Returns
+    -------
+    Union[None, Exception]
+        None or the error instance, depending on the policy
+    """
+    if errors == 'raise':
+        raise error
+    return error if errors == 'marker' else None
+
+
+def shortlist_positions(value: str, choices: Sequence, size: int, scorer: Callable = None,
+                        processor: Callable = None) -> list:
+    """ Returns the positions of the best choices under a cheap scorer
+
+    The first stage of a scorer cascade, see `get_best_two`.
+
+    Parameters
+    ----------
+    value : str
+        A string to match on
+    choices : Sequence
+        A list of string choices to match from
+    size : int
+        The number of positions to return
+    scorer : Callable
+        The rapidfuzz score ratio to rank the choices with.  By default, ratio.
+    processor : Callable
+        A function preprocessing the value and choices before scoring.  By default, None.
+
+    Returns
+    -------
+    list
+        The positions of the ``size`` best choices, in ascending order
+    """
+    from rapidfuzz import fuzz, process
+
+    ranked = process.extract(value, choices, scorer=scorer or fuzz.ratio, processor=processor,
+                             limit=size)
+    return sorted(idx for __, __, idx in ranked)
+
+
+def get_best_two(value: str, choices: Sequence, scorer: Callable = None,
+                 score_cutoff: Union[int, float] = 0, chunk_size: int = 4096,
+                 processor: Callable = None, shortlist: int = None,
+                 shortlist_scorer: Callable = None) -> list:
+    """ Returns the two best matches in a list of choices using rapidfuzz.
+
+    Scans the choices in chunks, raising the score cutoff to the best score
+    found so far, so later chunks only return candidates that can still
+    be the best match or tie with it.  For scorers that only give a perfect
+    score to identical strings, and without a processor, the scan stops at the
+    first perfect match and only checks the remaining choices for an identical
+    duplicate.  The top score
+    in the results is unique if and only if it is unique across all choices.
+
+    With a ``shortlist`` size, the choices are first ranked with a cheap
+    ``shortlist_scorer``, and only the top ``shortlist`` candidates are scored
+    with ``scorer``.  This is much faster for large lists of choices and an
+    expensive scorer such as WRatio, but approximate: a best match or tie
+    ranked outside the shortlist by the cheap scorer is missed.
+
+    Parameters
+    ----------
+    value : str
+        A string to match on
+    choices : Sequence
+        A list of string choices to match from.  Mappings are also accepted,
+        but are scanned in a single pass.
+    scorer : Callable
+        The rapidfuzz score ratio to use.  By default, `default_scorer`, WRatio.
+    score_cutoff : Union[int, float]
+        The minimum score to consider when matching.  By default, 0.
+    chunk_size : int
+        The number of choices scored per chunk.  By default, 4096.
+    processor : Callable
+        A function preprocessing the value and choices before scoring, e.g.
+        ``rapidfuzz.utils.default_process``.  By default, None.
+    shortlist : int
+        The number of candidates to rerank with the scorer, after ranking all
+        choices with the shortlist scorer.  By default, None, to score all choices
+        with the scorer.
+    shortlist_scorer : Callable
+        The cheap rapidfuzz score ratio ranking the shortlist.  By default, ratio.
+
+    Returns
+    -------
+    list
+        Up to two tuples of (choice, score, index), sorted by descending score,
+        then by position
+    """
+
+    from rapidfuzz import process
+
+    scorer = scorer or default_scorer()
+    if shortlist is not None and isinstance(choices, (list, tuple)) and len(choices) > shortlist:
+        positions = shortlist_positions(value, choices, shortlist, scorer=shortlist_scorer,
+                                        processor=processor)
+        bests = get_best_two(value, [choices[i] for i in positions], scorer=scorer,
+                             score_cutoff=score_cutoff, chunk_size=chunk_size,
+                             processor=processor)
+        return [(choice, score, positions[idx]) for choice, score, idx in bests]
+
+    if not isinstance(choices, (list, tuple)):
+        return process.extract(value, choices, scorer=scorer, processor=processor,
+                               score_cutoff=score_cutoff, limit=2)
+
+    bests = []
+    cutoff = score_cutoff
+    size = len(choices)
+    for start in range(0, size, chunk_size):
+        stop = start + chunk_size
+        chunk = choices[start:stop]
+        for choice, score, idx in process.extract(value, chunk, scorer=scorer,
+                                                  processor=processor, score_cutoff=cutoff,
+                                                  limit=2):
+            bests.append((choice, score, idx + start))
+
+        if not bests:
+            continue
+
+        # keep the top two, and only look for matches at least as good as the best;
+        # rapidfuzz rounds float cutoffs, so leave a margin to not drop exact ties
+        bests.sort(key=lambda best: best[1], reverse=True)
+        del bests[2:]
+        top_score = bests[0][1]
+        cutoff = max(score_cutoff, top_score - CUTOFF_MARGIN)
+
+        if top_score == 100 and processor is None and scorer in identity_scorers():
+            # only an identical choice later in the list can tie a perfect score
+            if len(bests) == 1 or bests[1][1] != 100:
+                try:
+                    tie = choices.index(bests[0][0], stop)
+                except ValueError:
+                    pass
+                else:
+                    bests[1:] = [(choices[tie], top_score, tie)]
+            break
+
+    return bests
 
 
 def get_best_fuzzy(value: str, choices: list, min_score: int = None, 
-                   scorer: Callable = fuzz_fuzz.WRatio, return_score: bool = False) -> Union[None, str]:
+                   scorer: Callable = None, return_score: bool = False) -> Union[None, str]:
     """ Returns the best match in a list of choices using rapidfuzz.
 
     Parameters
@@ -30,9 +224,10 @@ def get_best_fuzzy(value: str, choices: list, min_score: int = None,
     choices : list
         A list of string choices to match from
     min_score : int
-        The score cutoff threshold. The minimum score to consider when matching. By default, None
+        The score cutoff threshold. The minimum score to consider when matching.  By default,
+        None, for the ``fuzzy_score_cutoff`` config value.  0 disables the cutoff.
     scorer : Callable
-        The rapidfuzz score ratio to use.  By default, WRatio.
+        The rapidfuzz score ratio to use.  By default, `default_scorer`, WRatio.
     return_score : bool
         If True, also returns the score value of the match.  By default, False.
         
@@ -44,18 +239,63 @@ def get_best_fuzzy(value: str, choices: list, min_score: int = None,
     Raises
     ------
     ValueError
-        when rapidfuzz cannot find a single best match
+        when rapidfuzz cannot find a single best match, or an `AmbiguousMatchError`
+        when the two best choices tie
     """
 
-    assert isinstance(value, six.string_types), 'Invalid value. Must be a string.'
-
-    min_score = min_score or config.get('fuzzy_score_cutoff', 75)
+    if min_score is None:
+        min_score = config.get('fuzzy_score_cutoff', 75)
     minfuzz = config.get('minimum_fuzzy_characters', 3)
-    assert len(value) >= minfuzz, f'Your fuzzy search value must be at least {minfuzz} characters long.'
+    scorer = scorer or default_scorer()
+
+    recorder = stats.function_stats
+    if recorder is None:
+        return best_fuzzy(value, choices, scorer, min_score, minfuzz, None, 'raise', return_score)
+
+    with recorder.lookup(value) as lookup:
+        return best_fuzzy(value, choices, scorer, min_score, minfuzz, None, 'raise',
+                          return_score, lookup=lookup)
+
+
+def best_fuzzy(value: str, choices: list, scorer: Callable, min_score: Union[int, float],
+               min_length: int, processor: Union[Callable, None], ties: str,
+               return_score: bool = False, lookup: 'stats.Lookup' = None,
+               shortlist: int = None, shortlist_scorer: Callable = None) -> Union[tuple, str]:
+    """ Returns the best match in a list of choices, with all settings given
+
+    The core of `get_best_fuzzy` and `~fuzzy_types.matcher.Matcher`, which
+    resolve their settings from the config before calling it.  Fills in the
+    lookup record when instrumented.  See `get_best_fuzzy` for the parameters;
+    ``ties`` is either ``raise`` to raise an `AmbiguousMatchError`, or
+    ``first`` to return the first of the tied choices.  See `get_best_two` for
+    the ``shortlist`` of a scorer cascade.
+    """
+    assert isinstance(value, str), 'Invalid value. Must be a string.'
+    assert len(value) >= min_length, \
+        f'Your fuzzy search value must be at least {min_length} characters long.'
 
-    # returns a tuple of (best choice, score, index of choice in list or key of choice in dict)
-    bests = fuzz_proc.extract(value, choices, scorer=scorer, score_cutoff=min_score)
+    # returns tuples of (best choice, score, index of choice in list or key of choice in dict)
+    bests = get_best_two(value, choices, scorer=scorer, score_cutoff=min_score,
+                         processor=processor, shortlist=shortlist,
+                         shortlist_scorer=shortlist_scorer)
+    if lookup is not None:
+        lookup.candidates = len(choices)
 
+    best = pick_best(value, bests, ties)
+    if lookup is not None and best[0] == value:
+        lookup.outcome = 'exact'
+    return best if return_score else best[0]
+
+
+def pick_best(value: str, bests: list, ties: str) -> tuple:
+    """ Returns the best of the two best matches returned by `get_best_two`
+
+    Raises
+    ------
+    ValueError
+        when there is no match, or an `AmbiguousMatchError` when the two
+        matches tie and ``ties`` is ``raise``
+    """
     if len(bests) == 0:
         best = None
     elif len(bests) == 1:
@@ -63,13 +303,143 @@ def get_best_fuzzy(value: str, choices: list, min_score: int = None,
     else:
         # compare the two scores of top two choices
         # or take the top choice
-        if bests[0][1] == bests[1][1]:
-            best = None
+        if bests[0][1] == bests[1][1] and ties == 'raise':
+            raise _no_match(value, ambiguous=True)
         else:
             best = bests[0]
 
     if best is None:
-        raise ValueError(f"Cannot find a good match for '{value}'. "
-                         'Your input value is too ambiguous.')
+        raise _no_match(value)
+    return best
 
-    return best if return_score else best[0]
+
+def get_best_fuzzy_many(values: Iterable[str], choices: Sequence, min_score: int = None,
+                        scorer: Callable = None, workers: int = -1,
+                        errors: str = 'raise') -> list:
+    """ Returns the best match in a list of choices for many strings at once
+
+    Scores all values against all choices with ``rapidfuzz.process.cdist``, which
+    releases the GIL and runs on ``workers`` threads, in row chunks to bound memory.
+    Each value follows the same cutoff, minimum length and ambiguity rules as
+    `get_best_fuzzy`.
+
+    Parameters
+    ----------
+    values : Iterable[str]
+        The strings to match on
+    choices : Sequence
+        A list of string choices to match from
+    min_score : int
+        The score cutoff threshold. The minimum score to consider when matching.  By default,
+        None, for the ``fuzzy_score_cutoff`` config value.  0 disables the cutoff.
+    scorer : Callable
+        The rapidfuzz score ratio to use.  By default, `default_scorer`, WRatio.
+    workers : int
+        The number of threads used for scoring.  By default, -1, for all cores.
+    errors : str
+        How unresolved values are returned.  Either ``raise`` to raise the error,
+        ``none`` to return None, or ``marker`` to return the error instance.
+
+    Returns
+    -------
+    list
+        A `Match` record of (choice, score, index), or the error policy result, per value
+
+    Raises
+    ------
+    ValueError
+        when rapidfuzz cannot find a single best match, and errors is ``raise``
+    AssertionError
+        when a value is too short to fuzzy match, and errors is ``raise``
+    """
+
+    if min_score is None:
+        min_score = config.get('fuzzy_score_cutoff', 75)
+    minfuzz = config.get('minimum_fuzzy_characters', 3)
+    return best_fuzzy_many(values, choices, scorer or default_scorer(), min_score, minfuzz,
+                           None, 'raise', workers=workers, errors=errors)
+
+
+def best_fuzzy_many(values: Iterable[str], choices: Sequence, scorer: Callable,
+                    min_score: Union[int, float], min_length: int,
+                    processor: Union[Callable, None], ties: str, workers: int = -1,
+                    errors: str = 'raise', shortlist: int = None,
+                    shortlist_scorer: Callable = None) -> list:
+    """ Returns the best match in a list of choices for many strings, with all settings given
+
+    The core of `get_best_fuzzy_many` and `~fuzzy_types.matcher.Matcher.many`.
+    See `get_best_fuzzy_many` and `best_fuzzy` for the parameters.  With a
+    ``shortlist``, the shortlist scorer is run with ``cdist``, and the
+    shortlist of each value is reranked as in `get_best_two`.
+    """
+    assert errors in ('raise', 'none', 'marker'), 'invalid errors policy.'
+    import numpy as np
+    from rapidfuzz import process
+
+    values = list(values)
+    results = [None] * len(values)
+    queries = []
+    for i, value in enumerate(values):
+        assert isinstance(value, str), 'Invalid value. Must be a string.'
+        if len(value) < min_length:
+            error = AssertionError(f'Your fuzzy search value must be at least {min_length} '
+                                   'characters long.')
+            results[i] = handle_error(error, errors)
+        elif not choices:
+            results[i] = handle_error(_no_match(value), errors)
+        else:
+            queries.append(i)
+
+    rows = max(1, CDIST_CELLS // max(1, len(choices)))
+    if shortlist is not None and len(choices) > shortlist:
+        from rapidfuzz import fuzz
+
+        for start in range(0, len(queries), rows):
+            batch = queries[start:start + rows]
+            scores = process.cdist([values[i] for i in batch], choices,
+                                   scorer=shortlist_scorer or fuzz.ratio, processor=processor,
+                                   dtype=np.float32, workers=workers)
+            tops = np.sort(np.argpartition(scores, -shortlist, axis=1)[:, -shortlist:], axis=1)
+            for i, top in zip(batch, tops):
+                candidates = [choices[j] for j in top]
+                bests = get_best_two(values[i], candidates, scorer=scorer,
+                                     score_cutoff=min_score, processor=processor)
+                try:
+                    choice, score, idx = pick_best(values[i], bests, ties)
+                except ValueError as error:
+                    results[i] = handle_error(error, errors)
+                else:
+                    results[i] = Match(choice, float(score), int(top[idx]))
+        return results
+
+    for start in range(0, len(queries), rows):
+        batch = queries[start:start + rows]
+        # float64 scores, so ties are decided exactly as in get_best_fuzzy
+        scores = process.cdist([values[i] for i in batch], choices, scorer=scorer,
+                               processor=processor, score_cutoff=min_score, dtype=np.float64,
+                               workers=workers)
+
+        if ties == 'first':
+            # the first of the best scores of each row
+            firsts = np.argmax(scores, axis=1)
+            tied = np.zeros(len(batch), dtype=bool)
+        elif scores.shape[1] == 1:
+            firsts = np.zeros(len(batch), dtype=np.intp)
+            tied = np.zeros(len(batch), dtype=bool)
+        else:
+            # the unordered top two of each row, then which of the two is the best
+            top = np.argpartition(scores, -2, axis=1)[:, -2:]
+            top_scores = np.take_along_axis(scores, top, axis=1)
+            which = np.argmax(top_scores, axis=1)
+            firsts = top[np.arange(len(batch)), which]
+            tied = top_scores[:, 0] == top_scores[:, 1]
+
+        best_scores = scores[np.arange(len(batch)), firsts]
+        for i, first, score, tie in zip(batch, firsts, best_scores, tied):
+            if tie or score < min_score:
+                error = _no_match(values[i], ambiguous=bool(tie and score >= min_score))
+                results[i] = handle_error(error, errors)
+            else:
+                results[i] = Match(choices[first], float(score), int(first))
+
+    return results
@@ -0,0 +1,147 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: test_aio.py
+# Project: tests
+# Author: Brian Cherinka
+# Created: Friday, 16th October 2026 10:31:08 pm
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Friday, 16th October 2026 10:31:08 pm
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+import asyncio
+import concurrent.futures
+import random
+import time
+import pytest
+from fuzzy_types import aio
+from fuzzy_types.fuzzy import FuzzyDict, FuzzyList
+from fuzzy_types.utils import AmbiguousMatchError
+from benchmarks.vocab import make_typo, synthetic_words
+
+
+fruit = {'apple': 1, 'banana': 2, 'orange': 3, 'pear': 4, 'grape1': 5, 'grape2': 6}
+
+
+def counted(fuzzy):
+    """ Records the batches of strings matched in the executor """
+    calls = []
+    matches = fuzzy._matches
+
+    def counting(values, errors, workers, index):
+        calls.append(list(values))
+        return matches(values, errors, workers, index)
+
+    fuzzy._matches = counting
+    return calls
+
+
+class TestAsyncLookup(object):
+
+    def test_aget(self):
+        dd = FuzzyDict(fruit)
+
+        async def lookups():
+            assert await dd.aget('banana') == 2
+            assert await dd.aget('bannna') == 2
+            assert await dd.aget(5) is None
+            with pytest.raises(AmbiguousMatchError):
+                await dd.aget('grape')
+            with pytest.raises(AssertionError, match='at least 3'):
+                await dd.aget('ap')
+            return await dd.aget_many(['paer', 'orange', 'zebra', 'grape'], errors='marker')
+
+        results = asyncio.run(lookups())
+        assert results[:2] == [4, 3]
+        assert type(results[2]) is ValueError
+        assert type(results[3]) is AmbiguousMatchError
+
+    def test_list(self):
+        ll = FuzzyList(['apple', 'banana', 'pear'])
+        assert asyncio.run(ll.aget_many(['aple', 'pear', 'zebra'], errors='none')) == \
+            ['apple', 'pear', None]
+        with pytest.raises(ValueError):
+            asyncio.run(ll.aget_many(['zebra']))
+
+    def test_coalesce_and_batch(self):
+        dd = FuzzyDict(fruit)
+        calls = counted(dd)
+
+        async def lookups():
+            values = ['bannna', 'paer', 'bannna', 'orage', 'apple', 'bannna']
+            return await asyncio.gather(*[dd.aget(value) for value in values])
+
+        assert asyncio.run(lookups()) == [2, 4, 2, 3, 1, 2]
+        # one batch, without the exact match or the repeated strings
+        assert calls == [['bannna', 'paer', 'orage']]
+
+    def test_max_batch(self):
+        dd = FuzzyDict(fruit)
+        calls = counted(dd)
+
+        async def lookups():
+            aio.get_batcher(dd).max_batch = 2
+            return await dd.aget_many(['bannna', 'paer', 'orage'])
+
+        assert asyncio.run(lookups()) == [2, 4, 3]
+        assert calls == [['bannna', 'paer'], ['orage']]
+
+    def test_cancel(self):
+        dd = FuzzyDict(fruit)
+        calls = counted(dd)
+
+        async def lookups():
+            first = asyncio.ensure_future(dd.aget('bannna'))
+            second = asyncio.ensure_future(dd.aget('bannna'))
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(dd.aget('bannna'), timeout=0)
+            first.cancel()
+            # the cancelled lookups don't cancel the shared match
+            third = await dd.aget('bannna')
+            return await second, third, first.cancelled()
+
+        assert asyncio.run(lookups()) == (2, 2, True)
+        assert calls == [['bannna']]
+
+    def test_executor(self):
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        aio.set_executor(executor)
+        try:
+            assert aio.get_executor() is executor
+            assert asyncio.run(FuzzyList(['apple']).aget('aple')) == 'apple'
+        finally:
+            aio.set_executor(None)
+        assert aio.get_executor() is not executor
+        executor.shutdown()
+
+    def test_loop_latency(self):
+        words = synthetic_words(20000)
+        dd = FuzzyDict(dict.fromkeys(words, 1))
+        rng = random.Random(4)
+        values = [make_typo(word, rng) for word in rng.choices(words, k=40)]
+        dd._choice_index
+
+        async def heartbeat(lags, done):
+            while not done.is_set():
+                start = time.perf_counter()
+                await asyncio.sleep(0.001)
+                lags.append(time.perf_counter() - start - 0.001)
+
+        async def load():
+            lags = []
+            done = asyncio.Event()
+            beat = asyncio.ensure_future(heartbeat(lags, done))
+            await asyncio.sleep(0.005)
+            start = time.perf_counter()
+            await asyncio.gather(*[dd.aget_many([value], errors='none') for value in values])
+            elapsed = time.perf_counter() - start
+            done.set()
+            await beat
+            return max(lags), elapsed
+
+        # the loop keeps ticking while the lookups are scored in the executor
+        lag, elapsed = asyncio.run(load())
+        assert lag < elapsed / 4
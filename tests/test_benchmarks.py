@@ -0,0 +1,77 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: test_benchmarks.py
+# Project: tests
+# Author: Brian Cherinka
+# Created: Friday, 16th October 2026 5:02:11 pm
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Friday, 16th October 2026 5:02:11 pm
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+import json
+import random
+import pytest
+from benchmarks.__main__ import main
+from benchmarks.suite import TYPES, compare, run
+from benchmarks.vocab import VOCABULARIES, make_misses, make_typo
+
+
+class TestVocabularies(object):
+
+    @pytest.mark.parametrize('name', VOCABULARIES)
+    def test_deterministic(self, name):
+        words = VOCABULARIES[name](200, seed=3)
+        assert len(set(words)) == 200
+        assert words == VOCABULARIES[name](200, seed=3)
+        assert words != VOCABULARIES[name](200, seed=4)
+
+    def test_typo(self):
+        rng = random.Random(1)
+        for word in VOCABULARIES['synthetic'](100):
+            typo = make_typo(word, rng)
+            assert typo != word
+            assert len(typo) >= 4
+            assert abs(len(typo) - len(word)) <= 1
+
+    def test_misses(self):
+        assert make_misses(5) == make_misses(5)
+        assert not any(char.isalnum() for miss in make_misses(5) for char in miss)
+
+
+class TestSuite(object):
+
+    def test_run(self):
+        results = run(sizes=[10, 50], queries=4)
+        assert results['meta']['seed'] == 42
+        assert len(results['results']) == len(TYPES) * len(VOCABULARIES) * 2
+        json.dumps(results)
+
+        for result in results['results']:
+            assert result['exact']['calls'] == 4
+            assert result['exact']['errors'] == 0
+            if result['type'] != 'FuzzyStr':
+                assert result['miss']['errors'] == 4
+                assert result['copy_s'] >= 0
+            assert result['peak_memory_bytes'] > 0
+
+    def test_compare(self):
+        results = run(types=['FuzzyList'], vocabularies=['synthetic'], sizes=[10], queries=4)
+        rows = compare(results, results)
+        assert {row[3] for row in rows} >= {'construction_s', 'exact', 'fuzzy', 'miss'}
+        assert all(row[-1] == 1 for row in rows)
+
+    def test_main(self, tmp_path, capsys):
+        output = tmp_path / 'results.json'
+        main(['--types', 'FuzzyDict', '--vocabularies', 'realistic', '--sizes', '10',
+              '--queries', '2', '--output', str(output), '--seed', '7'])
+        results = json.loads(output.read_text())
+        assert results['meta']['seed'] == 7
+        assert results['results'][0]['type'] == 'FuzzyDict'
+
+        main(['--types', 'FuzzyDict', '--sizes', '10', '--queries', '2',
+              '--output', str(tmp_path / 'new.json'), '--compare', str(output)])
+        assert 'ratio' in capsys.readouterr().err
@@ -0,0 +1,115 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: test_cli.py
+# Project: tests
+# Author: Brian Cherinka
+# Created: Saturday, 17th October 2026 1:05:37 am
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Saturday, 17th October 2026 1:05:37 am
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+import io
+import json
+import pytest
+from fuzzy_types import cli
+from fuzzy_types.fuzzy import FuzzyBase, FuzzyDict, FuzzyList
+
+
+vocab = {'apple': 1, 'banana': 2, 'cherry': 3}
+
+
+@pytest.fixture()
+def files(tmp_path):
+    (tmp_path / 'vocab.txt').write_text('apple\nbanana\n\ncherry\n')
+    (tmp_path / 'vocab.json').write_text(json.dumps(vocab))
+    (tmp_path / 'vocab.yaml').write_text('apple: 1\nbanana: 2\ncherry: 3\n')
+    (tmp_path / 'queries.txt').write_text('appel\nbanan\nzzz\n')
+    yield tmp_path
+
+
+class TestVocabulary(object):
+
+    @pytest.mark.parametrize('name, kls, expected',
+                             [('vocab.txt', FuzzyList, list(vocab)),
+                              ('vocab.json', FuzzyDict, vocab),
+                              ('vocab.yaml', FuzzyDict, vocab)])
+    def test_load(self, files, name, kls, expected):
+        assert cli.read_vocabulary(files / name) == expected
+        fuzzy = cli.load_fuzzy(files / name)
+        assert isinstance(fuzzy, kls)
+        assert fuzzy == expected
+
+    def test_invalid(self, files):
+        (files / 'vocab.json').write_text('"apple"')
+        with pytest.raises(AssertionError, match='must be a list or a mapping'):
+            cli.read_vocabulary(files / 'vocab.json')
+
+    def test_index(self, files, monkeypatch):
+        path = files / 'vocab.idx'
+        fuzzy = cli.load_fuzzy(files / 'vocab.json', index_path=path)
+        assert path.exists()
+        assert fuzzy['banan'] == 2
+
+        # the next load reads the saved index
+        def no_build(self):
+            raise AssertionError('index rebuilt')
+
+        monkeypatch.setattr(FuzzyBase, '_build_index', no_build)
+        fuzzy = cli.load_fuzzy(files / 'vocab.json', index_path=path)
+        assert fuzzy['banan'] == 2
+
+        # and rebuilds it when the vocabulary changes
+        monkeypatch.undo()
+        (files / 'vocab.json').write_text(json.dumps({'kiwi': 4}))
+        fuzzy = cli.load_fuzzy(files / 'vocab.json', index_path=path)
+        assert fuzzy['kiwii'] == 4
+        assert cli.load_fuzzy(files / 'vocab.json', index_path=path) == {'kiwi': 4}
+
+
+class TestMatch(object):
+
+    def test_tsv(self, files, capsys):
+        assert cli.main(['match', str(files / 'vocab.txt'), str(files / 'queries.txt')]) == 0
+        lines = [line.split('\t') for line in capsys.readouterr().out.splitlines()]
+        assert [line[:2] for line in lines] == [['appel', 'apple'], ['banan', 'banana'],
+                                                ['zzz', '']]
+        assert float(lines[0][2]) == pytest.approx(80)
+
+    def test_jsonl_stdin(self, files, capsys, monkeypatch):
+        monkeypatch.setattr('sys.stdin', io.StringIO('appel\nzzz\n'))
+        output = files / 'out.jsonl'
+        cli.main(['match', str(files / 'vocab.yaml'), '-f', 'jsonl', '-o', str(output)])
+        records = [json.loads(line) for line in output.read_text().splitlines()]
+        assert records == [{'input': 'appel', 'match': 'apple', 'score': pytest.approx(80),
+                            'value': 1},
+                           {'input': 'zzz', 'match': None, 'score': None, 'value': None}]
+
+    def test_options(self, files, capsys):
+        args = ['match', str(files / 'vocab.json'), str(files / 'queries.txt'), '--scorer',
+                'ratio', '--cutoff', '85', '--batch-size', '2', '--workers', '1',
+                '--normalize', 'casefold', '--index', str(files / 'vocab.idx'), '--stats']
+        cli.main(args)
+        captured = capsys.readouterr()
+        assert [line.split('\t')[1] for line in captured.out.splitlines()] == \
+            ['', 'banana', '']
+        assert 'matched 1 of 3 strings' in captured.err
+        assert 'time between batches of 2 written: p50' in captured.err
+
+    def test_processes(self, files, capsys):
+        cli.main(['match', str(files / 'vocab.txt'), str(files / 'queries.txt'),
+                  '--processes', '1', '--batch-size', '1'])
+        assert [line.split('\t')[1] for line in capsys.readouterr().out.splitlines()] == \
+            ['apple', 'banana', '']
+
+    def test_errors(self, files, capsys):
+        with pytest.raises(SystemExit) as error:
+            cli.main(['match', str(files / 'missing.txt'), str(files / 'queries.txt')])
+        assert error.value.code == 1
+        assert 'No such file' in capsys.readouterr().err
+
+        with pytest.raises(SystemExit):
+            cli.main(['match', str(files / 'vocab.txt'), '--batch-size', '0'])
@@ -0,0 +1,133 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: test_cluster.py
+# Project: tests
+# Author: Brian Cherinka
+# Created: Saturday, 17th October 2026 1:52:44 am
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Saturday, 17th October 2026 1:52:44 am
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+import random
+import pytest
+from fuzzy_types import cluster
+from fuzzy_types.cluster import NearDuplicate, find_near_duplicates
+from fuzzy_types.fuzzy import FuzzyDict, FuzzyList
+from fuzzy_types.matcher import Matcher
+from fuzzy_types.utils import AmbiguousMatchError
+from rapidfuzz import fuzz
+from benchmarks.vocab import make_typo, synthetic_words
+
+
+words = ['colour', 'color', 'Temp ', 'temp', 'apple', 'banana', 'bananas']
+
+
+@pytest.fixture(scope='module')
+def corpus():
+    vocab = synthetic_words(1500, seed=4)
+    rng = random.Random(4)
+    return vocab + [make_typo(word, rng) for word in rng.sample(vocab, 150)]
+
+
+class TestNearDuplicates(object):
+
+    @pytest.mark.parametrize('exhaustive', [True, False])
+    def test_pairs(self, exhaustive):
+        pairs = find_near_duplicates(words, exhaustive=exhaustive)
+        assert pairs == [NearDuplicate('banana', 'bananas', pytest.approx(92.31, abs=0.01)),
+                         NearDuplicate('colour', 'color', pytest.approx(90.91, abs=0.01))]
+
+    def test_duplicates(self):
+        # identical strings always pair up, with the first occurrence first
+        pairs = find_near_duplicates(['b', 'a', 'b', 'b'], threshold=100)
+        assert pairs == [NearDuplicate('b', 'b', 100)] * 3
+
+    @pytest.mark.parametrize('scorer', [fuzz.ratio, fuzz.WRatio])
+    def test_blocking(self, corpus, scorer):
+        exhaustive = set(find_near_duplicates(corpus, scorer=scorer, exhaustive=True))
+        blocked = set(find_near_duplicates(corpus, scorer=scorer, exhaustive=False))
+        assert len(exhaustive) > 50
+        assert blocked <= exhaustive
+        if scorer is fuzz.ratio:
+            # the blocking finds all the pairs of the ratio scorer
+            assert blocked == exhaustive
+        else:
+            assert len(blocked) >= 0.95 * len(exhaustive)
+
+    def test_no_shared_ngrams(self):
+        pairs = find_near_duplicates(['fhbe', 'fbeh'], threshold=70, scorer=fuzz.ratio,
+                                     exhaustive=False)
+        assert pairs == [NearDuplicate('fhbe', 'fbeh', 75)]
+
+    @pytest.mark.parametrize('threshold', [70, 85])
+    def test_short_strings(self, threshold):
+        # short strings with repeated letters can share no n-gram with their near-duplicates
+        rng = random.Random(4)
+        strings = [''.join(rng.choices('abcdefgh', k=rng.randint(3, 7))) for _ in range(1200)]
+        exhaustive = find_near_duplicates(strings, threshold=threshold, scorer=fuzz.ratio,
+                                          exhaustive=True)
+        blocked = find_near_duplicates(strings, threshold=threshold, scorer=fuzz.ratio,
+                                       exhaustive=False)
+        assert len(exhaustive) > 50
+        assert blocked == exhaustive
+
+    def test_large_blocks(self, corpus, monkeypatch):
+        expected = find_near_duplicates(corpus, exhaustive=False)
+        monkeypatch.setattr(cluster, 'SMALL_BLOCK', 2)
+        assert find_near_duplicates(corpus, exhaustive=False) == expected
+
+    def test_invalid(self):
+        with pytest.raises(AssertionError, match='threshold must be between 0 and 100'):
+            find_near_duplicates(words, threshold=0)
+
+
+class TestCluster(object):
+
+    @pytest.mark.parametrize('exhaustive', [True, False])
+    def test_list(self, exhaustive):
+        fuzzy = FuzzyList(words + ['colour'])
+        assert fuzzy.cluster(exhaustive=exhaustive) == [['colour', 'color', 'colour'],
+                                                        ['banana', 'bananas']]
+
+    def test_transitive(self):
+        clusters = cluster.cluster(['abcdefghij', 'abcdefghxx', 'abcdefxxxx'], threshold=80,
+                                   scorer=fuzz.ratio)
+        assert clusters == [['abcdefghij', 'abcdefghxx', 'abcdefxxxx']]
+
+    def test_normalized(self):
+        fuzzy = FuzzyDict(dict.fromkeys(words), normalize=['casefold', 'whitespace'])
+        assert fuzzy.cluster() == [['colour', 'color'], ['Temp ', 'temp'],
+                                   ['banana', 'bananas']]
+        del fuzzy['color']
+        fuzzy['colr'] = None
+        assert fuzzy.cluster(threshold=80) == [['colour', 'colr'], ['Temp ', 'temp'],
+                                               ['banana', 'bananas']]
+
+    def test_matcher(self):
+        # the matcher's processor is used to compare keys
+        fuzzy = FuzzyDict(dict.fromkeys(words),
+                          use_fuzzy=Matcher(processor=lambda value: value.strip().lower()))
+        assert ['Temp ', 'temp'] in fuzzy.cluster()
+        assert ['Temp ', 'temp'] in fuzzy.cluster(exhaustive=False)
+
+
+class TestAmbiguity(object):
+
+    def test_report(self):
+        matcher = Matcher(min_score=85, processor=lambda value: value.strip().lower())
+        fuzzy = FuzzyDict(dict.fromkeys(words), use_fuzzy=matcher)
+        report = fuzzy.ambiguity_report()
+        assert [(pair.key, pair.other) for pair in report] == [
+            ('Temp ', 'temp'), ('banana', 'bananas'), ('colour', 'color')]
+        # the tied keys make lookups ambiguous
+        with pytest.raises(AmbiguousMatchError):
+            fuzzy['TEMP']
+
+    def test_custom(self):
+        fuzzy = FuzzyList(words, use_fuzzy=lambda value, choices: choices[0])
+        with pytest.raises(AssertionError, match='needs a Matcher'):
+            fuzzy.ambiguity_report()
@@ -0,0 +1,184 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: test_concurrency.py
+# Project: tests
+# Author: Brian Cherinka
+# Created: Friday, 16th October 2026 11:12:44 pm
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Friday, 16th October 2026 11:12:44 pm
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+import gc
+import pickle
+import random
+import sys
+import threading
+import time
+import weakref
+import pytest
+from fuzzy_types.fuzzy import FuzzyDict, FuzzyList
+from benchmarks.vocab import make_typo, synthetic_words
+
+
+words = synthetic_words(300)
+
+
+@pytest.fixture()
+def switching():
+    """ Switches threads often, to interleave readers and the writer """
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)
+    yield
+    sys.setswitchinterval(interval)
+
+
+class TestSnapshots(object):
+
+    @pytest.mark.parametrize('concurrent', [True, False], ids=['eager', 'lazy'])
+    def test_stress(self, switching, concurrent):
+        stable, churn = words[:200], words[200:]
+        rng = random.Random(0)
+        lookups = [(word, word) for word in words]
+        lookups += [(make_typo(word, rng), word) for word in rng.choices(words, k=300)]
+        # a value best matching a stable key among all the keys matches it in any state
+        full = FuzzyDict({word: word for word in words})
+        expected = {}
+        for value, __ in lookups:
+            found = full.get_many([value], errors='none')[0]
+            expected[value] = found if found in stable else None
+
+        dd = FuzzyDict({word: word for word in stable}, concurrent=concurrent, cache_size=50)
+        history = [frozenset(stable)]
+        done = threading.Event()
+        results = []
+        errors = []
+
+        def writer():
+            rng = random.Random(1)
+            try:
+                for __ in range(300):
+                    word = rng.choice(churn)
+                    if word in dict.keys(dd):
+                        del dd[word]
+                    else:
+                        dd[word] = word
+                    history.append(frozenset(dict.keys(dd)))
+                    time.sleep(0.001)
+            finally:
+                done.set()
+
+        def reader(seed):
+            rng = random.Random(seed)
+            while not done.is_set():
+                value, word = rng.choice(lookups)
+                values = [value] if rng.random() < 0.8 else [value, word]
+                wanted = [expected[each] for each in values]
+                before = len(history) - 1
+                try:
+                    if len(values) == 1:
+                        found = [dd[value]]
+                    else:
+                        found = dd.get_many(values, errors='none')
+                except KeyError as error:
+                    # only a key being removed may be gone once matched, and only
+                    # without snapshots may a lookup read a slot as it is tombstoned
+                    if error.args[0] in stable or (concurrent and error.args == (None,)):
+                        errors.append(error)
+                    continue
+                except ValueError as error:
+                    # only the lookups of keys being added and removed may miss
+                    if None not in wanted:
+                        errors.append(error)
+                    continue
+                except Exception as error:
+                    errors.append(error)
+                    continue
+                results.append((before, len(history) - 1, found, wanted))
+
+        threads = [threading.Thread(target=reader, args=(seed,)) for seed in range(8)]
+        threads.append(threading.Thread(target=writer))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(results) > 100
+        assert sum(want is not None for *__, wanted in results for want in wanted) > 50
+        for before, after, found, wanted in results:
+            states = history[before:after + 2]
+            for key, want in zip(found, wanted):
+                if want is not None:
+                    # a stable key is always found
+                    assert key == want, (key, want)
+                else:
+                    # any other key found was in a state seen during the lookup,
+                    # or the one being written
+                    assert key is None or any(key in state for state in states), key
+
+    def test_consistent_item(self):
+        # a lookup reads its key from the snapshot it matched against
+        ll = FuzzyList(['apple', 'banana', 'pear'])
+        index = ll._choice_index
+        ll.insert(0, 'orange')
+        assert ll._item(ll._resolve('paer', index), index) == 'pear'
+        assert ll['paer'] == 'pear'
+
+    def test_eager_snapshot(self):
+        dd = FuzzyDict({'apple': 1, 'pear': 2}, concurrent=True)
+        assert dd._index is None
+        dd['banana'] = 3
+        # no snapshot is built before the first lookup
+        assert dd._index is None
+        old = dd._choice_index
+        dd.clear()
+        dd['orange'] = 4
+        assert dd._index is not None and dd._index is not old
+        assert 'orange' in dd._index.choices
+        assert dd.copy()._concurrent is True
+
+    @pytest.mark.parametrize('options', [{}, {'ngram_candidates': 2}], ids=['default', 'ngrams'])
+    def test_published_unchanged(self, options):
+        dd = FuzzyDict({'apple': 1, 'pear': 2, 'banana': 3}, concurrent=True, **options)
+        assert dd['aple'] == 1
+        old = dd._choice_index
+        state = (list(old.keys), list(old.unique), dict(old.lookup), old.changes)
+        dd['orange'] = 4
+        del dd['pear']
+        # updates are made to a copy, so a lookup holding the snapshot sees no change
+        assert dd._choice_index is not old
+        assert (list(old.keys), list(old.unique), dict(old.lookup), old.changes) == state
+        assert old.keys[dd._resolve('pearr', old)] == 'pear'
+        assert old.prefilter.lengths.tolist() == [5, 4, 6]
+        assert dd['orangee'] == 4
+        with pytest.raises(ValueError):
+            dd['pearr']
+
+    def test_stale_reclaimed(self):
+        dd = FuzzyDict({'apple': 1, 'pear': 2}, concurrent=True, cache_size=10)
+        assert dd['aple'] == 1
+        old = weakref.ref(dd._choice_index)
+        dd.clear()
+        gc.collect()
+        assert old() is None
+
+    def test_stale_cache(self):
+        dd = FuzzyDict({'apple': 1, 'pear': 2}, cache_size=10)
+        index = dd._choice_index
+        assert dd._resolve('aple', index) == 0
+        del dd['apple']
+        # a result cached against an old snapshot is not reused
+        dd._cache.put('paer', (index, 0, 0))
+        assert dd['paer'] == 2
+
+    def test_pickle(self):
+        dd = FuzzyDict({'apple': 1, 'pear': 2}, cache_size=10)
+        assert dd['aple'] == 1
+        kopy = pickle.loads(pickle.dumps(dd))
+        assert kopy['paer'] == 2
+        kopy['banana'] = 3
+        assert kopy['banan'] == 3
@@ -0,0 +1,97 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: test_configuration.py
+# Project: tests
+# Author: Brian Cherinka
+# Created: Friday, 16th October 2026 7:20:05 pm
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Friday, 16th October 2026 7:20:05 pm
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+import importlib.util
+import pickle
+import subprocess
+import sys
+import pytest
+from rapidfuzz import fuzz
+from fuzzy_types import config, utils
+from fuzzy_types.configuration import LazyConfig
+from benchmarks.bench_import import HEAVY, loaded_modules
+
+
+class TestLazyConfig(object):
+
+    def test_loaded_once(self):
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return {'a': 1}
+
+        lazy = LazyConfig(loader)
+        assert not lazy.loaded
+        assert calls == []
+        assert lazy.get('a') == 1
+        assert lazy['a'] == 1
+        assert lazy.loaded
+        assert calls == [1]
+
+    @pytest.mark.parametrize('access', [len, list, repr, dict, lambda lazy: 'a' in lazy,
+                                        lambda lazy: lazy == {'a': 1}],
+                             ids=['len', 'iter', 'repr', 'dict', 'contains', 'eq'])
+    def test_access_loads(self, access):
+        lazy = LazyConfig(lambda: {'a': 1})
+        access(lazy)
+        assert lazy.loaded
+        assert lazy == {'a': 1}
+
+    def test_mutation(self):
+        lazy = LazyConfig(lambda: {'a': 1})
+        lazy['b'] = 2
+        assert lazy == {'a': 1, 'b': 2}
+        lazy.update(a=3)
+        assert lazy.pop('b') == 2
+        assert pickle.loads(pickle.dumps(lazy)) == {'a': 3}
+        lazy.clear()
+        assert lazy == {}
+
+    def test_package_config(self):
+        assert isinstance(config, dict)
+        assert config['fuzzy_score_cutoff'] == 75
+
+
+class TestImport(object):
+
+    def test_no_heavy_imports(self):
+        loaded = loaded_modules('fuzzy_types')
+        assert 'fuzzy_types.fuzzy' in loaded
+        assert not set(HEAVY) & set(loaded)
+
+    def test_imports_on_first_match(self):
+        code = ('import sys; from fuzzy_types import FuzzyList; '
+                "ll = FuzzyList(['apple', 'pear']); assert 'rapidfuzz' not in sys.modules; "
+                "assert ll['paer'] == 'pear'; assert 'rapidfuzz' in sys.modules")
+        subprocess.run([sys.executable, '-c', code], check=True)
+
+    def test_scorer_constants(self):
+        assert utils.DEFAULT_SCORER is fuzz.WRatio
+        assert fuzz.ratio in utils.IDENTITY_SCORERS
+        with pytest.raises(AttributeError):
+            utils.NOT_A_SCORER
+
+
+def test_get_config_caller_path(tmp_path):
+    (tmp_path / 'etc').mkdir()
+    (tmp_path / 'etc' / 'demo.yml').write_text('answer: 42\n')
+    module = tmp_path / 'demo.py'
+    module.write_text('from fuzzy_types.configuration import get_config\n'
+                      "config = get_config('demo', allow_user=False)\n")
+
+    spec = importlib.util.spec_from_file_location('demo', str(module))
+    demo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(demo)
+    assert demo.config == {'answer': 42}
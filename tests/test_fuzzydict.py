@@ -15,6 +15,7 @@ from __future__ import print_function, division, absolute_import
 import pytest
 from collections import OrderedDict
 from fuzzy_types.fuzzy import FuzzyDict, FuzzyOrderedDict
+from fuzzy_types.utils import AmbiguousMatchError, get_best_fuzzy
 
 
 real = {'apple': 1, 'banana': 2, 'orange': 3, 'pear': 4}
@@ -78,6 +79,196 @@ class TestDict(object):
         assert fd['afd'] == 5
         assert fd['stu'] == 'hello'
         assert fd['stuff'] == 'hello'
+
+    @pytest.mark.parametrize('kls', [FuzzyDict, FuzzyOrderedDict], ids=['fuzzy', 'fuzzyord'])
+    def test_choices_cached(self, kls):
+        fd = kls(real)
+        assert fd['appl'] == 1
+        index = fd._choice_index
+        assert fd['paer'] == 4
+        assert fd._choice_index is index
+        fd['apple'] = 10
+        assert fd._choice_index is index
+
+    @pytest.mark.parametrize('kls', [FuzzyDict, FuzzyOrderedDict], ids=['fuzzy', 'fuzzyord'])
+    def test_choices_mutation(self, kls):
+        fd = kls(real)
+        assert fd.choices == ['apple', 'banana', 'orange', 'pear']
+        fd['mandarin'] = 5
+        assert fd['mandarn'] == 5
+        del fd['apple']
+        assert 'apple' not in fd.choices
+        fd.update({'kiwi': 6})
+        assert fd['kiwii'] == 6
+        fd.pop('kiwi')
+        fd.setdefault('grape', 7)
+        assert fd['grap'] == 7
+        assert fd.choices == ['banana', 'orange', 'pear', 'mandarin', 'grape']
+        fd.popitem()
+        assert 'grape' not in dir(fd)
+        fd.clear()
+        assert fd.choices == []
+
+    def test_exact_first(self):
+        def no_fuzzy(value, choices):
+            raise AssertionError('fuzzy matching should not run')
+
+        fd = FuzzyDict(real, use_fuzzy=no_fuzzy)
+        assert fd['apple'] == 1
+        assert 'pear' in fd
+
+    def test_exact_first_off(self):
+        calls = []
+
+        def counting_fuzzy(value, choices):
+            calls.append(value)
+            return value
+
+        fd = FuzzyDict(real, use_fuzzy=counting_fuzzy, exact_first=False)
+        assert fd['apple'] == 1
+        assert calls == ['apple']
+        assert fd.copy()._exact_first is False
+
+    def test_exact_mapped_key(self):
+        fd = FuzzyDict({1: 'one', 'two': 2})
+        assert fd['1'] == 'one'
+
+    @pytest.mark.parametrize('exact', [True, False], ids=['exact', 'noexact'])
+    def test_exact_shared_choice(self, exact):
+        class Colour(object):
+            def __str__(self):
+                return 'color'
+
+        # the key looked up wins over other keys with the same choice
+        fd = FuzzyDict({100: 'int key', '100': 'string key', Colour(): 'object',
+                        'color': 'string key'}, exact_first=exact)
+        assert fd['100'] == 'string key'
+        assert fd['color'] == fd.get('color') == 'string key'
+        assert fd.get_many(['100', 'color'], errors='none') == ['string key', 'string key']
+
+        # otherwise the keys tie
+        fd = FuzzyDict({Colour(): 1, Colour(): 2}, exact_first=exact)
+        with pytest.raises(AmbiguousMatchError):
+            fd['color']
+        assert fd.get_many(['color'], errors='none') == [None]
+
+    @pytest.mark.parametrize('options', [{}, {'ngram_candidates': 2}, {'cache_size': 4}],
+                             ids=['default', 'ngrams', 'cache'])
+    def test_shared_choice_tie(self, options):
+        class Apple(object):
+            def __str__(self):
+                return 'apple'
+
+        # distinct keys with the same choice tie, as with get_best_fuzzy on the choices
+        fd = FuzzyDict({'apple': 1, Apple(): 2, 'pear': 3}, **options)
+        with pytest.raises(AmbiguousMatchError, match="'appel'"):
+            get_best_fuzzy('appel', fd.choices)
+        for __ in range(2):
+            with pytest.raises(AmbiguousMatchError, match="'appel'"):
+                fd['appel']
+        matches = fd.match_many(['appel', 'pearr'], errors='marker')
+        assert type(matches[0]) is AmbiguousMatchError
+        assert matches[1].choice == 'pear'
+
+    @pytest.mark.parametrize('dd', [(fuzzy), (ordered)], ids=['fuzzy', 'fuzzyord'])
+    def test_get_many(self, dd):
+        assert dd.get_many(['apple', 'appl', 'paer', 'bannaa']) == [1, 1, 4, 2]
+        assert dd.get_many(['orange', 'mandarin'], errors='none') == [3, None]
+        matches = dd.match_many(['oragne'])
+        assert matches[0].choice == 'orange'
+        assert matches[0].index == 2
+
+    def test_cache(self):
+        calls = []
+
+        def counting_fuzzy(value, choices):
+            calls.append(value)
+            return get_best_fuzzy(value, choices)
+
+        fd = FuzzyDict(real, use_fuzzy=counting_fuzzy, cache_size=2)
+        assert fd['appl'] == 1
+        assert fd['appl'] == 1
+        assert calls == ['appl']
+        for __ in range(2):
+            with pytest.raises(ValueError, match='mandarin'):
+                fd['mandarin']
+        assert calls == ['appl', 'mandarin']
+        assert fd.cache_info() == (2, 2, 2, 2)
+
+        # least recently used entry is evicted
+        assert fd['paer'] == 4
+        assert fd['appl'] == 1
+        assert calls[-1] == 'appl'
+
+        # mutation clears the cache
+        fd['mandarin'] = 5
+        assert fd['mandarin'] == 5
+        assert fd.cache_info().currsize == 0
+        assert fd.copy().cache_info().maxsize == 2
+
+    def test_cache_disabled(self):
+        assert FuzzyDict(real).cache_info() is None
+
+    def test_nested_settings(self):
+        fd = FuzzyDict({'fruits': real}, dottable=False, exact_first=False)
+        assert isinstance(fd['fruits'], FuzzyDict)
+        assert fd['fruts']['paer'] == 4
+        assert fd['fruits']._dottable is False
+        assert fd['fruits']._exact_first is False
+
+    @pytest.mark.parametrize('kls', [FuzzyDict, FuzzyOrderedDict], ids=['fuzzy', 'fuzzyord'])
+    def test_lazy(self, kls):
+        nested = {'fruits': dict(real), 'other': {'deep': {'carrot': 5}}, 'count': 1}
+        fd = kls(nested, lazy=True, dottable=False)
+        assert type(dict.__getitem__(fd, 'fruits')) is dict
+
+        fruits = fd['frutis']
+        assert isinstance(fruits, kls)
+        assert fruits['paer'] == 4
+        assert fruits._dottable is False
+        assert fruits._lazy is True
+        assert fd['fruits'] is fruits
+        assert fd.get('fruits') is fruits
+        assert fd['othr']['deep']['carot'] == 5
+        assert fd.get('missing', 3) == 3
+
+    @pytest.mark.parametrize('kls', [FuzzyDict, FuzzyOrderedDict], ids=['fuzzy', 'fuzzyord'])
+    def test_lazy_same_as_eager(self, kls):
+        def make(lazy):
+            return kls({'fruits': dict(real), 'other': {'deep': 1}, 'more': {'x': 2},
+                        'count': 1}, lazy=lazy)
+
+        def types(values):
+            return [type(value) for value in values]
+
+        eager, lazy = make(False), make(True)
+        assert types(lazy.values()) == types(eager.values()) == [kls, kls, kls, int]
+        assert [(key, type(value)) for key, value in lazy.items()] == \
+            [(key, type(value)) for key, value in eager.items()]
+
+        eager, lazy = make(False), make(True)
+        for fd in (eager, lazy):
+            fd['more'] = {'y': 3}
+        assert type(lazy.setdefault('fruits')) is type(eager.setdefault('fruits')) is kls
+        assert type(lazy.pop('other')) is type(eager.pop('other')) is kls
+        assert type(lazy.popitem()[1]) is type(eager.popitem()[1]) is int
+        # values set after initialization are kept as is
+        assert type(lazy['more']) is type(eager['more']) is dict
+        assert lazy.to_original(deep=True) == eager.to_original(deep=True)
+
+    def test_tooriginal_deep(self):
+        fruits = dict(real)
+        fd = FuzzyDict({'fruits': fruits, 'other': {'deep': {'carrot': 5}}}, lazy=True)
+        assert fd['other']['deep']['carrot'] == 5
+
+        old = fd.to_original(deep=True)
+        assert type(old['other']) is dict
+        assert type(old['other']['deep']) is dict
+        assert old['other'] == {'deep': {'carrot': 5}}
+        assert old['fruits'] is fruits
+
+        shallow = fd.to_original()
+        assert isinstance(shallow['other'], FuzzyDict)
                 
 class TestDictFails(object):
     
@@ -91,5 +282,6 @@ class TestDictFails(object):
         with pytest.raises(ValueError) as cm:
             fuzzy['mandarin']
         assert cm.type == ValueError
-        assert "Cannot find a good match for 'mandarin'. Your input value is too ambiguous." in str(cm.value)
+        assert "Cannot find a good match for 'mandarin'. Your input value is too ambiguous." in \
+            str(cm.value)
     
@@ -14,6 +14,8 @@
 from __future__ import print_function, division, absolute_import
 import pytest
 from fuzzy_types.fuzzy import FuzzyList
+from fuzzy_types.matcher import Matcher
+from fuzzy_types.utils import AmbiguousMatchError
 
 
 real = ['apple', 'banana', 'orange', 'pear']
@@ -97,6 +99,86 @@ class TestList(object):
         assert fd[3] == toys[3]
         assert fd.choices[0] == 'car'
         assert fd['raagg'] == toys[4]
+
+    def test_choices_cached(self):
+        fd = FuzzyList(real)
+        assert fd['appl'] == 'apple'
+        index = fd._choice_index
+        assert fd['paer'] == 'pear'
+        assert fd._choice_index is index
+
+    def test_choices_mutation(self):
+        fd = FuzzyList(real)
+        fd.append('mandarin')
+        assert fd['mandarn'] == 'mandarin'
+        fd.remove('apple')
+        assert 'apple' not in fd.choices
+        fd.extend(['kiwi'])
+        fd.insert(0, 'grape')
+        assert fd['grap'] == 'grape'
+        fd[0] = 'cherry'
+        assert fd['chery'] == 'cherry'
+        fd.sort()
+        assert fd.choices == sorted(fd.choices)
+        fd.reverse()
+        fd.pop()
+        del fd[0]
+        fd += ['lemon']
+        assert fd.choices == list(fd)
+        fd.clear()
+        assert fd.choices == []
+
+    def test_exact_first(self):
+        fd = FuzzyList(['ab', 'apple', 'apple'])
+        assert fd['ab'] == 'ab'
+        assert 'apple' in fd
+        assert fd['apple'] == 'apple'
+
+    def test_exact_first_off(self):
+        fd = FuzzyList(['apple', 'pear'], exact_first=False)
+        assert fd['apple'] == 'apple'
+        assert fd['paer'] == 'pear'
+
+    @pytest.mark.parametrize('exact', [True, False], ids=['exact', 'noexact'])
+    def test_duplicates(self, exact):
+        # distinct items with the same choice tie
+        dupes = [Toy('car'), Toy('truck'), Toy('car')]
+        fd = FuzzyToy(dupes, exact_first=exact)
+        with pytest.raises(AmbiguousMatchError):
+            fd['car']
+        with pytest.raises(AmbiguousMatchError):
+            fd['carr']
+        assert fd['truck'] is dupes[1]
+        assert FuzzyToy(dupes, use_fuzzy=Matcher(ties='first'))['carr'] is dupes[0]
+
+        # repeated items don't
+        fd = FuzzyList(['car', 'truck', 'car'], exact_first=exact)
+        assert fd['car'] == 'car'
+        assert fd['carr'] == 'car'
+
+    def test_get_many(self):
+        fd = FuzzyToy(toys)
+        assert fd.get_many(['car', 'raagg', 'dol']) == [toys[0], toys[4], toys[5]]
+        with pytest.raises(ValueError):
+            fd.get_many(['car', 'xylophone'])
+
+    def test_get_many_custom(self):
+        fd = FuzzyList(real, use_fuzzy=lambda value, choices: 'pear')
+        matches = fd.match_many(['apple', 'anything'])
+        assert matches[0].score == 100
+        assert matches[1].choice == 'pear'
+        assert matches[1].score is None
+
+    def test_cache(self):
+        fd = FuzzyList(real, cache_size=10)
+        assert fd['appl'] == 'apple'
+        assert fd['appl'] == 'apple'
+        assert fd.cache_info().hits == 1
+        fd.append('apply')
+        with pytest.raises(ValueError):
+            fd['appl']
+
+
 class TestListFails(object):
 
     @pytest.mark.parametrize('item', [('mandarin'), ('apple')], ids=['noitem', 'fuzzyitem'])
@@ -110,8 +192,8 @@ class TestListFails(object):
         with pytest.raises(ValueError) as cm:
             fuzzy['mandarin']
         assert cm.type == ValueError
-        assert "Cannot find a good match for 'mandarin'. Your input value is too ambiguous." in str(
-            cm.value)
+        assert "Cannot find a good match for 'mandarin'. Your input value is too ambiguous." in \
+            str(cm.value)
 
     def test_tooshort(self):
         with pytest.raises(AssertionError) as cm:
@@ -12,7 +12,11 @@
 
 
 from __future__ import print_function, division, absolute_import
+import pickle
+import pytest
 from fuzzy_types.fuzzy import FuzzyStr
+from fuzzy_types.matcher import Matcher
+from fuzzy_types.utils import get_best_fuzzy
 
 real = 'apple'
 fuzzy = FuzzyStr(real)
@@ -22,3 +26,68 @@ def test_fuzzy_str_eq():
     assert 'appl' != real
     assert 'appl' == fuzzy
     assert 'chocolate' != fuzzy
+    assert not fuzzy != 'appl'
+    assert fuzzy != 'chocolate'
+
+
+def test_fuzzy_str_slots():
+    assert not hasattr(fuzzy, '__dict__')
+    assert fuzzy.use_fuzzy is FuzzyStr('pear').use_fuzzy
+    with pytest.raises(AttributeError):
+        fuzzy.other = 1
+
+
+def test_fuzzy_str_short():
+    # too short to fuzzy match, but still equal when exact
+    assert 'ap' != fuzzy
+    assert FuzzyStr('ap') == 'ap'
+
+
+def test_fuzzy_str_hash():
+    assert hash(fuzzy) == hash(real)
+    assert fuzzy in {real}
+    assert {fuzzy: 1}[real] == 1
+    assert len({FuzzyStr('apple'), FuzzyStr('apple')}) == 1
+
+    lower = FuzzyStr('Apple', normalize='casefold')
+    assert lower == 'APPLE'
+    assert hash(lower) == hash(FuzzyStr('APPLE', normalize='casefold'))
+    assert 'apple' in {lower}
+
+
+def test_fuzzy_str_matcher():
+    strict = FuzzyStr('apple', use_fuzzy=Matcher(min_score=95))
+    assert 'appl' != strict
+    assert FuzzyStr('apple', use_fuzzy=get_best_fuzzy).use_fuzzy is fuzzy.use_fuzzy
+
+
+def test_fuzzy_str_custom():
+    def first(value, choices):
+        if value[0] != choices[0][0]:
+            raise ValueError('no match')
+        return choices[0]
+
+    custom = FuzzyStr('apple', use_fuzzy=first)
+    assert 'avocado' == custom
+    assert 'pear' != custom
+    assert custom.matches_any(['pear', 'avocado'])
+
+
+def test_matches_any():
+    assert fuzzy.matches_any(['chocolate', 'appel'])
+    assert fuzzy.matches_any(iter(['apple']))
+    assert not fuzzy.matches_any(['chocolate', 'ap'])
+    assert not fuzzy.matches_any([])
+    values = ['chocolate', 'appl', 'pear', 'zzz']
+    assert fuzzy.matches_any(values) == any(value == fuzzy for value in values)
+    assert FuzzyStr('Apple', normalize='casefold').matches_any(['APPLE'])
+
+
+def test_fuzzy_str_pickle():
+    kopy = pickle.loads(pickle.dumps(fuzzy))
+    assert kopy == 'appl'
+    assert kopy.use_fuzzy is fuzzy.use_fuzzy
+    lower = pickle.loads(pickle.dumps(FuzzyStr('Apple', use_fuzzy=Matcher(min_score=90),
+                                               normalize='casefold')))
+    assert lower == 'APPLE'
+    assert lower.use_fuzzy == Matcher(min_score=90)
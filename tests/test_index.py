@@ -0,0 +1,289 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: test_index.py
+# Project: tests
+# Author: Brian Cherinka
+# Created: Friday, 16th October 2026 2:31:40 pm
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Friday, 16th October 2026 2:31:40 pm
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+import pickle
+import random
+import string
+import pytest
+from fuzzy_types.fuzzy import FuzzyDict, FuzzyList, FuzzyOrderedDict
+from rapidfuzz import fuzz
+from fuzzy_types.index import TOMBSTONE, ChoiceIndex, NgramIndex, Prefilter
+from fuzzy_types.utils import get_best_fuzzy
+
+
+def make_corpus(size, seed=11):
+    """ creates a list of random unique words """
+    rng = random.Random(seed)
+    words = (''.join(rng.choices(string.ascii_lowercase, k=rng.randint(5, 12)))
+             for __ in range(size))
+    return list(dict.fromkeys(words))
+
+
+def make_typos(words, size, seed=12):
+    """ creates a list of words with a single character typo """
+    rng = random.Random(seed)
+    typos = []
+    for __ in range(size):
+        word = rng.choice(words)
+        i = rng.randrange(len(word))
+        typos.append(word[:i] + rng.choice(string.ascii_lowercase) + word[i + 1:])
+    return typos
+
+
+@pytest.fixture(scope='module')
+def corpus():
+    return make_corpus(20000)
+
+
+class TestChoiceIndex(object):
+
+    def test_index(self):
+        index = ChoiceIndex([1, 'apple', 'pear', 'apple'], str)
+        assert index.choices == ['1', 'apple', 'pear', 'apple']
+        assert index.unique == ['1', 'apple', 'pear']
+        assert index.exact('apple') == 1
+        assert index.exact('appl') is None
+
+    def test_update(self):
+        index = ChoiceIndex(['apple', 'pear'], str)
+        index.prefilter
+        index.ngrams
+        assert index.add('kiwi', str) == 2
+        assert index.exact('kiwi') == 2
+        assert index.unique == ['apple', 'pear', 'kiwi']
+        assert index.prefilter.lengths.tolist() == [5, 4, 4]
+        assert index.ngrams.shortlist('kiw', 10) == ['kiwi']
+        index.discard('pear')
+        assert index.keys[1] is TOMBSTONE
+        assert index.exact('pear') is None
+        assert index.unique == ['apple', None, 'kiwi']
+        assert index.ngrams.shortlist('pea', 10) == []
+        assert 1 not in index.prefilter.candidates('pear', fuzz.WRatio, 50)
+        assert index.live_choices() == ['apple', 'kiwi']
+        assert index.live_unique() == ['apple', 'kiwi']
+        index.pop()
+        assert index.exact('kiwi') is None
+        assert (index.dead, index.vacant, index.changes) == (1, 2, 3)
+
+        compact = index.compacted()
+        assert compact.keys == ['apple']
+        assert compact.unique == ['apple']
+        assert compact.exact('apple') == 0
+        assert compact.changes == 0 and compact._ngrams is not None
+
+    def test_normalized(self):
+        index = ChoiceIndex(['Apple', 'pear'], str, normalizer=str.casefold)
+        index.add('APPLE', str, str.casefold)
+        assert index.choices == ['Apple', 'pear', 'APPLE']
+        assert index.forms == ['apple', 'pear', 'apple']
+        index.discard('Apple')
+        assert index.exact('apple') == 2
+        assert index.unique == ['apple', 'pear']
+
+    def test_pickle(self):
+        index = ChoiceIndex(['apple', 'pear'], str)
+        index.discard('apple')
+        assert pickle.loads(pickle.dumps(index)).keys[0] is TOMBSTONE
+
+
+class TestNgramIndex(object):
+
+    def test_grams(self):
+        ngrams = NgramIndex(['apple'])
+        assert ngrams.grams('pear') == {' pe', 'pea', 'ear', 'ar '}
+        assert ngrams.grams('a') == {' a '}
+
+    def test_shortlist(self):
+        ngrams = NgramIndex(['apple', 'banana', 'orange', 'pear'])
+        assert ngrams.shortlist('appl', 1) == ['apple']
+        assert ngrams.shortlist('pea', 10) == ['pear']
+        assert ngrams.shortlist('banapple', 10) == ['apple', 'banana']
+        assert ngrams.shortlist('xyz', 10) == []
+
+    def test_agreement(self, corpus):
+        fuzzy = FuzzyList(corpus, ngram_candidates=50)
+        agree = total = 0
+        for typo in make_typos(corpus, 100):
+            try:
+                brute = get_best_fuzzy(typo, corpus)
+            except ValueError:
+                continue
+            total += 1
+            try:
+                agree += fuzzy[typo] == brute
+            except ValueError:
+                pass
+        assert total > 50
+        assert agree / total >= 0.98
+
+    def test_fuzzy_dict(self):
+        fd = FuzzyDict({'apple': 1, 'banana': 2, 'orange': 3, 'pear': 4}, ngram_candidates=2)
+        assert fd['appl'] == 1
+        assert fd.get_many(['oragne', 'bannaa']) == [3, 2]
+        with pytest.raises(ValueError):
+            fd['xyz']
+
+
+class TestPrefilter(object):
+
+    @pytest.mark.parametrize('scorer', [fuzz.ratio, fuzz.QRatio, fuzz.partial_ratio, fuzz.WRatio],
+                             ids=['ratio', 'qratio', 'partial', 'wratio'])
+    def test_bounds(self, scorer):
+        rng = random.Random(5)
+        alphabet = 'abcdeABC  xyz\u00e9'
+        for __ in range(200):
+            choices = [''.join(rng.choices(alphabet, k=rng.randint(0, 30))) for __ in range(20)]
+            value = ''.join(rng.choices(alphabet, k=rng.randint(0, 30)))
+            prefilter = Prefilter(choices)
+            keep = set(prefilter.candidates(value, scorer, 60))
+            for idx, choice in enumerate(choices):
+                if scorer(value, choice) >= 60:
+                    assert idx in keep
+
+    def test_pruned(self):
+        prefilter = Prefilter(['apple', 'banana', 'orange', 'pear', 'a' * 50])
+        assert prefilter.candidates('appel', fuzz.ratio, 75) == [0]
+        assert prefilter.pruned == 4
+        assert prefilter.scanned == 5
+        assert prefilter.candidates('appel', fuzz.token_sort_ratio, 75) is None
+        assert prefilter.shortlist('appel', fuzz.token_sort_ratio, 75) == prefilter.choices
+
+    def test_fuzzy_list(self, corpus):
+        fuzzy = FuzzyList(corpus[:5000] + ['x' * 60])
+        brute = FuzzyList(corpus[:5000] + ['x' * 60], prefilter=False)
+        for typo in make_typos(corpus[:5000], 20) + ['xxxxxxxxxx']:
+            try:
+                expected = brute[typo]
+            except ValueError:
+                expected = None
+            try:
+                assert fuzzy[typo] == expected
+            except ValueError:
+                assert expected is None
+        assert fuzzy._choice_index.prefilter.pruned > 0
+
+
+class TestIncremental(object):
+
+    @pytest.fixture()
+    def no_rebuild(self, monkeypatch):
+        def fail(self):
+            raise AssertionError('the index was rebuilt')
+        monkeypatch.setattr(FuzzyDict, '_build_index', fail)
+        monkeypatch.setattr(FuzzyOrderedDict, '_build_index', fail)
+        monkeypatch.setattr(FuzzyList, '_build_index', fail)
+
+    @pytest.mark.parametrize('kind', [FuzzyDict, FuzzyOrderedDict])
+    @pytest.mark.parametrize('options', [{}, {'ngram_candidates': 20}, {'normalize': 'casefold'},
+                                         {'cache_size': 100}],
+                             ids=['prefilter', 'ngram', 'normalize', 'cache'])
+    def test_dict(self, corpus, kind, options, request, monkeypatch):
+        rng = random.Random(3)
+        words = corpus[:3000]
+        fuzzy = kind(dict.fromkeys(words[:2000], 0), **options)
+        fuzzy.get_many(words[:10])
+        fuzzy._choice_index.prefilter
+        request.getfixturevalue('no_rebuild')
+
+        for i, word in enumerate(words[2000:]):
+            op = rng.randrange(6)
+            key = rng.choice(list(fuzzy))
+            if op == 0:
+                fuzzy[word] = i
+            elif op == 1:
+                del fuzzy[key]
+            elif op == 2:
+                fuzzy.update({word: i, key: i})
+            elif op == 3:
+                fuzzy.pop(key)
+            elif op == 4:
+                fuzzy.setdefault(word, i)
+            else:
+                fuzzy.popitem()
+            if i % 100 == 0:
+                fuzzy.get_many(make_typos(words, 5, seed=i), errors='none')
+
+        monkeypatch.undo()
+        fresh = kind(dict(fuzzy), **options)
+        assert fuzzy.choices == fresh.choices
+        typos = make_typos(list(fuzzy), 100) + make_typos(words, 50, seed=9)
+        assert fuzzy.get_many(typos, errors='none') == fresh.get_many(typos, errors='none')
+        for typo in typos[:20]:
+            assert fuzzy.get(typo) == fresh.get(typo)
+            try:
+                expected = fresh[typo]
+            except ValueError:
+                with pytest.raises(ValueError):
+                    fuzzy[typo]
+            else:
+                assert fuzzy[typo] == expected
+
+    def test_move_to_end(self, no_rebuild):
+        fuzzy = FuzzyOrderedDict({'apple': 1, 'pear': 2})
+        fuzzy._index = ChoiceIndex(fuzzy, str)
+        fuzzy.move_to_end('apple')
+        assert fuzzy.choices == ['pear', 'apple']
+        assert fuzzy['aple'] == 1
+
+    def test_list(self, corpus, no_rebuild):
+        words = corpus[:2000]
+        fuzzy = FuzzyList(words[:1000])
+        fuzzy._index = ChoiceIndex(fuzzy, str)
+        fuzzy.append(words[1000])
+        fuzzy.extend(words[1001:1500])
+        fuzzy += words[1500:1600]
+        fuzzy.insert(len(fuzzy), words[1600])
+        assert fuzzy.pop() == words[1600]
+        del fuzzy[-1]
+        fuzzy.pop(len(fuzzy) - 1)
+        assert fuzzy.choices == words[:1598]
+        # positions are still list positions
+        matches = fuzzy.match_many(words[1590:1600], errors='none')
+        assert [match.index for match in matches[:8]] == list(range(1590, 1598))
+        assert matches[8:] == [None, None]
+
+    def test_rebuild(self):
+        fuzzy = FuzzyList(['apple', 'pear', 'kiwi'])
+        index = fuzzy._choice_index
+        fuzzy.insert(0, 'banana')
+        assert fuzzy._index is None
+        assert fuzzy['bananna'] == 'banana'
+        assert fuzzy._choice_index is not index
+
+    def test_compaction(self, monkeypatch):
+        monkeypatch.setattr(ChoiceIndex, 'compact_min', 10)
+        fuzzy = FuzzyDict({f'key{i}': i for i in range(40)})
+        index = fuzzy._choice_index
+        for i in range(10):
+            del fuzzy[f'key{i}']
+        assert fuzzy._index is index and index.dead == 10
+        del fuzzy['key10']
+        assert fuzzy._index is not index
+        assert fuzzy._index.dead == 0
+        assert fuzzy._index.keys == [f'key{i}' for i in range(11, 40)]
+        assert fuzzy['key39'] == 39
+
+    def test_failed_mapper(self):
+        class Fussy(FuzzyList):
+            @staticmethod
+            def mapper(item):
+                assert item != 'bad', 'bad item'
+                return str(item)
+
+        fuzzy = Fussy(['apple', 'pear'])
+        fuzzy._choice_index
+        fuzzy.append('bad')
+        assert fuzzy._index is None
+        with pytest.raises(AssertionError, match='bad item'):
+            fuzzy['aple']
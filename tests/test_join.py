@@ -0,0 +1,109 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: test_join.py
+# Project: tests
+# Author: Brian Cherinka
+# Created: Friday, 16th October 2026 11:48:25 pm
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Friday, 16th October 2026 11:48:25 pm
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+import random
+import pytest
+from fuzzy_types import join
+from fuzzy_types.fuzzy import FuzzyDict, FuzzyList
+from fuzzy_types.join import Pair, fuzzy_join
+from fuzzy_types.matcher import Matcher
+from rapidfuzz import fuzz
+from benchmarks.vocab import make_typo, synthetic_words
+
+
+schema = {'customer_id': 1, 'customer_name': 2, 'order_date': 3, 'total': 4}
+vendor = ['custmer_id', 'customer_nme', 'orderdate', 'customer id', 'zzz']
+
+
+class TestManyToOne(object):
+
+    def test_join(self):
+        pairs = FuzzyDict(schema).join(vendor)
+        assert [(pair.left, pair.right) for pair in pairs] == [
+            ('custmer_id', 'customer_id'), ('customer_nme', 'customer_name'),
+            ('orderdate', 'order_date'), ('customer id', 'customer_id')]
+        assert all(pair.score > 75 for pair in pairs)
+
+    def test_unmatched(self):
+        pairs = fuzzy_join(vendor, schema, unmatched=True)
+        assert len(pairs) == len(vendor)
+        assert pairs[-1] == Pair('zzz', None, None)
+
+    def test_match_many(self):
+        words = synthetic_words(500, seed=2)
+        rng = random.Random(2)
+        typos = [make_typo(word, rng) for word in rng.choices(words, k=200)]
+        fuzzy = FuzzyList(words)
+        matches = fuzzy.match_many(typos, errors='none')
+        expected = [Pair(typo, match.choice, match.score)
+                    for typo, match in zip(typos, matches) if match is not None]
+        assert fuzzy_join(typos, words) == expected
+
+    def test_settings(self):
+        pairs = fuzzy_join(['APPLE', 'Pear'], ['apple', 'pear'], normalize='casefold',
+                           matcher=Matcher(min_score=90))
+        assert pairs == [Pair('APPLE', 'apple', 100), Pair('Pear', 'pear', 100)]
+        # the settings of a fuzzy right collection are kept
+        right = FuzzyList(['apple', 'pear'], normalize='casefold')
+        assert [pair.right for pair in fuzzy_join(['APPL'], right)] == ['apple']
+
+    def test_fuzzy_left(self):
+        left = FuzzyDict({'aple': 1, 'paer': 2, 'kiwi': 3})
+        left._choice_index
+        del left['kiwi']
+        pairs = fuzzy_join(left, ['apple', 'pear', 'kiwi'])
+        assert [(pair.left, pair.right) for pair in pairs] == [('aple', 'apple'), ('paer', 'pear')]
+
+
+class TestOneToOne(object):
+
+    def test_unique(self):
+        pairs = FuzzyDict(schema).join(vendor, one_to_one=True, unmatched=True)
+        rights = [pair.right for pair in pairs if pair.right is not None]
+        assert len(rights) == len(set(rights)) == 3
+        assert pairs[3] == Pair('customer id', None, None)
+
+    def test_global(self):
+        # the best pair overall wins, even for a later left item
+        matcher = Matcher(scorer=fuzz.ratio, min_score=50)
+        pairs = fuzzy_join(['abcdefxx', 'abcdefgz'], ['abcdefgh', 'abcdwxyz'], one_to_one=True,
+                           matcher=matcher)
+        assert pairs == [Pair('abcdefxx', 'abcdwxyz', 62.5), Pair('abcdefgz', 'abcdefgh', 87.5)]
+
+    def test_exact_first(self):
+        pairs = fuzzy_join(['aple', 'apple', 'apple'], ['apple', 'aple2'], one_to_one=True)
+        assert pairs == [Pair('aple', 'aple2', pytest.approx(88.9, abs=0.1)),
+                         Pair('apple', 'apple', 100)]
+
+    def test_duplicate_forms(self):
+        right = FuzzyList(['Apple', 'APPLE', 'pear'], normalize='casefold')
+        pairs = fuzzy_join(['apple', 'aple', 'appl'], right, one_to_one=True)
+        assert [(pair.left, pair.right) for pair in pairs] == [('apple', 'Apple'),
+                                                               ('aple', 'APPLE')]
+
+    def test_chunks(self, monkeypatch):
+        words = synthetic_words(300, seed=4)
+        rng = random.Random(4)
+        typos = [make_typo(word, rng) for word in rng.choices(words, k=100)]
+        expected = fuzzy_join(typos, words, one_to_one=True, candidates=5)
+        monkeypatch.setattr(join, 'CDIST_CELLS', 1000)
+        assert fuzzy_join(typos, words, one_to_one=True, candidates=5) == expected
+        rights = [pair.right for pair in expected]
+        assert len(rights) == len(set(rights)) > 50
+
+    def test_custom(self):
+        fuzzy = FuzzyList(['apple'], use_fuzzy=lambda value, choices: choices[0])
+        assert fuzzy.join(['pear']) == [Pair('pear', 'apple', None)]
+        with pytest.raises(AssertionError, match='Matcher'):
+            fuzzy.join(['pear'], one_to_one=True)
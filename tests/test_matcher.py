@@ -0,0 +1,173 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: test_matcher.py
+# Project: tests
+# Author: Brian Cherinka
+# Created: Friday, 16th October 2026 8:04:52 pm
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Friday, 16th October 2026 8:04:52 pm
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+import pickle
+import random
+import pytest
+from rapidfuzz import fuzz, utils as fuzz_utils
+from fuzzy_types import config
+from fuzzy_types.fuzzy import FuzzyList
+from fuzzy_types.matcher import Matcher
+from fuzzy_types.utils import AmbiguousMatchError, Match, get_best_fuzzy, get_best_fuzzy_many
+from benchmarks.vocab import make_typo, realistic_words
+
+
+choices = ['apple', 'banana', 'orange', 'pear', 'grape1', 'grape2']
+
+
+@pytest.fixture()
+def cutoff():
+    """ Restores the config score cutoff after a test changes it """
+    original = config['fuzzy_score_cutoff']
+    yield
+    config['fuzzy_score_cutoff'] = original
+
+
+class TestMatcher(object):
+
+    def test_defaults(self):
+        matcher = Matcher()
+        assert matcher('paer', choices) == get_best_fuzzy('paer', choices)
+        assert matcher('paer', choices, return_score=True) == \
+            get_best_fuzzy('paer', choices, return_score=True)
+        assert matcher.scorer is fuzz.WRatio
+        assert matcher.min_score == 75
+        assert matcher.min_length == 3
+        with pytest.raises(AmbiguousMatchError):
+            matcher('grape', choices)
+        with pytest.raises(AssertionError, match='at least 3 characters'):
+            matcher('ap', choices)
+
+    def test_follows_config(self, cutoff):
+        matcher = Matcher()
+        pinned = Matcher(min_score=75)
+        version = config.version
+        assert matcher('bannna', choices) == 'banana'
+
+        config['fuzzy_score_cutoff'] = 95
+        assert config.version == version + 1
+        assert matcher.min_score == 95
+        assert pinned.min_score == 75
+        with pytest.raises(ValueError):
+            matcher('bannna', choices)
+        assert pinned('bannna', choices) == 'banana'
+
+    def test_config_reload(self, cutoff):
+        matcher = Matcher()
+        config['fuzzy_score_cutoff'] = 95
+        assert matcher.min_score == 95
+        config.reload()
+        assert not config.loaded
+        assert matcher.min_score == 75
+
+    def test_min_score_zero(self):
+        with pytest.raises(ValueError):
+            get_best_fuzzy('zebra', ['apple', 'banana'])
+        assert get_best_fuzzy('zebra', ['apple', 'banana'], min_score=0) == 'banana'
+        assert Matcher(min_score=0)('zebra', ['apple', 'banana']) == 'banana'
+        matches = get_best_fuzzy_many(['zebra'], ['apple', 'banana'], min_score=0)
+        assert matches[0].choice == 'banana'
+
+    def test_ties_first(self):
+        matcher = Matcher(ties='first')
+        assert matcher('grape', choices) == 'grape1'
+        assert matcher.many(['grape', 'paer'], choices) == \
+            [Match('grape1', pytest.approx(90.9, abs=0.1), 4), Match('pear', 75.0, 3)]
+        with pytest.raises(AssertionError, match='invalid ties'):
+            Matcher(ties='last')
+
+    def test_processor(self):
+        with pytest.raises(ValueError):
+            get_best_fuzzy('APPLE!', ['apple', 'pear'], scorer=fuzz.ratio)
+        matcher = Matcher(scorer=fuzz.ratio, processor=fuzz_utils.default_process)
+        assert matcher('APPLE!', ['apple', 'pear'], return_score=True) == ('apple', 100, 0)
+        # equal after processing, so a perfect score does not end the scan early
+        with pytest.raises(AmbiguousMatchError):
+            matcher('apple', ['Apple'] + ['pear'] * 5000 + ['apple'])
+        assert matcher.many(['PEAR'], ['apple', 'pear'])[0].choice == 'pear'
+
+    def test_pickle(self, cutoff):
+        matcher = Matcher(scorer=fuzz.ratio, min_length=4, processor=fuzz_utils.default_process)
+        matcher('apple', choices)
+        kopy = pickle.loads(pickle.dumps(matcher))
+        assert kopy == matcher
+        assert kopy is not matcher
+        assert kopy('APPLE', choices) == 'apple'
+        assert 'scorer=ratio' in repr(kopy)
+
+        config['fuzzy_score_cutoff'] = 90
+        assert pickle.loads(pickle.dumps(Matcher())).min_score == 90
+
+
+class TestCascade(object):
+
+    def test_agrees_with_single_stage(self):
+        words = realistic_words(3000)
+        rng = random.Random(3)
+        values = [make_typo(word, rng) for word in rng.choices(words, k=200)]
+        full = Matcher()
+        cascade = Matcher(shortlist=50)
+        singles = []
+        for value in values:
+            try:
+                singles.append(cascade(value, words, return_score=True))
+            except ValueError as error:
+                singles.append(type(error))
+        expected = [tuple(match) if isinstance(match, Match) else type(match)
+                    for match in full.many(values, words, errors='marker')]
+        assert singles == expected
+        assert [tuple(match) if isinstance(match, Match) else type(match)
+                for match in cascade.many(values, words, errors='marker')] == expected
+
+    def test_rules(self):
+        # the shortlist keeps the original positions, cutoff and tie rules
+        many = ['pear', 'apple'] * 10 + ['grape1', 'grape2']
+        cascade = Matcher(shortlist=4, scorer=fuzz.ratio)
+        assert cascade('grape1', many, return_score=True) == ('grape1', 100, 20)
+        with pytest.raises(AmbiguousMatchError):
+            cascade('grape', many)
+        with pytest.raises(ValueError):
+            cascade('zebra', many)
+        assert Matcher(shortlist=4, ties='first').many(['grape'], many)[0].index == 20
+        with pytest.raises(AssertionError, match='shortlist'):
+            Matcher(shortlist=1)
+
+    def test_shortlist_scorer(self):
+        cascade = Matcher(shortlist=2, shortlist_scorer=fuzz.partial_ratio, ties='first')
+        assert pickle.loads(pickle.dumps(cascade)) == cascade
+        assert cascade('banan', choices) == 'banana'
+
+
+class TestFuzzyMatcher(object):
+
+    def test_per_instance(self):
+        ll = FuzzyList(choices)
+        other = FuzzyList(choices, use_fuzzy=get_best_fuzzy)
+        assert isinstance(ll.use_fuzzy, Matcher)
+        assert isinstance(other.use_fuzzy, Matcher)
+        assert ll.use_fuzzy is not other.use_fuzzy
+        assert ll.copy().use_fuzzy == ll.use_fuzzy
+
+    def test_custom_matcher(self):
+        ll = FuzzyList(choices, use_fuzzy=Matcher(ties='first', min_score=85))
+        assert ll['grape'] == 'grape1'
+        assert ll.get_many(['grape', 'orange']) == ['grape1', 'orange']
+        with pytest.raises(ValueError):
+            ll['oragne']
+
+    def test_follows_config(self, cutoff):
+        ll = FuzzyList(choices)
+        assert ll['bannna'] == 'banana'
+        config['fuzzy_score_cutoff'] = 95
+        assert 'bannna' not in ll
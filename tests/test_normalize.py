@@ -0,0 +1,104 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: test_normalize.py
+# Project: tests
+# Author: Brian Cherinka
+# Created: Friday, 16th October 2026 8:51:37 pm
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Friday, 16th October 2026 8:51:37 pm
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+import pickle
+import pytest
+from fuzzy_types.fuzzy import FuzzyDict, FuzzyList
+from fuzzy_types.matcher import Matcher
+from fuzzy_types.normalize import (Normalizer, casefold, collapse_whitespace, get_normalizer,
+                                   strip_accents, strip_punctuation)
+from fuzzy_types.storage import IndexFileError
+from fuzzy_types.utils import AmbiguousMatchError
+
+
+drinks = {'Café au Lait': 1, 'Crème Brûlée Latte': 2, 'Iced  Americano': 3, 'Piña Colada': 4}
+steps = ['casefold', 'accents', 'whitespace']
+
+
+class TestSteps(object):
+
+    @pytest.mark.parametrize('func, value, expected',
+                             [(casefold, 'Straße', 'strasse'),
+                              (collapse_whitespace, ' iced \t americano\n', 'iced americano'),
+                              (strip_accents, 'Crème Brûlée', 'Creme Brulee'),
+                              (strip_accents, 'plain', 'plain'),
+                              (strip_punctuation, "rock'n'roll!", 'rock n roll ')],
+                             ids=['casefold', 'whitespace', 'accents', 'ascii', 'punctuation'])
+    def test_step(self, func, value, expected):
+        assert func(value) == expected
+
+    def test_pipeline(self):
+        normalizer = Normalizer(*steps)
+        assert normalizer('  CAFÉ au  lait ') == 'cafe au lait'
+        assert normalizer.spec == steps
+        assert pickle.loads(pickle.dumps(normalizer)) == normalizer
+        assert Normalizer('default')('Café, au Lait!') == 'café  au lait'
+        with pytest.raises(AssertionError, match='invalid normalization step'):
+            Normalizer('lowercase')
+
+    def test_get_normalizer(self):
+        assert get_normalizer(None) is None
+        assert get_normalizer([]) is None
+        assert get_normalizer('casefold') == Normalizer('casefold')
+        assert get_normalizer(steps) == Normalizer(*steps)
+        assert get_normalizer(str.upper).spec == ['builtins.str.upper']
+
+
+class TestFuzzyNormalize(object):
+
+    def test_exact_and_fuzzy(self):
+        dd = FuzzyDict(drinks, normalize=steps)
+        assert dd['CAFE AU LAIT'] == 1
+        assert dd['creme brulee  latte'] == 2
+        assert dd['iced americano'] == 3
+        assert dd['pina colda'] == 4
+        assert 'café au lait' in dd
+        assert dd.choices == list(drinks)
+        assert dd.match_many(['pina colda', 'CAFE AU LAIT']) == \
+            [('Piña Colada', pytest.approx(95.2, abs=0.1), 3), ('Café au Lait', 100, 0)]
+        assert dd.copy()['CAFE AU LAIT'] == 1
+
+    def test_normalized_once(self):
+        calls = []
+
+        def counting(value):
+            calls.append(value)
+            return value.casefold()
+
+        ll = FuzzyList(['Apple', 'Banana', 'Pear'], normalize=counting)
+        assert ll['PAER'] == 'Pear'
+        assert ll['apple'] == 'Apple'
+        assert calls == ['Apple', 'Banana', 'Pear', 'PAER', 'apple']
+
+    def test_duplicate_forms(self):
+        ll = FuzzyList(['apple', 'APPLE', 'pear'], normalize='casefold')
+        assert ll['apple'] == 'apple'
+        assert ll['APPLE'] == 'APPLE'
+        with pytest.raises(AmbiguousMatchError):
+            ll['Apple']
+        with pytest.raises(AmbiguousMatchError):
+            ll['aple']
+
+    def test_index_file(self, tmp_path):
+        path = tmp_path / 'drinks.fzi'
+        FuzzyDict(drinks, normalize=steps).save_index(path)
+        dd = FuzzyDict.from_index(path, store=drinks, normalize=steps)
+        assert dd._choice_index.forms[0] == 'cafe au lait'
+        assert dd['pina colda'] == 4
+        with pytest.raises(IndexFileError, match='normalizer'):
+            FuzzyDict.from_index(path, store=drinks)
+
+    def test_matcher_processor(self):
+        matcher = Matcher(processor=Normalizer(*steps))
+        assert matcher('PINA COLADA', list(drinks), return_score=True) == ('Piña Colada', 100, 3)
@@ -0,0 +1,136 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: test_sharded.py
+# Project: tests
+# Author: Brian Cherinka
+# Created: Friday, 16th October 2026 9:47:26 pm
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Friday, 16th October 2026 9:47:26 pm
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+import random
+import pytest
+from rapidfuzz import fuzz
+from fuzzy_types.fuzzy import FuzzyDict
+from fuzzy_types.matcher import Matcher
+from fuzzy_types.sharded import ShardPool, ShardedFuzzyDict
+from fuzzy_types.utils import AmbiguousMatchError, get_best_two
+from benchmarks.vocab import make_typo, synthetic_words
+
+
+words = synthetic_words(500)
+
+
+def outcome(func, value):
+    """ the result of a lookup, or the type of its error """
+    try:
+        return func(value)
+    except ValueError as error:
+        return type(error)
+
+
+@pytest.fixture()
+def sharded(monkeypatch):
+    """ Shards any dictionary, however small """
+    monkeypatch.setattr(ShardedFuzzyDict, 'min_choices', 0)
+
+
+class TestShardPool(object):
+
+    def test_matches_best_two(self):
+        rng = random.Random(5)
+        choices = words + ['grape1', 'grape2', words[0]]
+        values = [make_typo(word, rng) for word in rng.choices(choices, k=50)] + ['grape']
+        with ShardPool(choices, shards=3) as pool:
+            assert pool.shards == 3
+            for scorer in (fuzz.WRatio, fuzz.ratio):
+                expected = [get_best_two(value, choices, scorer=scorer, score_cutoff=75)
+                            for value in values]
+                assert [pool.best_two(value, scorer=scorer, score_cutoff=75)
+                        for value in values] == expected
+                assert pool.best_two_many(values, scorer=scorer, score_cutoff=75) == expected
+        assert pool.closed
+        with pytest.raises(RuntimeError, match='closed'):
+            pool.best_two('apple', scorer=fuzz.WRatio, score_cutoff=75)
+
+    def test_more_shards_than_choices(self):
+        with ShardPool(['apple', 'pear'], shards=4) as pool:
+            assert pool.shards == 2
+            assert pool.best_two('paer', scorer=fuzz.WRatio, score_cutoff=75) == \
+                [('pear', 75.0, 1)]
+
+    def test_worker_error(self):
+        with ShardPool(words, shards=2) as pool:
+            with pytest.raises(TypeError):
+                pool.best_two('apple', scorer=fuzz.WRatio, score_cutoff=75, limit=3)
+            # the workers keep serving after an error
+            assert pool.best_two(words[7], scorer=fuzz.ratio, score_cutoff=75)[0][2] == 7
+
+
+class TestShardedFuzzyDict(object):
+
+    def test_same_as_fuzzydict(self, sharded):
+        data = dict.fromkeys(words + ['grape1', 'grape2'], 1)
+        rng = random.Random(9)
+        values = [make_typo(word, rng) for word in rng.choices(words, k=40)] + ['grape']
+        expected = FuzzyDict(data)
+        with ShardedFuzzyDict(data, shards=3) as dd:
+            assert [outcome(dd.__getitem__, value) for value in values] == \
+                [outcome(expected.__getitem__, value) for value in values]
+            assert dd.match_many(values + ['zz'], errors='none') == \
+                expected.match_many(values + ['zz'], errors='none')
+            with pytest.raises(AmbiguousMatchError):
+                dd['grape']
+            assert dd.pool.shards == 3
+            pool = dd.pool
+        assert pool.closed
+
+    def test_mutation_restarts_pool(self, sharded):
+        dd = ShardedFuzzyDict({'apple': 1, 'banana': 2, 'pear': 3}, shards=2)
+        assert dd['bannna'] == 2
+        pool = dd.pool
+        dd['orange'] = 4
+        assert pool.closed
+        assert dd['ornge'] == 4
+        assert dd.pool is not pool
+        assert dd.copy()._shards == 2
+        dd.close()
+        assert dd._pool is None
+
+    def test_snapshot(self, sharded):
+        with ShardedFuzzyDict({'apple': 1, 'banana': 2, 'pear': 3}, shards=2) as dd:
+            index = dd._choice_index
+            dd['orange'] = 4
+            # a lookup started before the change scores the choices of its snapshot
+            missing, match = dd._match_many(['ornge', 'bannna'], 'none', -1, index)
+            assert missing is None
+            assert match.choice == 'banana'
+            assert dd._pool_index is index
+            assert dd['ornge'] == 4
+            assert dd._pool_index is dd._choice_index
+
+            # a best choice missing from the snapshot is not matched
+            index = dd._choice_index
+            index.exact = lambda value, key=None, ties='raise': None
+            assert dd._match_many(['bannna'], 'none', -1, index) == [None]
+
+    def test_matcher_settings(self, sharded):
+        matcher = Matcher(ties='first', min_score=85)
+        with ShardedFuzzyDict({'grape1': 1, 'grape2': 2, 'pear': 3}, shards=2,
+                              use_fuzzy=matcher) as dd:
+            assert dd['grape'] == 1
+            with pytest.raises(AssertionError, match='at least 3 characters'):
+                dd['gr']
+            with pytest.raises(ValueError):
+                dd['paer']
+        with pytest.raises(AssertionError, match='Matcher'):
+            ShardedFuzzyDict({'pear': 1}, use_fuzzy=lambda value, choices: choices[0])
+
+    def test_small_in_process(self):
+        with ShardedFuzzyDict({'apple': 1, 'pear': 2}) as dd:
+            assert dd['aple'] == 1
+            assert dd._pool is None
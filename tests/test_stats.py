@@ -0,0 +1,153 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: test_stats.py
+# Project: tests
+# Author: Brian Cherinka
+# Created: Friday, 16th October 2026 6:12:40 pm
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Friday, 16th October 2026 6:12:40 pm
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+import pytest
+from fuzzy_types import stats
+from fuzzy_types.fuzzy import FuzzyDict, FuzzyList
+from fuzzy_types.index import Prefilter
+from fuzzy_types.stats import BUCKETS, MatchStats
+from fuzzy_types.utils import AmbiguousMatchError, get_best_fuzzy, get_best_fuzzy_many
+
+
+items = ['apple', 'banana', 'orange', 'pear', 'grape1', 'grape2']
+
+
+def lookup_all(fuzzy):
+    assert fuzzy['apple'] == 'apple'
+    assert fuzzy['bannaa'] == 'banana'
+    with pytest.raises(AmbiguousMatchError):
+        fuzzy['grape']
+    with pytest.raises(ValueError):
+        fuzzy['mandarin']
+    with pytest.raises(AssertionError):
+        fuzzy['ap']
+
+
+class TestMatchStats(object):
+
+    def test_disabled(self):
+        ll = FuzzyList(items)
+        assert ll.stats() is None
+        ll.reset_stats()
+
+    def test_outcomes(self):
+        ll = FuzzyList(items, instrument=True)
+        lookup_all(ll)
+        snap = ll.stats()
+        assert snap['lookups'] == 5
+        assert {outcome: counts['count'] for outcome, counts in snap['outcomes'].items()} == \
+            {'exact': 1, 'fuzzy': 1, 'ambiguous': 1, 'miss': 1, 'invalid': 1}
+        for counts in snap['outcomes'].values():
+            assert sum(counts['histogram']) == counts['count']
+            assert len(counts['histogram']) == len(BUCKETS) + 1
+            assert counts['seconds'] > 0
+        assert snap['candidates'] == {'total': 24, 'max': 6, 'mean': 24 / 5}
+        assert snap['cache']['hit_rate'] == 0.0
+
+        ll.reset_stats()
+        assert ll.stats()['lookups'] == 0
+        assert ll.stats()['outcomes']['fuzzy']['histogram'] == [0] * (len(BUCKETS) + 1)
+
+    def test_cache_and_sinks(self):
+        events = []
+        shared = MatchStats(sinks=[events.append], source='fruits')
+        dd = FuzzyDict({'fruits': {item: i for i, item in enumerate(items)}}, cache_size=10,
+                       instrument=shared)
+        assert dd['fruts']['bannaa'] == 1
+        assert dd['fruits']['bannaa'] == 1
+        assert 'bannaa' in dd['fruits']
+
+        assert [event.outcome for event in events] == ['fuzzy', 'fuzzy', 'exact', 'fuzzy',
+                                                       'exact', 'fuzzy']
+        assert [event.cached for event in events] == [False, False, None, True, None, True]
+        assert events[0].source == 'fruits'
+        assert events[0].value == 'fruts'
+        assert shared.snapshot()['cache'] == {'hits': 2, 'misses': 2, 'hit_rate': 0.5}
+
+        shared.remove_sink(events.append)
+        dd['fruits']['apple']
+        assert len(events) == 6
+        assert shared.lookups == 8
+
+    def test_batch(self):
+        events = []
+        ll = FuzzyList(items, instrument=MatchStats(sinks=[events.append]))
+        ll.match_many(['apple', 'bannaa', 'grape'], errors='none')
+        snap = ll.stats()
+        assert snap['lookups'] == 0
+        assert snap['batches']['calls'] == 1
+        assert snap['batches']['values'] == 3
+        assert events[0].outcome == 'batch'
+
+    def test_prefilter(self, monkeypatch):
+        monkeypatch.setattr(Prefilter, 'min_choices', 0)
+        ll = FuzzyList(items + ['a' * 50], instrument=True)
+        assert ll['appel'] == 'apple'
+        assert ll['bannaa'] == 'banana'
+        assert ll.stats()['prefilter'] == \
+            {'scanned': 14, 'pruned': 2, 'pruned_fraction': 2 / 14}
+        unfiltered = FuzzyList(items, instrument=True, prefilter=False)
+        assert unfiltered['appel'] == 'apple'
+        assert unfiltered.stats()['prefilter']['scanned'] == 0
+
+        ll.reset_stats()
+        assert ll.stats()['prefilter'] == {'scanned': 0, 'pruned': 0, 'pruned_fraction': 0.0}
+
+    def test_copy_shares_stats(self):
+        ll = FuzzyList(items, instrument=True)
+        kopy = ll.copy()
+        kopy['apple']
+        assert ll.stats()['lookups'] == 1
+
+
+class TestFunctionStats(object):
+
+    @pytest.fixture()
+    def recorder(self):
+        yield stats.instrument()
+        stats.instrument(False)
+
+    def test_disabled(self):
+        assert stats.stats() is None
+        stats.reset_stats()
+
+    def test_get_best_fuzzy(self, recorder):
+        events = []
+        recorder.add_sink(events.append)
+        assert get_best_fuzzy('pear', items) == 'pear'
+        assert get_best_fuzzy('bannaa', items) == 'banana'
+        with pytest.raises(AmbiguousMatchError):
+            get_best_fuzzy('grape', items)
+        snap = stats.stats()
+        assert snap['lookups'] == 3
+        assert snap['outcomes']['exact']['count'] == 1
+        assert snap['outcomes']['ambiguous']['count'] == 1
+        assert snap['candidates']['total'] == 18
+        assert events[1].source == 'get_best_fuzzy'
+
+        stats.reset_stats()
+        assert stats.stats()['lookups'] == 0
+
+    def test_fuzzy_object(self, recorder):
+        ll = FuzzyList(items, instrument=True)
+        ll['bannaa']
+        ll['apple']
+        assert stats.stats()['lookups'] == 1
+        assert ll.stats()['lookups'] == 2
+
+
+def test_ambiguous_many():
+    matches = get_best_fuzzy_many(['grape', 'mandarin'], items, errors='marker')
+    assert isinstance(matches[0], AmbiguousMatchError)
+    assert type(matches[1]) is ValueError
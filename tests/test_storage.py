@@ -0,0 +1,114 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: test_storage.py
+# Project: tests
+# Author: Brian Cherinka
+# Created: Friday, 16th October 2026 4:52:18 pm
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Friday, 16th October 2026 4:52:18 pm
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+import pytest
+from fuzzy_types.fuzzy import FuzzyDict, FuzzyList, FuzzyOrderedDict
+from fuzzy_types.storage import IndexFileError, load_index
+
+
+real = {'apple': 1, 'banana': 2, 'orange': 3, 'pear': 4}
+
+
+class FuzzyLower(FuzzyList):
+    """ custom fuzzy list with lowercase choices """
+    @staticmethod
+    def mapper(item):
+        return item.lower()
+
+
+@pytest.fixture()
+def path(tmp_path):
+    return tmp_path / 'fruit.fzi'
+
+
+class TestStorage(object):
+
+    @pytest.mark.parametrize('kls', [FuzzyDict, FuzzyOrderedDict], ids=['fuzzy', 'fuzzyord'])
+    def test_dict(self, path, kls):
+        kls(real).save_index(path)
+        fd = kls.from_index(path, store=real)
+        assert fd == real
+        assert isinstance(fd, kls)
+        assert fd['appl'] == 1
+        assert fd.choices == ['apple', 'banana', 'orange', 'pear']
+        assert kls.from_index(path)['paer'] is None
+
+    def test_list(self, path):
+        fl = FuzzyLower(['Apple', 'Banana', 'Orange', 'Pear'], ngram_candidates=2)
+        assert fl['appl'] == 'Apple'
+        fl.save_index(path)
+
+        loaded = FuzzyLower.from_index(path, ngram_candidates=2)
+        assert loaded == fl
+        assert loaded.choices == ['apple', 'banana', 'orange', 'pear']
+        index = loaded._choice_index
+        assert index.ngrams.shortlist('appl', 2) == ['apple']
+        assert index.prefilter.lengths.tolist() == [5, 6, 6, 4]
+        assert loaded['bannaa'] == 'Banana'
+
+        # the loaded object is still mutable
+        loaded.append('Mandarin')
+        assert loaded['mandarn'] == 'Mandarin'
+
+    def test_updated(self, path, tmp_path):
+        FuzzyDict(real, ngram_candidates=2).save_index(path)
+        loaded = FuzzyDict.from_index(path, store=real, ngram_candidates=2)
+        # updated in place over the memory-mapped arrays, then saved compacted
+        del loaded['banana']
+        loaded['mandarin'] = 5
+        assert loaded['mandarn'] == 5
+        assert loaded._choice_index.dead == 1
+        other = tmp_path / 'other.idx'
+        loaded.save_index(other)
+        again = FuzzyDict.from_index(other, store=loaded)
+        assert again.choices == ['apple', 'orange', 'pear', 'mandarin']
+        assert again._choice_index.ngrams.shortlist('mandarn', 1) == ['mandarin']
+
+    def test_fingerprint(self, path):
+        FuzzyDict(real).save_index(path, fingerprint='abc')
+        assert load_index(path, fingerprint='abc').meta['fingerprint'] == 'abc'
+        with pytest.raises(IndexFileError, match='other data'):
+            load_index(path, fingerprint='xyz')
+
+    def test_wrong_class(self, path):
+        FuzzyList(list(real)).save_index(path)
+        with pytest.raises(IndexFileError, match='not a fuzzy dict'):
+            FuzzyDict.from_index(path)
+        with pytest.raises(IndexFileError, match='mapper'):
+            FuzzyLower.from_index(path)
+
+    def test_corrupt(self, path):
+        FuzzyDict(real).save_index(path)
+        data = bytearray(path.read_bytes())
+        data[-3] ^= 0xff
+        path.write_bytes(bytes(data))
+        with pytest.raises(IndexFileError, match='checksum'):
+            load_index(path)
+
+    def test_version(self, path):
+        FuzzyDict(real).save_index(path)
+        data = bytearray(path.read_bytes())
+        data[8] = 99
+        path.write_bytes(bytes(data))
+        with pytest.raises(IndexFileError, match='version 99'):
+            load_index(path)
+
+    def test_not_index(self, path):
+        path.write_text('apple\nbanana\n')
+        with pytest.raises(IndexFileError, match='not a fuzzy index'):
+            load_index(path)
+
+    def test_string_keys(self, path):
+        with pytest.raises(AssertionError):
+            FuzzyDict({1: 'one'}).save_index(path)
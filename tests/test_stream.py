@@ -0,0 +1,104 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: test_stream.py
+# Project: tests
+# Author: Brian Cherinka
+# Created: Saturday, 17th October 2026 12:21:09 am
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Saturday, 17th October 2026 12:21:09 am
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+import itertools
+import random
+import pytest
+from fuzzy_types.fuzzy import FuzzyDict, FuzzyList
+from fuzzy_types.stream import Record, iter_batches, match_stream
+from benchmarks.vocab import make_typo, synthetic_words
+
+
+@pytest.fixture(scope='module')
+def words():
+    return synthetic_words(300, seed=3)
+
+
+@pytest.fixture(scope='module')
+def typos(words):
+    rng = random.Random(3)
+    return [make_typo(word, rng) for word in rng.choices(words, k=100)] + ['zzz']
+
+
+def expected(fuzzy, values):
+    matches = fuzzy.match_many(values, errors='none')
+    return [Record(value, None, None, None) if match is None else
+            Record(value, match.choice, match.score, fuzzy.get_many([value])[0])
+            for value, match in zip(values, matches)]
+
+
+class TestBatches(object):
+
+    @pytest.mark.parametrize('size', [1, 3, 10, 11])
+    def test_batches(self, size):
+        batches = list(iter_batches(range(10), size))
+        assert list(itertools.chain(*batches)) == list(range(10))
+        assert all(len(batch) == size for batch in batches[:-1])
+        assert 0 < len(batches[-1]) <= size
+
+
+class TestStream(object):
+
+    @pytest.mark.parametrize('batch_size', [1, 7, 1024])
+    def test_iterable(self, words, typos, batch_size):
+        fuzzy = FuzzyList(words)
+        records = list(fuzzy.match_stream(iter(typos), batch_size=batch_size))
+        assert records == expected(fuzzy, typos)
+        assert records[-1] == Record('zzz', None, None, None)
+
+    def test_dict(self):
+        fuzzy = FuzzyDict({'apple': 1, 'banana': 2})
+        assert list(fuzzy.match_stream(['appel', 'banan'])) == [
+            Record('appel', 'apple', pytest.approx(80), 1),
+            Record('banan', 'banana', pytest.approx(90.9, abs=0.1), 2)]
+
+    def test_file(self, words, typos, tmp_path):
+        path = tmp_path / 'values.txt'
+        path.write_text('\r\n'.join(typos) + '\r\n', encoding='utf-8')
+        fuzzy = FuzzyList(words)
+        assert list(match_stream(fuzzy, path, batch_size=16)) == expected(fuzzy, typos)
+        assert list(match_stream(fuzzy, str(path))) == expected(fuzzy, typos)
+
+    def test_bounded(self, words):
+        # an endless stream is only read a batch at a time
+        consumed = []
+
+        def endless():
+            for i in itertools.count():
+                consumed.append(i)
+                yield words[i % len(words)]
+
+        records = match_stream(FuzzyList(words), endless(), batch_size=10)
+        assert [record.match for record in itertools.islice(records, 25)] == words[:25]
+        assert len(consumed) == 30
+
+    def test_errors(self):
+        fuzzy = FuzzyList(['apple', 'banana'])
+        record = next(fuzzy.match_stream(['zzz'], errors='marker'))
+        assert isinstance(record.match, ValueError)
+        with pytest.raises(ValueError, match='Cannot find a good match'):
+            list(fuzzy.match_stream(['apple', 'zzz'], errors='raise'))
+
+    @pytest.mark.parametrize('processes', [1, 2])
+    def test_processes(self, words, typos, processes):
+        fuzzy = FuzzyDict({word: i for i, word in enumerate(words)})
+        records = list(fuzzy.match_stream(typos, batch_size=8, processes=processes))
+        assert records == expected(fuzzy, typos)
+
+    def test_processes_closed(self, words):
+        # stopping early cancels the pending batches
+        records = match_stream(FuzzyList(words), itertools.cycle(words), batch_size=5,
+                               processes=1)
+        assert next(records).match == words[0]
+        records.close()
@@ -0,0 +1,97 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Filename: test_utils.py
+# Project: tests
+# Author: Brian Cherinka
+# Created: Friday, 16th October 2026 11:20:51 am
+# License: BSD 3-clause "New" or "Revised" License
+# Copyright (c) 2020 Brian Cherinka
+# Last Modified: Friday, 16th October 2026 11:20:51 am
+# Modified By: Brian Cherinka
+
+
+from __future__ import print_function, division, absolute_import
+import random
+import pytest
+from rapidfuzz import fuzz, process
+from fuzzy_types.utils import Match, get_best_fuzzy, get_best_fuzzy_many, get_best_two
+
+
+def decision(bests):
+    """ the best score, and whether it is tied """
+    if not bests:
+        return None
+    return bests[0][1], len(bests) > 1 and bests[0][1] == bests[1][1]
+
+
+class TestBestTwo(object):
+
+    @pytest.mark.parametrize('scorer', [fuzz.WRatio, fuzz.ratio, fuzz.token_sort_ratio,
+                                        fuzz.partial_ratio],
+                             ids=['wratio', 'ratio', 'tokensort', 'partial'])
+    def test_matches_extract(self, scorer):
+        rng = random.Random(7)
+        for __ in range(300):
+            choices = [''.join(rng.choices('abcde ', k=rng.randint(2, 8))) for __ in range(40)]
+            value = rng.choice(choices) if rng.random() < 0.5 else \
+                ''.join(rng.choices('abcde', k=4))
+            full = process.extract(value, choices, scorer=scorer, score_cutoff=60, limit=None)
+            two = get_best_two(value, choices, scorer=scorer, score_cutoff=60, chunk_size=7)
+            assert decision(full) == decision(two)
+            if full and not decision(full)[1]:
+                assert full[0][0] == two[0][0]
+
+    def test_perfect_tie(self):
+        choices = ['apple', 'pear', 'banana', 'apple']
+        bests = get_best_two('apple', choices, chunk_size=2)
+        assert bests == [('apple', 100, 0), ('apple', 100, 3)]
+
+    def test_mapping(self):
+        bests = get_best_two('appl', {'a': 'apple', 'b': 'pear'}, score_cutoff=75)
+        assert bests[0][0] == 'apple'
+        assert bests[0][2] == 'a'
+
+
+class TestBestFuzzy(object):
+
+    def test_best(self):
+        assert get_best_fuzzy('appl', ['apple', 'pear']) == 'apple'
+        best, score, idx = get_best_fuzzy('paer', ['apple', 'pear'], return_score=True)
+        assert best == 'pear'
+        assert idx == 1
+
+    def test_ambiguous(self):
+        with pytest.raises(ValueError) as cm:
+            get_best_fuzzy('apple', ['apple', 'pear', 'apple'])
+        assert "Cannot find a good match for 'apple'" in str(cm.value)
+
+
+class TestBestFuzzyMany(object):
+    choices = ['apple', 'banana', 'orange', 'pear', 'pears']
+
+    def test_matches_single(self):
+        values = ['appl', 'bannaa', 'oragne', 'pear', 'mandarin', 'pea']
+        matches = get_best_fuzzy_many(values, self.choices, errors='none')
+        for value, match in zip(values, matches):
+            try:
+                best = get_best_fuzzy(value, self.choices, return_score=True)
+            except ValueError:
+                assert match is None
+            else:
+                assert match == Match(*best)
+
+    def test_single_choice(self):
+        matches = get_best_fuzzy_many(['appl', 'kiwi'], ['apple'], errors='none')
+        assert matches == [Match('apple', pytest.approx(88.9, abs=0.1), 0), None]
+
+    def test_errors(self):
+        values = ['appl', 'mandarin', 'ap']
+        with pytest.raises(ValueError):
+            get_best_fuzzy_many(values[:2], self.choices)
+        with pytest.raises(AssertionError):
+            get_best_fuzzy_many(['ap'], self.choices)
+        matches = get_best_fuzzy_many(values, self.choices, errors='marker')
+        assert matches[0].choice == 'apple'
+        assert isinstance(matches[1], ValueError)
+        assert isinstance(matches[2], AssertionError)